@@ -6,7 +6,9 @@ from Entity.Account import Account
 from Entity.User import User
 from Entity.Company import Company
 from Utils.UploadDocUtil import rename_file
+from Security.SessionCache import publish_session
 from typing import Optional
+from sqlalchemy import update
 from sqlalchemy.orm import joinedload
 import traceback
 
@@ -42,6 +44,57 @@ class AccountMapper:
             elif account.role == Role.Admin:
                 return account_data  # Already an Account entity
 
+    @staticmethod
+    def getSessionState(accountId: int) -> Optional[dict]:
+        """
+        Session-relevant columns only, no joins or entity construction.
+        :return: {"accountId", "sessionId", "isDisabled"} or None.
+        """
+        with db_context.session_scope() as session:
+            row = (
+                session.query(
+                    AccountModel.accountId,
+                    AccountModel.sessionId,
+                    AccountModel.isDisabled,
+                )
+                .filter(AccountModel.accountId == accountId)
+                .first()
+            )
+            if not row:
+                return None
+            return {
+                "accountId": row.accountId,
+                "sessionId": row.sessionId,
+                "isDisabled": bool(row.isDisabled),
+            }
+
+    @staticmethod
+    def getSessionStates(accountIds: list[int]) -> dict[int, dict]:
+        """
+        Batch variant of getSessionState for admin tooling.
+        :return: Mapping of accountId to its session state; unknown ids are omitted.
+        """
+        if not accountIds:
+            return {}
+        with db_context.session_scope() as session:
+            rows = (
+                session.query(
+                    AccountModel.accountId,
+                    AccountModel.sessionId,
+                    AccountModel.isDisabled,
+                )
+                .filter(AccountModel.accountId.in_(set(accountIds)))
+                .all()
+            )
+            return {
+                row.accountId: {
+                    "accountId": row.accountId,
+                    "sessionId": row.sessionId,
+                    "isDisabled": bool(row.isDisabled),
+                }
+                for row in rows
+            }
+
     @staticmethod
     def getAccountByEmail(email) -> Optional[Account]:
         with db_context.session_scope() as session:
@@ -192,8 +245,14 @@ class AccountMapper:
                     return False
 
                 accountModel.isDisabled = True
+                state = {
+                    "accountId": accountId,
+                    "sessionId": accountModel.sessionId,
+                    "isDisabled": True,
+                }
 
                 session.commit()
+                publish_session(accountId, state)
                 return True
 
         except Exception as e:
@@ -201,6 +260,30 @@ class AccountMapper:
             traceback.print_exc()
             return False
 
+    @staticmethod
+    def updatePasswordHash(accountId: int, oldHash: str, newHash: str) -> bool:
+        """
+        Replace the stored hash only if it is still `oldHash`, so a
+        background rehash can't undo a password change made meanwhile.
+        """
+        try:
+            with db_context.session_scope() as session:
+                result = session.execute(
+                    update(AccountModel)
+                    .where(
+                        AccountModel.accountId == accountId,
+                        AccountModel.passwordHash == oldHash,
+                    )
+                    .values(passwordHash=newHash)
+                )
+                session.commit()
+                return result.rowcount == 1
+
+        except Exception as e:
+            print(f"Error updating password hash: {e}")
+            traceback.print_exc()
+            return False
+
     @staticmethod
     def setTwoFa(acc_id: int, secret: str, enabled: bool):
         try:
@@ -233,8 +316,14 @@ class AccountMapper:
                     return False
 
                 account.sessionId = session_id
+                state = {
+                    "accountId": acc_id,
+                    "sessionId": session_id,
+                    "isDisabled": bool(account.isDisabled),
+                }
 
                 session.commit()
+                publish_session(acc_id, state)
                 return True
 
         except Exception as e:
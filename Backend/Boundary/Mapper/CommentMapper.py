@@ -1,6 +1,9 @@
+from sqlalchemy import select, update
 from SQLModels.base import db_context
 from SQLModels.CommentModel import CommentModel
+from SQLModels.PostModel import PostModel
 from Entity.Comment import Comment
+from Boundary.Mapper.PostMapper import PostMapper
 
 
 class CommentMapper:
@@ -8,6 +11,17 @@ class CommentMapper:
     Mapper class for Comment objects.
     """
 
+    @staticmethod
+    def _bumpCommentCount(session, postId: int, delta: int) -> None:
+        """
+        Adjust Post.commentCount in the caller's transaction.
+        """
+        session.execute(
+            update(PostModel)
+            .where(PostModel.postId == postId)
+            .values(commentCount=PostModel.commentCount + delta)
+        )
+
     @staticmethod
     def createComment(comment: Comment) -> Comment:
         """
@@ -24,9 +38,12 @@ class CommentMapper:
             # )
             comment_model = comment.toCommentModel()
             session.add(comment_model)
+            CommentMapper._bumpCommentCount(session, comment_model.postId, 1)
             session.commit()
             # Return the created Comment entity
-            return Comment.from_CommentModel(comment_model)
+            created = Comment.from_CommentModel(comment_model)
+        PostMapper.invalidatePosts(created.postId)
+        return created
 
     @staticmethod
     def deleteComment(commentId: int) -> bool:
@@ -36,17 +53,32 @@ class CommentMapper:
         """
 
         with db_context.session_scope() as session:
-            comment_model = (
-                session.query(CommentModel)
-                .filter(CommentModel.commentId == commentId)
-                .first()
+            # flip the flag only if it isn't already set, so the post's
+            # counter is decremented exactly once per comment
+            result = session.execute(
+                update(CommentModel)
+                .where(
+                    CommentModel.commentId == commentId, CommentModel.isDeleted == 0
+                )
+                .values(isDeleted=1)
             )
-            if comment_model:
-                comment_model.isDeleted = True
-                session.commit()
-                return True
+            if result.rowcount:
+                postId = session.execute(
+                    select(CommentModel.postId).where(
+                        CommentModel.commentId == commentId
+                    )
+                ).scalar_one()
+                CommentMapper._bumpCommentCount(session, postId, -1)
             else:
-                return False
+                # already deleted comments still count as found
+                return (
+                    session.query(CommentModel.commentId)
+                    .filter(CommentModel.commentId == commentId)
+                    .first()
+                    is not None
+                )
+        PostMapper.invalidatePosts(postId)
+        return True
 
     @staticmethod
     def getCommentById(commentId: int) -> Comment | None:
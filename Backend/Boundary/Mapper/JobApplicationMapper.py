@@ -1,10 +1,14 @@
 from datetime import datetime
+from typing import Any, Dict, Optional
 from SQLModels.UserModel import UserModel
+from SQLModels.AccountModel import AccountModel
 from SQLModels.JobListingModel import JobListingModel
 from Entity.JobApplication import JobApplication, Status
 from SQLModels.JobApplicationModel import JobApplicationModel
 from SQLModels.base import db_context
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import contains_eager
+from Utils.CursorUtils import decode_cursor, encode_cursor
 
 
 class JobApplicationMapper:
@@ -64,45 +68,132 @@ class JobApplicationMapper:
                 return True
             return False
 
+    @staticmethod
+    def _companyApplications(session, companyId: int, clauses=()):
+        """
+        Applications for the company's jobs joined to applicant user and
+        account, which are populated from the same row.
+        """
+        return (
+            session.query(JobApplicationModel)
+            .join(JobListingModel, JobApplicationModel.jobListing)
+            .join(UserModel, JobApplicationModel.user)
+            .join(AccountModel, UserModel.account)
+            .options(
+                contains_eager(JobApplicationModel.user).contains_eager(
+                    UserModel.account
+                )
+            )
+            .filter(JobListingModel.companyId == companyId, *clauses)
+        )
+
+    @staticmethod
+    def _applicantClauses(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        WHERE clauses for searchCompanyApplications, keyed by filter name
+        so the status counts can leave out the status filter.
+        """
+        clauses = {}
+        if filters.get("status"):
+            clauses["status"] = JobApplicationModel.status.in_(filters["status"])
+        if filters.get("jobId") is not None:
+            clauses["jobId"] = JobApplicationModel.jobId == filters["jobId"]
+        if filters.get("appliedFrom") is not None:
+            clauses["appliedFrom"] = (
+                JobApplicationModel.appliedAt >= filters["appliedFrom"]
+            )
+        if filters.get("appliedTo") is not None:
+            clauses["appliedTo"] = JobApplicationModel.appliedAt <= filters["appliedTo"]
+        if filters.get("name"):
+            clauses["name"] = AccountModel.name.ilike(f"%{filters['name']}%")
+        return clauses
+
     @staticmethod
     def getApplicationsByCompanyId(companyId: int):
         """
         Retrieves all applications for jobs that belong to the given company.
         :param companyId: ID of the company to retrieve applications for.
-        :return: List of JobApplicationModel instances.
+        :return: List of JobApplication entities.
         """
-        with db_context.session_scope() as session:
-            # 1. Get all job IDs belonging to this company
-            job_ids = (
-                session.query(JobListingModel.jobId)
-                .filter(JobListingModel.companyId == companyId)
+        with db_context.session_scope(readonly=True) as session:
+            applications = (
+                JobApplicationMapper._companyApplications(session, companyId)
+                .order_by(
+                    JobApplicationModel.appliedAt.desc(),
+                    JobApplicationModel.applicationId.desc(),
+                )
                 .all()
             )
-            # job_ids is a list of 1-tuples: [(1,), (2,), ...], so flatten:
-            job_ids = [jid for (jid,) in job_ids]
-            if not job_ids:
-                return []
-            print(
-                f"Retrieved {len(job_ids)} job IDs for company \
-                  {companyId}: {job_ids}"
+            return [JobApplication.from_model(a) for a in applications]
+
+    @staticmethod
+    def searchCompanyApplications(
+        companyId: int,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        pageSize: int = 20,
+        includeCounts: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        One page of applications across the company's jobs, newest first,
+        keyed on (appliedAt, applicationId). Filters: status (list),
+        jobId, appliedFrom, appliedTo, name (applicant name substring).
+        `includeCounts` adds per-status totals under every filter except
+        status. Raises ValueError for a malformed cursor.
+        """
+        clauses = JobApplicationMapper._applicantClauses(filters or {})
+
+        with db_context.session_scope(readonly=True) as session:
+            query = JobApplicationMapper._companyApplications(
+                session, companyId, clauses.values()
             )
-            # 2. Get all applications where jobId is in that list
-            applications = (
-                session.query(JobApplicationModel)
-                .options(
-                    selectinload(JobApplicationModel.user).selectinload(
-                        UserModel.account
+            if cursor:
+                lastAppliedAt, lastId = decode_cursor(cursor, (datetime, int))
+                query = query.filter(
+                    or_(
+                        JobApplicationModel.appliedAt < lastAppliedAt,
+                        and_(
+                            JobApplicationModel.appliedAt == lastAppliedAt,
+                            JobApplicationModel.applicationId < lastId,
+                        ),
                     )
                 )
-                .filter(JobApplicationModel.jobId.in_(job_ids))
+
+            rows = (
+                query.order_by(
+                    JobApplicationModel.appliedAt.desc(),
+                    JobApplicationModel.applicationId.desc(),
+                )
+                .limit(pageSize + 1)
                 .all()
             )
-            print(
-                f"Retrieved {len(applications)} applications for company \
-                  {companyId} with job IDs {job_ids}"
-            )
-            print(f"Applications: {applications}")
-            return [JobApplication.from_model(a) for a in applications]
+            hasMore = len(rows) > pageSize
+            rows = rows[:pageSize]
+
+            result = {
+                "applications": [JobApplication.from_model(a).to_dict() for a in rows],
+                "nextCursor": (
+                    encode_cursor([rows[-1].appliedAt, rows[-1].applicationId])
+                    if hasMore
+                    else None
+                ),
+                "hasMore": hasMore,
+                "pageSize": pageSize,
+            }
+            if includeCounts:
+                others = [c for name, c in clauses.items() if name != "status"]
+                counts = session.execute(
+                    select(JobApplicationModel.status, func.count())
+                    .join(JobListingModel, JobApplicationModel.jobListing)
+                    .join(UserModel, JobApplicationModel.user)
+                    .join(AccountModel, UserModel.account)
+                    .where(JobListingModel.companyId == companyId, *others)
+                    .group_by(JobApplicationModel.status)
+                ).all()
+                byStatus = {s.value: 0 for s in Status}
+                byStatus.update({s.value: n for s, n in counts})
+                result["statusCounts"] = byStatus
+            return result
 
     @staticmethod
     def getAppliedJobIds(userId: int) -> list[int]:
@@ -111,7 +202,7 @@ class JobApplicationMapper:
         :param userId: ID of the user.
         :return: List of job IDs.
         """
-        with db_context.session_scope() as session:
+        with db_context.session_scope(readonly=True) as session:
             job_ids = (
                 session.query(JobApplicationModel.jobId)
                 .filter(JobApplicationModel.userId == userId)
@@ -129,7 +220,7 @@ class JobApplicationMapper:
         :param limit: Maximum number of applications to retrieve.
         :return: List of JobApplication entities.
         """
-        with db_context.session_scope() as session:
+        with db_context.session_scope(readonly=True) as session:
             applications = (
                 session.query(JobApplicationModel)
                 .filter(JobApplicationModel.userId == userId)
@@ -7,111 +7,201 @@ from Entity.JobListing import JobListing
 from SQLModels.ResponsibilityModel import ResponsibilityModel
 from SQLModels.JobListingModel import JobListingModel
 from SQLModels.base import db_context
-from sqlalchemy import func
+from Boundary.TableDataGateway.FieldOfWorkTDG import FieldOfWorkTDG
+from SQLModels.CompanyModel import CompanyModel
+from sqlalchemy import func, insert, select, or_, and_
+from typing import Any, Dict, Optional
+from datetime import datetime
+from Utils.CursorUtils import encode_cursor, decode_cursor
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload
+
+# applicants embedded in a job detail response per page
+APPLICANT_PAGE_SIZE = 50
+
+# sortBy -> (column, descending); jobId breaks ties in the same direction
+JOB_SORTS = {
+    "newest": (JobListingModel.createdAt, True),
+    "deadline": (JobListingModel.applicationDeadline, False),
+    "salary": (JobListingModel.maxSalary, True),
+}
 
 
 class JobListingMapper:
+    # ─── Loader option sets, one per view. JobListingModel relationships
+    # are lazy="raise", so anything a view serialises must be listed here.
+
+    @staticmethod
+    def _dashboardOptions():
+        """Company dashboard cards: the company is implied by the page."""
+        return (
+            selectinload(JobListingModel.fieldOfWork),
+            selectinload(JobListingModel.responsibilities),
+        )
+
+    @staticmethod
+    def _listOptions():
+        """Job board cards: dashboard fields plus the posting company."""
+        return JobListingMapper._dashboardOptions() + (
+            selectinload(JobListingModel.company).joinedload(CompanyModel.account),
+        )
+
+    @staticmethod
+    def _detailOptions():
+        """
+        Job detail page: list fields joined into a single statement.
+        Applicants are paged separately by _applicantPage.
+        """
+        return (
+            joinedload(JobListingModel.company).joinedload(CompanyModel.account),
+            joinedload(JobListingModel.fieldOfWork),
+            joinedload(JobListingModel.responsibilities),
+        )
+
+    @staticmethod
+    def _numApplicants():
+        """Correlated applicant count, evaluated only for returned rows."""
+        return (
+            select(func.count(JobApplicationModel.applicationId))
+            .where(JobApplicationModel.jobId == JobListingModel.jobId)
+            .scalar_subquery()
+            .label("numApplicants")
+        )
+
     @staticmethod
     def addJob(jobListing: JobListing, company_id: int):
         """
         Adds a new job listing to the database.
+        The listing and its responsibilities go in as one INSERT each; the
+        field of work id comes from the reference data cache.
         :param job_data: dict containing job details.
         """
-        with db_context.session_scope() as session:
+        fieldOfWorkId = FieldOfWorkTDG.getFieldOfWorkId(jobListing.fieldOfWork)
+        if fieldOfWorkId is None:
+            return False
 
-            field: FieldOfWorkModel = (
-                session.query(FieldOfWorkModel)
-                .filter(
-                    func.lower(FieldOfWorkModel.description) == jobListing.fieldOfWork
+        with db_context.session_scope() as session:
+            jobId = session.execute(
+                insert(JobListingModel).values(
+                    companyId=company_id,
+                    title=jobListing.title,
+                    description=jobListing.description,
+                    applicationDeadline=jobListing.applicationDeadline,
+                    experiencePreferred=jobListing.experiencePreferred,
+                    minSalary=jobListing.minSalary,
+                    maxSalary=jobListing.maxSalary,
+                    jobType=jobListing.jobType,
+                    fieldOfWorkId=fieldOfWorkId,
+                    createdAt=jobListing.createdAt,
+                    workArrangement=jobListing.workArrangement,
+                    isDeleted=jobListing.isDeleted,
                 )
-                .first()
-            )
-
-            job_listing_model = JobListingModel(
-                # jobId is auto-increment, don't need to set unless updating
-                companyId=company_id,
-                title=jobListing.title,
-                description=jobListing.description,
-                applicationDeadline=jobListing.applicationDeadline,
-                experiencePreferred=jobListing.experiencePreferred,
-                minSalary=jobListing.minSalary,
-                maxSalary=jobListing.maxSalary,
-                jobType=jobListing.jobType.value,
-                fieldOfWorkId=field.fieldOfWorkId,
-                createdAt=jobListing.createdAt,
-                workArrangement=jobListing.workArrangement.value,
-                isDeleted=jobListing.isDeleted,
-            )
-
-            session.add(job_listing_model)
-            session.flush()
-
-            # Add the responsibilities to the job listing
-            for responsibility in jobListing.responsibilities:
+            ).inserted_primary_key[0]
 
-                responsibility_model = ResponsibilityModel(
-                    responsibility=responsibility, jobId=job_listing_model.jobId
+            if jobListing.responsibilities:
+                session.execute(
+                    insert(ResponsibilityModel),
+                    [
+                        {"jobId": jobId, "responsibility": responsibility}
+                        for responsibility in jobListing.responsibilities
+                    ],
                 )
-                session.add(responsibility_model)
             return True
 
     # @staticmethod
     # def getAllJobListings() -> list["JobListing"]:
 
     @staticmethod
-    def getJobDetails(job_id: int) -> "JobListing":
+    def _applicantPage(
+        session, jobId: int, cursor: Optional[str], pageSize: int
+    ) -> tuple[list, Optional[str]]:
         """
-        Retrieves job details by job_id.
+        One page of a job's applications, newest first, keyed on
+        (appliedAt, applicationId). Returns the models and the cursor of
+        the next page (None on the last page).
         """
-        with db_context.session_scope() as session:
-            job_listing = (
-                session.query(JobListingModel)
-                .options(
-                    selectinload(JobListingModel.company),
-                    selectinload(JobListingModel.fieldOfWork),
-                    selectinload(JobListingModel.responsibilities),
-                    selectinload(JobListingModel.jobApplication)
-                    .selectinload(JobApplicationModel.user)
-                    .selectinload(UserModel.account),
+        query = (
+            session.query(JobApplicationModel)
+            .options(
+                joinedload(JobApplicationModel.user).joinedload(UserModel.account)
+            )
+            .filter(JobApplicationModel.jobId == jobId)
+        )
+        if cursor:
+            lastAppliedAt, lastId = decode_cursor(cursor, (datetime, int))
+            query = query.filter(
+                or_(
+                    JobApplicationModel.appliedAt < lastAppliedAt,
+                    and_(
+                        JobApplicationModel.appliedAt == lastAppliedAt,
+                        JobApplicationModel.applicationId < lastId,
+                    ),
                 )
+            )
+        applications = (
+            query.order_by(
+                JobApplicationModel.appliedAt.desc(),
+                JobApplicationModel.applicationId.desc(),
+            )
+            .limit(pageSize + 1)
+            .all()
+        )
+        if len(applications) <= pageSize:
+            return applications, None
+        applications = applications[:pageSize]
+        last = applications[-1]
+        return applications, encode_cursor([last.appliedAt, last.applicationId])
+
+    @staticmethod
+    def getJobDetails(
+        job_id: int,
+        applicantCursor: Optional[str] = None,
+        applicantPageSize: int = APPLICANT_PAGE_SIZE,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves job details by job_id: the listing with its applicant
+        count in one statement, then one page of applicants.
+        `applicantsNextCursor` fetches the following page.
+        Raises ValueError for a malformed cursor.
+        """
+        with db_context.session_scope(readonly=True) as session:
+            row = (
+                session.query(JobListingModel, JobListingMapper._numApplicants())
+                .options(*JobListingMapper._detailOptions())
                 .filter(JobListingModel.jobId == job_id)
                 .first()
             )
-
-            if not job_listing:
+            if not row:
                 return None
-            numApplicants = (
-                session.query(func.count(JobApplicationModel.applicationId))
-                .filter(JobApplicationModel.jobId == job_id)
-                .scalar()
-            )
+            job_listing, numApplicants = row
 
-            return JobListing.from_JobListingModel(
-                job_listing, numApplicants=numApplicants
+            applications, nextCursor = JobListingMapper._applicantPage(
+                session, job_id, applicantCursor, applicantPageSize
             )
+            details = JobListing.from_JobListingModel(
+                job_listing, numApplicants=numApplicants, applications=applications
+            ).to_dict()
+            details["applicantsNextCursor"] = nextCursor
+            return details
 
     @staticmethod
-    def getAllJobListings(company_id: int = None) -> list["JobListing"]:
+    def getJobOwner(jobId: int) -> Optional[int]:
+        """
+        companyId of the listing, or None if it doesn't exist.
+        For authorization checks that don't need the listing itself.
+        """
         with db_context.session_scope() as session:
+            return session.execute(
+                select(JobListingModel.companyId).where(JobListingModel.jobId == jobId)
+            ).scalar()
+
+    @staticmethod
+    def getAllJobListings(company_id: int = None) -> list["JobListing"]:
+        with db_context.session_scope(readonly=True) as session:
             # Build base query
             base_query = (
-                session.query(
-                    JobListingModel,
-                    func.count(JobApplicationModel.applicationId).label(
-                        "numApplicants"
-                    ),
-                )
-                .outerjoin(
-                    JobApplicationModel,
-                    JobListingModel.jobId == JobApplicationModel.jobId,
-                )
-                .options(
-                    selectinload(JobListingModel.company),
-                    selectinload(JobListingModel.fieldOfWork),
-                )
-                .group_by(JobListingModel.jobId)
+                session.query(JobListingModel, JobListingMapper._numApplicants())
+                .options(*JobListingMapper._listOptions())
                 .filter(JobListingModel.isDeleted == 0)
             )
             if company_id is not None:
@@ -124,6 +214,146 @@ class JobListingMapper:
                 for orm, numApplicants in orm_results
             ]
 
+    @staticmethod
+    def _searchClauses(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        WHERE clauses for searchJobListings, keyed by filter name so facet
+        counts can leave out their own filter.
+        """
+        clauses = {}
+        if filters.get("fieldOfWork"):
+            clauses["fieldOfWork"] = JobListingModel.fieldOfWork.has(
+                func.lower(FieldOfWorkModel.description)
+                == filters["fieldOfWork"].lower()
+            )
+        if filters.get("jobType"):
+            clauses["jobType"] = JobListingModel.jobType.in_(filters["jobType"])
+        if filters.get("workArrangement"):
+            clauses["workArrangement"] = JobListingModel.workArrangement.in_(
+                filters["workArrangement"]
+            )
+        # salary filters match any overlap with the listing's range
+        if filters.get("minSalary") is not None:
+            clauses["minSalary"] = JobListingModel.maxSalary >= filters["minSalary"]
+        if filters.get("maxSalary") is not None:
+            clauses["maxSalary"] = JobListingModel.minSalary <= filters["maxSalary"]
+        if filters.get("deadlineFrom") is not None:
+            clauses["deadlineFrom"] = (
+                JobListingModel.applicationDeadline >= filters["deadlineFrom"]
+            )
+        if filters.get("deadlineTo") is not None:
+            clauses["deadlineTo"] = (
+                JobListingModel.applicationDeadline <= filters["deadlineTo"]
+            )
+        if filters.get("companyId") is not None:
+            clauses["companyId"] = JobListingModel.companyId == filters["companyId"]
+        if filters.get("q"):
+            pattern = f"%{filters['q']}%"
+            clauses["q"] = or_(
+                JobListingModel.title.ilike(pattern),
+                JobListingModel.description.ilike(pattern),
+            )
+        return clauses
+
+    @staticmethod
+    def _searchFacets(session, clauses: Dict[str, Any]) -> Dict[str, Dict]:
+        """
+        Listing counts per job type, work arrangement and field of work.
+        Each facet applies every filter except its own, so the counts show
+        what choosing another value would return.
+        """
+
+        def count_by(column, own, join=None):
+            query = select(column, func.count()).where(
+                JobListingModel.isDeleted == 0,
+                *[c for name, c in clauses.items() if name not in own],
+            )
+            if join is not None:
+                query = query.join_from(JobListingModel, join)
+            rows = session.execute(query.group_by(column)).all()
+            return {getattr(k, "value", k): n for k, n in rows}
+
+        return {
+            "jobType": count_by(JobListingModel.jobType, {"jobType"}),
+            "workArrangement": count_by(
+                JobListingModel.workArrangement, {"workArrangement"}
+            ),
+            "fieldOfWork": count_by(
+                FieldOfWorkModel.description, {"fieldOfWork"}, join=FieldOfWorkModel
+            ),
+        }
+
+    @staticmethod
+    def searchJobListings(
+        filters: Optional[Dict[str, Any]] = None,
+        sortBy: str = "newest",
+        cursor: Optional[str] = None,
+        pageSize: int = 20,
+        includeFacets: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Filtered, keyset-paginated job board query.
+        Results are ordered by the JOB_SORTS column with jobId as a
+        tie-breaker; `cursor` is the nextCursor of the previous page.
+        Applicant counts are computed only for the rows returned.
+        Raises ValueError for an unknown sort or a malformed cursor.
+        """
+        if sortBy not in JOB_SORTS:
+            raise ValueError(f"Unknown sortBy: {sortBy}")
+        sortKey, descending = JOB_SORTS[sortBy]
+        clauses = JobListingMapper._searchClauses(filters or {})
+
+        with db_context.session_scope(readonly=True) as session:
+            query = (
+                session.query(JobListingModel, JobListingMapper._numApplicants())
+                .options(*JobListingMapper._listOptions())
+                .filter(JobListingModel.isDeleted == 0, *clauses.values())
+            )
+
+            if cursor:
+                last, lastId = decode_cursor(
+                    cursor, (sortKey.type.python_type, int)
+                )
+                if descending:
+                    after = or_(
+                        sortKey < last,
+                        and_(sortKey == last, JobListingModel.jobId < lastId),
+                    )
+                else:
+                    after = or_(
+                        sortKey > last,
+                        and_(sortKey == last, JobListingModel.jobId > lastId),
+                    )
+                query = query.filter(after)
+
+            order = (
+                (sortKey.desc(), JobListingModel.jobId.desc())
+                if descending
+                else (sortKey.asc(), JobListingModel.jobId.asc())
+            )
+            rows = query.order_by(*order).limit(pageSize + 1).all()
+            hasMore = len(rows) > pageSize
+            rows = rows[:pageSize]
+
+            result = {
+                "jobs": [
+                    JobListing.from_JobListingModel(orm, numApplicants=count).to_dict()
+                    for orm, count in rows
+                ],
+                "nextCursor": (
+                    encode_cursor(
+                        [getattr(rows[-1][0], sortKey.key), rows[-1][0].jobId]
+                    )
+                    if hasMore
+                    else None
+                ),
+                "hasMore": hasMore,
+                "pageSize": pageSize,
+            }
+            if includeFacets:
+                result["facets"] = JobListingMapper._searchFacets(session, clauses)
+            return result
+
     @staticmethod
     def deleteJob(jobId: int) -> bool:
         """
@@ -145,7 +375,7 @@ class JobListingMapper:
         :param userId: ID of the user to retrieve bookmarked job IDs for.
         :return: List of bookmarked job IDs.
         """
-        with db_context.session_scope() as session:
+        with db_context.session_scope(readonly=True) as session:
             job_ids = (
                 session.query(SavedJobModel.jobListingId).filter_by(userId=userId).all()
             )
@@ -214,9 +444,10 @@ class JobListingMapper:
         Retrieves the latest job listings for a specific company.
         :param company_id: ID of the
         """
-        with db_context.session_scope() as session:
+        with db_context.session_scope(readonly=True) as session:
             job_listings = (
-                session.query(JobListingModel)
+                session.query(JobListingModel, JobListingMapper._numApplicants())
+                .options(*JobListingMapper._dashboardOptions())
                 .filter(
                     JobListingModel.companyId == company_id,
                     JobListingModel.isDeleted == 0,
@@ -225,4 +456,7 @@ class JobListingMapper:
                 .limit(limit)
                 .all()
             )
-            return [JobListing.from_JobListingModel(job) for job in job_listings]
+            return [
+                JobListing.from_JobListingModel(job, numApplicants=count)
+                for job, count in job_listings
+            ]
@@ -1,8 +1,8 @@
 from SQLModels.base import db_context
 from SQLModels.PostModel import PostModel
 from typing import Optional, Dict, Any
-from sqlalchemy.orm import joinedload
-from sqlalchemy import select, func
+from sqlalchemy.orm import joinedload, selectinload, noload
+from sqlalchemy import select, insert, update, delete, func, or_, and_, case
 from SQLModels.AccountModel import AccountModel
 from SQLModels.CommentModel import CommentModel
 from SQLModels.PostLabelModel import PostLabelModel
@@ -11,9 +11,19 @@ from SQLModels.PostViolationModel import PostViolationModel
 from SQLModels.PostLikesModel import PostLikesModel
 from Entity.Post import Post
 from Entity.Label import Label
+from Entity.Comment import Comment
 from Entity.Violation import Violation
+from Utils.CursorUtils import encode_cursor, decode_cursor
+from Utils import CacheUtils
 from math import ceil
 
+# comments shipped with each post in feed-summary mode
+COMMENT_PREVIEW = 3
+
+# cache namespaces; see PostControl for what is cached under them
+FEED_CACHE = "feed"
+POST_CACHE = "post"
+
 
 class PostMapper:
     """
@@ -21,12 +31,190 @@ class PostMapper:
     stateless so it can be used without instantiation.
     """
 
+    @staticmethod
+    def _feedQuery(session, filterLabel: Optional[str] = None):
+        """
+        Base query for the feed: non-deleted posts, optionally by label.
+        """
+        query = session.query(PostModel).filter(PostModel.isDeleted == 0)
+        if filterLabel:
+            query = query.filter(
+                PostModel.postLabels.any(
+                    PostLabelModel.label.has(LabelModel.description == filterLabel)
+                )
+            )
+        return query
+
+    @staticmethod
+    def _feedSortKey(sortBy: Optional[str]):
+        """
+        Column expression the feed is ordered by (descending), or None
+        when no sort is requested.
+        """
+        if sortBy == "Most liked":
+            return PostModel.likeCount
+        if sortBy == "Most Commented":
+            return PostModel.commentCount
+        if sortBy == "Most Recent":
+            return PostModel.date
+        return None
+
+    @staticmethod
+    def _feedLoadOptions(summary: bool = False):
+        """
+        Loader options for feed queries. Collections are loaded with
+        SELECT ... IN so LIMIT applies to posts, not to joined rows.
+        In summary mode comments and likes are not loaded at all;
+        _summarize fills in counts and a comment preview instead.
+        """
+        options = [
+            # Load the associated account
+            joinedload(PostModel.account),
+            # Load associated labels
+            selectinload(PostModel.postLabels).joinedload(PostLabelModel.label),
+            # violations are only recorded on deleted posts
+            noload(PostModel.postViolations),
+        ]
+        if summary:
+            options += [noload(PostModel.comments), noload(PostModel.postLikes)]
+        else:
+            options += [
+                # Load associated comments and their accounts
+                selectinload(PostModel.comments).joinedload(CommentModel.account),
+                selectinload(PostModel.postLikes),  # Load associated likes
+            ]
+        return options
+
+    @staticmethod
+    def _likedPostIds(session, postIds: list[int], viewerId: int) -> set[int]:
+        """
+        Subset of `postIds` the viewer has liked.
+        """
+        if not postIds or viewerId is None:
+            return set()
+        rows = session.execute(
+            select(PostLikesModel.postId).where(
+                PostLikesModel.postId.in_(postIds),
+                PostLikesModel.accountId == viewerId,
+            )
+        )
+        return {postId for (postId,) in rows}
+
+    @staticmethod
+    def _summarize(
+        session,
+        postModels: list[PostModel],
+        viewerId: Optional[int] = None,
+        commentPreview: int = COMMENT_PREVIEW,
+    ) -> list[Post]:
+        """
+        Build feed-summary Post entities for posts loaded with
+        _feedLoadOptions(summary=True): like/comment counts come from the
+        post's counter columns, comments are limited to the first
+        `commentPreview` per post, and likedByViewer is set if a viewer
+        is known. Costs a fixed number of queries regardless of page size.
+        """
+        postIds = [pm.postId for pm in postModels]
+        if not postIds:
+            return []
+
+        previews = {}
+        if commentPreview > 0:
+            rank = (
+                func.row_number()
+                .over(
+                    partition_by=CommentModel.postId,
+                    order_by=(CommentModel.createdAt, CommentModel.commentId),
+                )
+                .label("rank")
+            )
+            ranked = (
+                select(CommentModel.commentId, rank)
+                .where(CommentModel.postId.in_(postIds), CommentModel.isDeleted == 0)
+                .subquery()
+            )
+            comments = (
+                session.query(CommentModel)
+                .options(joinedload(CommentModel.account))
+                .join(ranked, ranked.c.commentId == CommentModel.commentId)
+                .filter(ranked.c.rank <= commentPreview)
+                .order_by(CommentModel.createdAt, CommentModel.commentId)
+                .all()
+            )
+            for cm in comments:
+                previews.setdefault(cm.postId, []).append(cm)
+
+        likedIds = PostMapper._likedPostIds(session, postIds, viewerId)
+
+        posts = []
+        for pm in postModels:
+            labels = [Label.fromLabelModel(pl.label) for pl in pm.postLabels]
+            post = Post.from_PostModel(pm, labels)
+            for cm in previews.get(pm.postId, []):
+                post.add_comment(Comment.from_CommentModel(cm))
+            post.setSummary(
+                likeCount=pm.likeCount,
+                commentCount=pm.commentCount,
+                likedByViewer=(pm.postId in likedIds) if viewerId is not None else None,
+            )
+            posts.append(post)
+        return posts
+
+    @staticmethod
+    def _toEntities(
+        session,
+        postModels: list[PostModel],
+        summary: bool = False,
+        viewerId: Optional[int] = None,
+    ) -> list[Post]:
+        if summary:
+            return PostMapper._summarize(session, postModels, viewerId)
+        posts = []
+        for pm in postModels:
+            # find the labels , find the correct label entity ,
+            labelsModels = [pl.label for pl in pm.postLabels]
+            # convert to label entities
+            labels = [Label.fromLabelModel(lm) for lm in labelsModels]
+            # create the post entity and pass the labels
+            posts.append(Post.from_PostModel(pm, labels))
+        return posts
+
+    @staticmethod
+    def invalidateCache(*postIds: int) -> None:
+        """
+        Drop cached feed pages, plus the cached views of `postIds`.
+        For writes that change which posts a feed page lists (creating or
+        deleting a post). Call once the write has committed.
+        """
+        CacheUtils.bump_version(
+            FEED_CACHE, *[f"{POST_CACHE}:{postId}" for postId in postIds]
+        )
+
+    @staticmethod
+    def invalidatePosts(*postIds: int) -> None:
+        """
+        Drop the cached views of `postIds` only. For likes and comments:
+        feed pages keep their counters and comment previews until
+        CACHE_TTL expires them, so interactions don't empty the feed
+        cache. Call once the write has committed.
+        """
+        if postIds:
+            CacheUtils.bump_version(*[f"{POST_CACHE}:{postId}" for postId in postIds])
+
+    @staticmethod
+    def getLikedPostIds(accountId: int, postIds: list[int]) -> set[int]:
+        """
+        Subset of `postIds` liked by `accountId`.
+        """
+        with db_context.session_scope(readonly=True) as session:
+            return PostMapper._likedPostIds(session, postIds, accountId)
+
     @staticmethod
     def getPostById(postId) -> Optional[Post]:
         """
         Fetch a post by its ID.
         """
-        with db_context.session_scope() as session:
+        with db_context.session_scope(readonly=True) as session:
             post = (
                 session.query(PostModel)
                 .options(
@@ -59,52 +247,21 @@ class PostMapper:
             return None
 
     @staticmethod
-    def getAllPosts() -> list[Post]:
+    def getAllPosts(
+        summary: bool = False, viewerId: Optional[int] = None
+    ) -> list[Post]:
         """
         Fetch all posts from the database.
         fetch from post , commetn and postlabel tables
         """
-        with db_context.session_scope() as session:
+        with db_context.session_scope(readonly=True) as session:
             posts = (
                 session.query(PostModel)
-                .options(
-                    joinedload(PostModel.account),  # Load the associated account
-                    joinedload(
-                        PostModel.postLabels
-                        # Load associated labels
-                    ).joinedload(PostLabelModel.label),
-                    joinedload(
-                        PostModel.comments
-                        # Load associated comments and their accounts
-                    ).joinedload(CommentModel.account),
-                    joinedload(PostModel.postLikes),  # Load associated likes
-                )
+                .options(*PostMapper._feedLoadOptions(summary))
                 .filter(PostModel.isDeleted == 0)
                 .all()
             )  # Only fetch non-deleted posts
-            # now i need to retrieve all the label entity for
-            # each post and put it in each post
-            listofPostEntities = []
-            if posts:
-                for post in posts:
-                    for postLikesModel in post.postLikes:
-                        # get the account from the postLikesModel
-                        print(f"Post liked by : {postLikesModel.accountId}")
-                    # find the labels , find the correct label entity,
-                    # # these are the label models
-                    labelsModels = [pl.label for pl in post.postLabels]
-                    # convert to label entities
-                    labels = [Label.fromLabelModel(lm) for lm in labelsModels]
-
-                    # find the comments, then create the
-                    # comment entities from post entity
-                    # commentModels = [cm for cm in post.comments]
-                    # create the post entity and pass the labels
-                    postEntity = Post.from_PostModel(post, labels)
-                    # add the comments to the post entity
-                    # postEntity.populateComments(commentModels)
-                    listofPostEntities.append(postEntity)
-            return listofPostEntities
+            return PostMapper._toEntities(session, posts, summary, viewerId)
 
     @staticmethod
     def getPosts(
@@ -112,67 +269,37 @@ class PostMapper:
         pageSize: int = 10,
         filterLabel: Optional[str] = None,
         sortBy: Optional[str] = None,
+        summary: bool = False,
+        viewerId: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Fetch posts with pagination, optional label filtering, and sorting.
         Returns a dictionary with posts and pagination info.
+        With `summary`, posts carry counts and a comment preview instead
+        of full comment threads and liker lists.
         """
-        with db_context.session_scope() as session:
-            query = session.query(PostModel).filter(PostModel.isDeleted == 0)
+        with db_context.session_scope(readonly=True) as session:
+            query = PostMapper._feedQuery(session, filterLabel)
 
-            # check if theres filterLabel
-            if filterLabel:
-                query = query.filter(
-                    PostModel.postLabels.any(
-                        PostLabelModel.label.has(LabelModel.description == filterLabel)
-                    )
-                )
-            commentCount = (
-                select(func.count(CommentModel.commentId))
-                .where(
-                    CommentModel.postId == PostModel.postId, CommentModel.isDeleted == 0
-                )
-                .scalar_subquery()
-            )
             # check if theres sortBy
-            if sortBy:
-                if sortBy == "Most liked":
-                    query = query.order_by(PostModel.postLikes.count().desc())
-                elif sortBy == "Most Commented":
-                    query = query.order_by(commentCount.desc())
-                elif sortBy == "Most Recent":
-                    query = query.order_by(PostModel.date.desc())
+            sortKey = PostMapper._feedSortKey(sortBy)
+            if sortKey is not None:
+                query = query.order_by(sortKey.desc())
 
             totalCount = query.count()  # Get total count of posts
             totalPages = ceil(totalCount / pageSize)  # Calculate total pages
             postModels = (
-                query.options(
-                    # Load the associated account
-                    joinedload(PostModel.account),
-                    # Load associated labels
-                    joinedload(PostModel.postLabels).joinedload(PostLabelModel.label),
-                    # Load associated comments and their accounts
-                    joinedload(PostModel.comments).joinedload(CommentModel.account),
-                    joinedload(PostModel.postLikes),  # Load associated likes
-                )
+                query.options(*PostMapper._feedLoadOptions(summary))
                 .offset((page - 1) * pageSize)  # Apply pagination offset
                 .limit(pageSize)  # Limit the number of posts per page
             ).all()  # Fetch the posts for the current page
             # Map to domain entities
-            posts = []
-            for pm in postModels:
-                # find the labels , find the correct label entity ,
-                labelsModels = [pl.label for pl in pm.postLabels]
-                # convert to label entities
-                labels = [Label.fromLabelModel(lm) for lm in labelsModels]
-                # find the comments, then create the
-                # comment entities from post entity
-                # commentModels = [cm for cm in pm.comments]
-                # create the post entity and pass the labels
-                postEntity = Post.from_PostModel(pm, labels)
-                # add the comments to the post entity
-                # postEntity.populateComments(commentModels)
-                posts.append(postEntity.toDict())
+            posts = [
+                post.toSummaryDict() if summary else post.toDict()
+                for post in PostMapper._toEntities(
+                    session, postModels, summary, viewerId
+                )
+            ]
             return {
                 "posts": posts,  # List of Post entities
                 "totalCount": totalCount,  # Total number of posts
@@ -182,55 +309,118 @@ class PostMapper:
             }
 
     @staticmethod
-    def createPost(post: Post) -> bool:
+    def getPostsByCursor(
+        cursor: Optional[str] = None,
+        pageSize: int = 10,
+        filterLabel: Optional[str] = None,
+        sortBy: Optional[str] = None,
+        includeTotal: bool = False,
+        summary: bool = False,
+        viewerId: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Keyset-paginated feed. Posts are ordered by (sortKey, postId)
+        descending and the page starts strictly after the position encoded
+        in `cursor`, so deep pages cost the same as the first one.
+        The total count is only computed when `includeTotal` is set.
+        Raises ValueError for a malformed cursor.
+        """
+        with db_context.session_scope(readonly=True) as session:
+            query = PostMapper._feedQuery(session, filterLabel)
+            totalCount = query.count() if includeTotal else None
+
+            sortKey = PostMapper._feedSortKey(sortBy)
+            keys = [PostModel.postId]
+            if sortKey is not None:
+                keys.insert(0, sortKey)
+
+            if cursor:
+                values = decode_cursor(cursor, [k.type.python_type for k in keys])
+                if sortKey is None:
+                    query = query.filter(PostModel.postId < values[0])
+                else:
+                    query = query.filter(
+                        or_(
+                            sortKey < values[0],
+                            and_(sortKey == values[0], PostModel.postId < values[1]),
+                        )
+                    )
+
+            # fetch one extra row to know whether another page exists
+            rows = (
+                query.add_columns(*[k.label(f"k{i}") for i, k in enumerate(keys)])
+                .options(*PostMapper._feedLoadOptions(summary))
+                .order_by(*[k.desc() for k in keys])
+                .limit(pageSize + 1)
+                .all()
+            )
+            hasMore = len(rows) > pageSize
+            rows = rows[:pageSize]
+
+            posts = [
+                post.toSummaryDict() if summary else post.toDict()
+                for post in PostMapper._toEntities(
+                    session, [row[0] for row in rows], summary, viewerId
+                )
+            ]
+
+            result = {
+                "posts": posts,
+                "nextCursor": encode_cursor(list(rows[-1][1:])) if hasMore else None,
+                "hasMore": hasMore,
+                "pageSize": pageSize,
+            }
+            if includeTotal:
+                result["totalCount"] = totalCount
+            return result
+
+    @staticmethod
+    def createPost(post: Post, author: Optional[Dict[str, Any]] = None) -> bool:
         """
-        Create a new post in the database.s
+        Create a new post in the database.
+        The post row and all of its labels go in as one INSERT each.
+        `author` ({name, profilePicUrl}, e.g. from the JWT claims) saves
+        reading the account back; without it one lookup is made.
         """
         try:
             with db_context.session_scope() as session:
-                postModel = PostModel(
-                    # postID=post.post_id,
-                    title=post.title,
-                    content=post.content,
-                    date=post.date,
-                    accountId=post.accountId,
-                    isDeleted=post.isDeleted,
-                )
-                session.add(postModel)
-                # FLUSH : send INSERT to db, gets the
-                # auto-incremented ID
-                session.flush()
-                # After flushing, postModel.postId will have
-                # the auto-incremented ID
-                for label in post.associated_labels:
-                    # Create a PostLabelModel for each label
-                    # associated with the post
-                    postLabelModel = PostLabelModel(
-                        # Use the auto-incremented ID after flush
-                        postId=postModel.postId,
-                        # Assuming labelID is the ID of the label entity
-                        labelId=label.labelId,
+                postId = session.execute(
+                    insert(PostModel).values(
+                        title=post.title,
+                        content=post.content,
+                        date=post.date,
+                        accountId=post.accountId,
+                        isDeleted=post.isDeleted,
                     )
-                    session.add(postLabelModel)
+                ).inserted_primary_key[0]
 
-                # load the account to get username
-                account = (
-                    session.query(AccountModel)
-                    .filter(AccountModel.accountId == post.accountId)
-                    .first()
-                )
-                print(f"Post created with ID: {postModel.postId}")
-                # Update the post ID with the auto-incremented
-                # ID from the database
-                # post.post_id = postModel.postId
-                # post.accountUsername = account.name if account else None
+                if post.associated_labels:
+                    session.execute(
+                        insert(PostLabelModel),
+                        [
+                            {"postId": postId, "labelId": label.labelId}
+                            for label in post.associated_labels
+                        ],
+                    )
+
+                if author is None:
+                    author = (
+                        session.execute(
+                            select(
+                                AccountModel.name, AccountModel.profilePicUrl
+                            ).where(AccountModel.accountId == post.accountId)
+                        )
+                        .mappings()
+                        .first()
+                    ) or {}
                 post.setAccountInfo(
-                    username=account.name if account else None,
-                    display_pic_url=account.profilePicUrl if account else None,
+                    username=author.get("name"),
+                    display_pic_url=author.get("profilePicUrl"),
                 )
-                post.setId(postModel.postId)
+                post.setId(postId)
 
-                return True  # Return True to indicate success
+            PostMapper.invalidateCache()
+            return True  # Return True to indicate success
         except Exception as e:
             print(f"Error creating post: {e}")
             return False
@@ -246,81 +436,137 @@ class PostMapper:
         none to multiple violations. create them in postviolation
         table if it exists.
         """
-        print(f"Deleting post with ID {postId}...")
         try:
             with db_context.session_scope() as session:
-                post = (
-                    session.query(PostModel).filter(PostModel.postId == postId).first()
-                )
-                if post:
-                    print(f"Found post with ID {postId}.")
-                    post.isDeleted = True  # Mark the post as deleted
-
-                    print(f"Post with ID {postId} marked as deleted.")
-                    # If there are violations,
-                    # create entries in the PostViolation table
-
-                    if violations:
-                        for violation in violations:
-                            # Assuming PostViolationModel exists
-                            # and has postId and violationId fields
-                            postViolationModel = PostViolationModel(
-                                postId=postId, violationId=violation.violationId
-                            )
-                            session.add(postViolationModel)
-
-                    return True
-                else:
+                found = session.execute(
+                    update(PostModel)
+                    .where(PostModel.postId == postId)
+                    .values(isDeleted=True)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if not found:
                     print(f"Post with ID {postId} not found.")
                     return False
+
+                if violations:
+                    session.execute(
+                        insert(PostViolationModel),
+                        [
+                            {"postId": postId, "violationId": v.violationId}
+                            for v in violations
+                        ],
+                    )
+            PostMapper.invalidateCache(postId)
+            return True
         except Exception as e:
             print(f"Error deleting post with ID {postId}: {e}")
 
             return False
 
     @staticmethod
-    def createDeletePostLikes(postId: int, accountId: int) -> dict[bool, str]:
+    def _likeDelta(postId: int, accountId: int, liked: Optional[bool]):
         """
-        Create a like for a post by an account.
+        SQL for how far Post.likeCount moves when (postId, accountId) is
+        set to `liked`, or toggled when `liked` is None.
         """
-        try:
-            with db_context.session_scope() as session:
-                # Check if the like already exists
-                existing_like = (
-                    session.query(PostLikesModel)
-                    .filter(
-                        PostLikesModel.postId == postId,
-                        PostLikesModel.accountId == accountId,
-                    )
-                    .first()
+        exists = (
+            select(PostLikesModel.postLikesId)
+            .where(
+                PostLikesModel.postId == postId,
+                PostLikesModel.accountId == accountId,
+            )
+            .exists()
+        )
+        # toggle: -1 / +1, like: 0 / +1, unlike: -1 / 0
+        return case(
+            (exists, 0 if liked else -1), else_=0 if liked is False else 1
+        )
+
+    @staticmethod
+    def _bumpLikeCount(session, postId: int, delta) -> Optional[int]:
+        """
+        Add `delta` (an int or SQL expression) to Post.likeCount in the
+        caller's transaction and return the new count, or None if the
+        post doesn't exist. The row lock this takes lasts until commit and
+        serializes like writes on the post, so call it before touching
+        PostLikes: two toggles of the same like can't then deadlock on
+        the unique index.
+        """
+        stmt = (
+            update(PostModel)
+            .where(PostModel.postId == postId)
+            .execution_options(synchronize_session=False)
+        )
+        newCount = PostModel.likeCount + delta
+        conn = session.connection()
+        if conn.dialect.update_returning:
+            return conn.execute(
+                stmt.values(likeCount=newCount).returning(PostModel.likeCount)
+            ).scalar()
+        # MySQL has no UPDATE ... RETURNING; LAST_INSERT_ID(expr) hands the
+        # value back with the statement's OK packet instead
+        result = conn.execute(stmt.values(likeCount=func.last_insert_id(newCount)))
+        return result.lastrowid if result.rowcount else None
+
+    @staticmethod
+    def _setLike(
+        session, postId: int, accountId: int, liked: Optional[bool]
+    ) -> Optional[tuple[bool, bool, int]]:
+        """
+        Like or unlike a post for an account, or toggle it when `liked` is
+        None. The counter moves first (see _bumpLikeCount), then a single
+        DELETE or INSERT; a toggle only inserts if the DELETE found nothing.
+        Returns (liked, changed, likeCount), or None if the post doesn't
+        exist, in which case nothing was written.
+        """
+        likeCount = PostMapper._bumpLikeCount(
+            session, postId, PostMapper._likeDelta(postId, accountId, liked)
+        )
+        if likeCount is None:
+            return None
+        removed = 0
+        if not liked:
+            removed = session.execute(
+                delete(PostLikesModel).where(
+                    PostLikesModel.postId == postId,
+                    PostLikesModel.accountId == accountId,
                 )
-                # we remove the like if it exists,
-                # otherwise we create a new like
-                if existing_like:
-                    session.delete(existing_like)
-                    print(
-                        f"Like removed for post ID {postId} \
-                          by account ID {accountId}."
-                    )
-                    return {
-                        "success": True,
-                        "message": f"Like removed for post ID {postId} \
-                            by account ID {accountId}.",
-                    }
-                else:
-                    # Create a new like
-                    new_like = PostLikesModel(postId=postId, accountId=accountId)
-                    session.add(new_like)
-                    print(
-                        f"Like added for post ID {postId} \
-                          by account ID {accountId}."
-                    )
+            ).rowcount
+        if removed or liked is False:
+            return False, bool(removed), likeCount
+        # the post row is locked and exists, so IGNORE can only skip a
+        # like that is already there
+        added = session.execute(
+            insert(PostLikesModel)
+            .prefix_with("IGNORE", dialect="mysql")
+            .prefix_with("OR IGNORE", dialect="sqlite")
+            .values(postId=postId, accountId=accountId)
+        ).rowcount
+        return True, bool(added), likeCount
 
-                    return {
-                        "success": True,
-                        "message": f"Like added for post ID \
-                            {postId} by account ID {accountId}.",
-                    }
+    @staticmethod
+    def createDeletePostLikes(postId: int, accountId: int) -> Optional[dict[str, Any]]:
+        """
+        Toggle a like for a post by an account in two or three statements:
+        the counter UPDATE, which also yields the new count, then a DELETE
+        and, if nothing was deleted, an INSERT. Returns the new state and
+        the post's like count, or None if the post doesn't exist.
+        """
+        try:
+            with db_context.session_scope() as session:
+                outcome = PostMapper._setLike(session, postId, accountId, None)
+            if outcome is None:
+                return None
+            liked, _, likeCount = outcome
+            PostMapper.invalidatePosts(postId)
+            action = "added" if liked else "removed"
+            return {
+                "success": True,
+                "liked": liked,
+                "likeCount": likeCount,
+                "message": f"Like {action} for post ID {postId} "
+                f"by account ID {accountId}.",
+            }
         except Exception as e:
             print(
                 f"Error toggling like for post ID {postId} \
@@ -333,21 +579,54 @@ class PostMapper:
             }
 
     @staticmethod
-    def getRecentlyInteractedPosts(accountId: int, limit: int = 5) -> list[Post]:
+    def applyPostLikes(accountId: int, operations: list[dict]) -> list[dict]:
         """
-        Fetch the most recent posts interacted by the account.
+        Apply many like/unlike operations for one account in a single
+        transaction. Each operation is {"postId": int, "liked": bool};
+        setting the state (rather than toggling) keeps retries idempotent.
+        Returns the resulting state and like count per post, in request
+        order; operations on posts that don't exist get an "error" instead
+        and change nothing. Posts are locked in postId order so concurrent
+        batches can't deadlock. Rolls back everything if any statement fails.
         """
+        results = [None] * len(operations)
+        counts = {}
         with db_context.session_scope() as session:
+            for i in sorted(
+                range(len(operations)), key=lambda i: operations[i]["postId"]
+            ):
+                postId, liked = operations[i]["postId"], operations[i]["liked"]
+                outcome = PostMapper._setLike(session, postId, accountId, liked)
+                if outcome is None:
+                    results[i] = {
+                        "postId": postId,
+                        "liked": liked,
+                        "error": "Post not found",
+                    }
+                    continue
+                _, changed, counts[postId] = outcome
+                results[i] = {"postId": postId, "liked": liked, "changed": changed}
+        for r in results:
+            if "error" not in r:
+                r["likeCount"] = counts[r["postId"]]
+        changedIds = {r["postId"] for r in results if r.get("changed")}
+        PostMapper.invalidatePosts(*changedIds)
+        return results
+
+    @staticmethod
+    def getRecentlyInteractedPosts(
+        accountId: int,
+        limit: int = 5,
+        summary: bool = False,
+        viewerId: Optional[int] = None,
+    ) -> list[Post]:
+        """
+        Fetch the most recent posts interacted by the account.
+        """
+        with db_context.session_scope(readonly=True) as session:
             posts = (
                 session.query(PostModel)
-                .options(
-                    joinedload(PostModel.account),  # Load the associated account
-                    # Load associated labels
-                    joinedload(PostModel.postLabels).joinedload(PostLabelModel.label),
-                    # Load associated comments and their accounts
-                    joinedload(PostModel.comments).joinedload(CommentModel.account),
-                    joinedload(PostModel.postLikes),  # Load associated likes
-                )
+                .options(*PostMapper._feedLoadOptions(summary))
                 .filter(
                     (
                         (PostModel.postLikes.any(PostLikesModel.accountId == accountId))
@@ -359,12 +638,4 @@ class PostMapper:
                 .limit(limit)
                 .all()
             )
-
-            labelModels = [pl.label for post in posts for pl in post.postLabels]
-            labels = [Label.fromLabelModel(lm) for lm in labelModels]
-
-            return (
-                [Post.from_PostModel(post, labels=labels) for post in posts]
-                if posts
-                else []
-            )
+            return PostMapper._toEntities(session, posts, summary, viewerId)
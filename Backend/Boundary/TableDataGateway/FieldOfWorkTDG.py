@@ -1,27 +1,45 @@
+from typing import Dict, List, Optional
 from SQLModels.FieldOfWorkModel import FieldOfWorkModel
-from SQLModels.base import db_context
+from Boundary.TableDataGateway.ReferenceDataGateway import ReferenceDataGateway
 
 
-class FieldOfWorkTDG:
+class FieldOfWorkTDG(ReferenceDataGateway):
     """
     FieldOfWorkTDG (Table Data Gateway) for managing field of work data.
     This class provides methods to interact with the field of work
     data in the database.
     """
 
+    namespace = "ref:fieldOfWork"
+    idKey = "fieldOfWorkId"
+
+    @classmethod
+    def _loadRows(cls, session, ids: Optional[List[int]] = None) -> List[Dict]:
+        query = session.query(FieldOfWorkModel).order_by(FieldOfWorkModel.fieldOfWorkId)
+        if ids is not None:
+            query = query.filter(FieldOfWorkModel.fieldOfWorkId.in_(ids))
+        return [
+            {"fieldOfWorkId": f.fieldOfWorkId, "description": f.description}
+            for f in query.all()
+        ]
+
     @staticmethod
-    def getAllFieldOfWork() -> str:
+    def getAllFieldOfWork() -> List[str]:
         """
-        Retrieves the field of work description by its ID.
+        Retrieves every field of work description.
 
-        :param field_of_work_id: The ID of the field of work.
-        :return: The description of the field of work.
+        :return: The descriptions, or None if the table is empty.
         """
+        return [row["description"] for row in FieldOfWorkTDG.allRows()] or None
 
-        with db_context.session_scope() as session:
-            field_of_work = session.query(FieldOfWorkModel).all()
-            if field_of_work:
-                return [f.description for f in field_of_work]
-            if field_of_work:
-                return field_of_work.description
-            return None
+    @staticmethod
+    def getFieldOfWorkId(description: str) -> Optional[int]:
+        """
+        Id of the field of work with this description (case-insensitive),
+        or None if there is none.
+        """
+        wanted = (description or "").lower()
+        for row in FieldOfWorkTDG.allRows():
+            if row["description"].lower() == wanted:
+                return row["fieldOfWorkId"]
+        return None
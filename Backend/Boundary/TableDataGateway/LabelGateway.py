@@ -1,38 +1,69 @@
+import os
+
 from SQLModels.base import db_context
 from SQLModels.LabelModel import LabelModel
+from SQLModels.PostLabelModel import PostLabelModel
+from Boundary.TableDataGateway.ReferenceDataGateway import ReferenceDataGateway
 from Entity.Label import Label
 from typing import Optional, List, Dict
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, select
+from Utils.CacheUtils import cached
+
+# usage counts change with every post, so they are cached apart from the
+# label rows and simply go stale for this long instead of invalidating them
+LABEL_USAGE_TTL = int(os.getenv("LABEL_USAGE_TTL", 60))
 
 
-class LabelGateway:
+class LabelGateway(ReferenceDataGateway):
     """
     Gateway since it pulls all labels at once
     """
 
-    labelsCache: Dict[int, Label] = {}
+    namespace = "ref:label"
+    idKey = "labelId"
+
+    @classmethod
+    def _loadRows(cls, session, ids: Optional[List[int]] = None) -> List[Dict]:
+        query = select(LabelModel).order_by(LabelModel.labelId)
+        if ids is not None:
+            query = query.where(LabelModel.labelId.in_(ids))
+        return [
+            {
+                "labelId": lm.labelId,
+                "description": lm.description,
+                "color": lm.color.value if lm.color else "",
+            }
+            for lm in session.execute(query).scalars()
+        ]
+
+    @staticmethod
+    def _loadUsage() -> Dict[str, int]:
+        with db_context.session_scope(readonly=True) as session:
+            rows = session.execute(
+                select(PostLabelModel.labelId, func.count()).group_by(
+                    PostLabelModel.labelId
+                )
+            ).all()
+        # JSON object keys are strings
+        return {str(labelId): uses for labelId, uses in rows}
+
+    @staticmethod
+    def _toLabels(rows: List[Dict]) -> List[Label]:
+        """Label entities with usage counts up to LABEL_USAGE_TTL old."""
+        usage = cached(
+            lambda: "ref:label:usage", LabelGateway._loadUsage, ttl=LABEL_USAGE_TTL
+        )
+        return [
+            Label.from_dict({**row, "numberofUses": usage.get(str(row["labelId"]), 0)})
+            for row in rows
+        ]
 
     @staticmethod
     def getAllLabels() -> List[Label]:
         """
         Find all labels from table
         """
-
-        with db_context.session_scope() as session:
-            labelModels = (
-                session.query(LabelModel)
-                .options(
-                    joinedload(LabelModel.postLabels)  # Load associated post labels
-                )
-                .all()
-            )
-            if labelModels:
-                LabelGateway.labelsCache = {
-                    lm.labelId: Label.fromLabelModel(lm) for lm in labelModels
-                }
-                return list(LabelGateway.labelsCache.values())
-            else:
-                return []
+        return LabelGateway._toLabels(LabelGateway.allRows())
 
     @staticmethod
     def getLabelbyId(labelId: int) -> Optional[Label]:
@@ -40,19 +71,8 @@ class LabelGateway:
         find label by id
         -> search in cache first, then db
         """
-        if labelId in LabelGateway.labelsCache:
-            return LabelGateway.labelsCache[labelId]
-
-        with db_context.session_scope() as session:
-            labelModel = (
-                session.query(LabelModel).filter(LabelModel.labelId == labelId).first()
-            )
-            if labelModel:
-                label = Label.fromLabelModel(labelModel)
-                LabelGateway.labelsCache[labelId] = label
-                return label
-            else:
-                return None
+        row = LabelGateway.rowById(labelId)
+        return LabelGateway._toLabels([row])[0] if row else None
 
     @staticmethod
     def getLabelsbyIds(labelIds: List[int]) -> List[Label]:
@@ -60,12 +80,4 @@ class LabelGateway:
         Find labels by a list of ids
         -> search in cache first, then db
         """
-        labels = []
-        for labelId in labelIds:
-            if labelId in LabelGateway.labelsCache:
-                labels.append(LabelGateway.labelsCache[labelId])
-            else:
-                label = LabelGateway.getLabelbyId(labelId)
-                if label:
-                    labels.append(label)
-        return labels
+        return LabelGateway._toLabels(LabelGateway.rowsByIds(labelIds))
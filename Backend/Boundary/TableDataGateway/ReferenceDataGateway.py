@@ -0,0 +1,114 @@
+import os
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from SQLModels.base import db_context
+from Utils.CacheUtils import (
+    bump_version,
+    cached,
+    get_many,
+    set_many,
+    versioned_key,
+)
+
+# Reference tables change only through admin writes, which bump the
+# namespace version, so entries can live much longer than feed pages.
+REFERENCE_CACHE_TTL = int(os.getenv("REFERENCE_CACHE_TTL", 3600))
+
+
+class ReferenceDataGateway:
+    """
+    Base for small, read-mostly lookup tables cached in Redis.
+    Rows are cached as plain dicts under a versioned namespace shared by
+    every worker; subclasses supply the namespace, the id key and the
+    query, and convert rows to entities themselves.
+
+    Subclasses must set `namespace` and `idKey` and define the classmethod
+    `_loadRows(session, ids=None)`, which returns the table as a list of
+    JSON-ready dicts, optionally restricted to `ids`. A gateway missing
+    any of them fails when its class is defined.
+    """
+
+    namespace: str = ""
+    idKey: str = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        missing = [attr for attr in ("namespace", "idKey") if not getattr(cls, attr)]
+        if not callable(getattr(cls, "_loadRows", None)):
+            missing.append("_loadRows")
+        if missing:
+            raise TypeError(f"{cls.__name__} must define {', '.join(missing)}")
+
+    @classmethod
+    def _query(cls, ids: Optional[List[int]] = None) -> List[Dict]:
+        with db_context.session_scope(readonly=True) as session:
+            return cls._loadRows(session, ids)
+
+    @classmethod
+    def allRows(cls) -> List[Dict[str, Any]]:
+        """Every row of the table, read through the cache."""
+        return cached(
+            lambda: versioned_key(cls.namespace, "all"),
+            cls._query,
+            ttl=REFERENCE_CACHE_TTL,
+        )
+
+    @classmethod
+    def rowById(cls, rowId: int) -> Optional[Dict[str, Any]]:
+        """A single row by id, read through the cache; None if missing."""
+
+        def load():
+            rows = cls._query([rowId])
+            return rows[0] if rows else None
+
+        return cached(
+            lambda: versioned_key(cls.namespace, "id", rowId),
+            load,
+            ttl=REFERENCE_CACHE_TTL,
+        )
+
+    @classmethod
+    def rowsByIds(cls, rowIds: List[int]) -> List[Dict[str, Any]]:
+        """
+        Rows for `rowIds` in the order given, skipping unknown or
+        non-numeric ids and duplicates. Cached rows come from one MGET;
+        all misses are read with a single IN query and written back in
+        one pipeline.
+        """
+        rowIds = list(
+            dict.fromkeys(int(i) for i in rowIds if str(i).strip().isdigit())
+        )
+        if not rowIds:
+            return []
+
+        try:
+            # same keys as rowById, built from a single version lookup
+            prefix = versioned_key(cls.namespace, "id", "")
+            keys = {i: f"{prefix}{i}" for i in rowIds}
+            hits = get_many(list(keys.values()))
+            found = {i: hits[k] for i, k in keys.items() if k in hits}
+        except redis.RedisError:
+            keys, found = None, {}
+
+        misses = [i for i in rowIds if i not in found]
+        if misses:
+            loaded = {row[cls.idKey]: row for row in cls._query(misses)}
+            found.update(loaded)
+            if keys is not None:
+                set_many(
+                    {keys[i]: row for i, row in loaded.items()},
+                    ttl=REFERENCE_CACHE_TTL,
+                )
+        return [found[i] for i in rowIds if i in found]
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop every cached entry for this table. Call after writes."""
+        bump_version(cls.namespace)
+
+    @classmethod
+    def warm(cls) -> int:
+        """Populate the cache ahead of the first request; returns row count."""
+        return len(cls.allRows())
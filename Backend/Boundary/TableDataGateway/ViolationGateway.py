@@ -1,41 +1,39 @@
-from SQLModels.base import db_context
+from Boundary.TableDataGateway.ReferenceDataGateway import ReferenceDataGateway
 from Entity.Violation import Violation
 from typing import Optional, List, Dict
-from sqlalchemy.orm import joinedload
 from SQLModels.ViolationModel import ViolationModel
 
 
-class ViolationGateway:
+class ViolationGateway(ReferenceDataGateway):
     """
     Gateway since it pulls all violations at once
     """
 
-    violationsCache: Dict[int, Violation] = {}
+    namespace = "ref:violation"
+    idKey = "violationId"
+
+    @classmethod
+    def _loadRows(cls, session, ids: Optional[List[int]] = None) -> List[Dict]:
+        query = session.query(ViolationModel).order_by(ViolationModel.violationId)
+        if ids is not None:
+            query = query.filter(ViolationModel.violationId.in_(ids))
+        return [
+            {"violationId": vm.violationId, "description": vm.description}
+            for vm in query.all()
+        ]
+
+    @staticmethod
+    def _toViolation(row: Dict) -> Violation:
+        return Violation(row["violationId"], row["description"])
 
     @staticmethod
     def getAllViolations() -> List[Violation]:
         """
         Find all violations from table
         """
-
-        with db_context.session_scope() as session:
-
-            violationModels = (
-                session.query(ViolationModel)
-                .options(
-                    joinedload(
-                        ViolationModel.postViolations
-                    )  # Load associated post violations
-                )
-                .all()
-            )
-
-            if violationModels:
-                ViolationGateway.violationsCache = {
-                    vm.violationId: Violation.fromViolationModel(vm)
-                    for vm in violationModels
-                }
-                return list(ViolationGateway.violationsCache.values())
+        return [
+            ViolationGateway._toViolation(row) for row in ViolationGateway.allRows()
+        ]
 
     @staticmethod
     def getViolationById(violationId: int) -> Optional[Violation]:
@@ -43,21 +41,8 @@ class ViolationGateway:
         Find violation by id
         -> search in cache first, then db
         """
-        if violationId in ViolationGateway.violationsCache:
-            return ViolationGateway.violationsCache[violationId]
-
-        with db_context.session_scope() as session:
-            violationModel = (
-                session.query(ViolationModel)
-                .filter(ViolationModel.violationId == violationId)
-                .first()
-            )
-            if violationModel:
-                violation = Violation.fromViolationModel(violationModel)
-                ViolationGateway.violationsCache[violationId] = violation
-                return violation
-            else:
-                return None
+        row = ViolationGateway.rowById(violationId)
+        return ViolationGateway._toViolation(row) if row else None
 
     @staticmethod
     def getViolationsByIds(violationIds: List[int]) -> List[Violation]:
@@ -65,27 +50,15 @@ class ViolationGateway:
         Find violations by a list of ids
         -> search in cache first, then db
         """
-        violations = []
-        for violationId in violationIds:
-            if violationId in ViolationGateway.violationsCache:
-                violations.append(ViolationGateway.violationsCache[violationId])
-            else:
-                violation = ViolationGateway.getViolationById(violationId)
-                if violation:
-                    violations.append(violation)
-        return violations
+        return [
+            ViolationGateway._toViolation(row)
+            for row in ViolationGateway.rowsByIds(violationIds)
+        ]
 
     @staticmethod
     def getAllViolationOptions():
         """
-        Get all violations, return as objects or strings
-        :param returnMethod: "object" for Violation objects,
-        "string" for violation names
+        Get all violations as {violationId, description} dicts
         :return: List of violations
         """
-        with db_context.session_scope() as session:
-            violationModels: ViolationModel = session.query(ViolationModel).all()
-            return [
-                {"violationId": vm.violationId, "description": vm.description}
-                for vm in violationModels
-            ]
+        return ViolationGateway.allRows()
@@ -91,6 +91,15 @@ class AccountControl:
                 )
                 if attemptMsg:
                     return jsonify({"message": attemptMsg}), errorCode
+            elif AuthUtils.needs_rehash(account.passwordHash):
+                accountId = account.accountId
+                AuthUtils.rehash_in_background(
+                    password,
+                    account.passwordHash,
+                    lambda old, new: AccountMapper.updatePasswordHash(
+                        accountId, old, new
+                    ),
+                )
             new_jti = str(uuid.uuid4())
             base_data = {
                 "accountId": account.accountId,
@@ -134,6 +143,22 @@ class AccountControl:
     def getAccountById(accountId: int) -> Account:
         return AccountMapper.getAccountById(accountId)
 
+    @staticmethod
+    def getSessionState(accountId: int) -> dict | None:
+        """
+        Session binding used by the request hooks.
+        :return: {"accountId", "sessionId", "isDisabled"} or None if missing.
+        """
+        return AccountMapper.getSessionState(accountId)
+
+    @staticmethod
+    def getSessionStates(accountIds: list[int]) -> dict[int, dict]:
+        """
+        Session bindings for several accounts at once.
+        :return: Mapping of accountId to session state.
+        """
+        return AccountMapper.getSessionStates(accountIds)
+
     @staticmethod
     def updateAccount(accountData: dict) -> bool:
         account_id = accountData["accountId"]
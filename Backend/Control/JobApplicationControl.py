@@ -57,14 +57,30 @@ class JobApplicationControl:
         """
         Retrieves all applications for jobs that belong to the given company.
         :param companyId: ID of the company to retrieve applications for.
-        :return: List of JobApplicationModel instances.
+        :return: List of JobApplication entities.
         """
-        print(
-            f"Retrieving applications for \
-            company with companyId: {companyId}"
-        )
         return JobApplicationMapper.getApplicationsByCompanyId(companyId)
 
+    @staticmethod
+    def searchCompanyApplications(
+        companyId: int,
+        filters: dict = None,
+        cursor: str = None,
+        pageSize: int = 20,
+        includeCounts: bool = False,
+    ) -> dict:
+        """
+        Filtered, paginated applicants across a company's jobs.
+        Raises ValueError for a malformed cursor.
+        """
+        return JobApplicationMapper.searchCompanyApplications(
+            companyId,
+            filters,
+            cursor=cursor,
+            pageSize=pageSize,
+            includeCounts=includeCounts,
+        )
+
     @staticmethod
     def getAppliedJobIds(userId: int):
         """
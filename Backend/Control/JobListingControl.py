@@ -28,13 +28,19 @@ class JobListingControl:
             return False
 
     @staticmethod
-    def getJobDetails(job_id):
+    def getJobDetails(job_id, applicantCursor: str = None):
         """
-        Retrieves job details by job_id.
+        Retrieves job details by job_id with one page of applicants.
+        Raises ValueError for a malformed applicant cursor.
         """
-        # Example: return self.db.query(Job).filter_by(job_id=job_id).first()
-        print(f"Retrieving job details for job_id: {job_id}")
-        return JobListingMapper.getJobDetails(job_id)
+        return JobListingMapper.getJobDetails(job_id, applicantCursor=applicantCursor)
+
+    @staticmethod
+    def getJobOwner(jobId: int):
+        """
+        companyId that owns the job listing, or None if it doesn't exist.
+        """
+        return JobListingMapper.getJobOwner(jobId)
 
     @staticmethod
     def getAllJobListings(company_id: int = None):
@@ -49,6 +55,26 @@ class JobListingControl:
             print("Retrieving all job listings")
             return JobListingMapper.getAllJobListings(company_id)
 
+    @staticmethod
+    def searchJobListings(
+        filters: dict,
+        sortBy: str = "newest",
+        cursor: str = None,
+        pageSize: int = 20,
+        includeFacets: bool = False,
+    ) -> dict:
+        """
+        Filtered, keyset-paginated job board search.
+        Raises ValueError for an unknown sort or a malformed cursor.
+        """
+        return JobListingMapper.searchJobListings(
+            filters=filters,
+            sortBy=sortBy,
+            cursor=cursor,
+            pageSize=pageSize,
+            includeFacets=includeFacets,
+        )
+
     @staticmethod
     def deleteJob(jobId: int):
         """
@@ -1,4 +1,7 @@
-from Boundary.Mapper.PostMapper import PostMapper
+from typing import Optional
+
+from Boundary.Mapper.PostMapper import PostMapper, FEED_CACHE, POST_CACHE
+from Utils import CacheUtils
 from Entity.Post import Post
 from Boundary.TableDataGateway.LabelGateway import LabelGateway
 from Boundary.TableDataGateway.ViolationGateway import ViolationGateway
@@ -9,7 +12,7 @@ class PostControl:
         pass
 
     @staticmethod
-    def retrieveAllPosts() -> list[Post]:
+    def retrieveAllPosts(summary: bool = False, viewerId: int = None) -> list[Post]:
         """
         Retrieve all posts from the database.
         fetches all post models, for each one , query the
@@ -17,21 +20,89 @@ class PostControl:
         and return a list of Post entities.
         """
         # return PostMapper.getAllPosts()
-        posts = PostMapper.getAllPosts()
+        posts = PostMapper.getAllPosts(summary=summary, viewerId=viewerId)
         return posts
 
     @staticmethod
     def retrievePaginatedPosts(
-        page: int, pageSize: int, sortBy: str = "createdAt", filterLabel: str = None
+        page: int,
+        pageSize: int,
+        sortBy: str = "createdAt",
+        filterLabel: str = None,
+        summary: bool = False,
+        viewerId: int = None,
+    ) -> dict[str, any]:
+        """
+        Retrieve paginated posts, served from the feed cache when possible.
+        Cached pages are viewer-independent; likedByViewer is filled in
+        afterwards.
+        """
+        results = CacheUtils.cached(
+            lambda: CacheUtils.versioned_key(
+                FEED_CACHE, "page", page, pageSize, filterLabel, sortBy, summary
+            ),
+            lambda: PostMapper.getPosts(
+                page=page,
+                pageSize=pageSize,
+                filterLabel=filterLabel,
+                sortBy=sortBy,
+                summary=summary,
+            ),
+        )
+        if summary:
+            PostControl._applyViewer(results["posts"], viewerId)
+        return results
+
+    @staticmethod
+    def retrieveCursorPosts(
+        cursor: str = None,
+        pageSize: int = 10,
+        sortBy: str = None,
+        filterLabel: str = None,
+        includeTotal: bool = False,
+        summary: bool = False,
+        viewerId: int = None,
     ) -> dict[str, any]:
         """
-        Retrieve paginated posts from the database.
+        Retrieve a keyset-paginated page of posts, cached like
+        retrievePaginatedPosts.
+        Raises ValueError if the cursor is malformed.
         """
-        results = PostMapper.getPosts(
-            page=page, pageSize=pageSize, filterLabel=filterLabel, sortBy=sortBy
+        results = CacheUtils.cached(
+            lambda: CacheUtils.versioned_key(
+                FEED_CACHE,
+                "cursor",
+                cursor,
+                pageSize,
+                filterLabel,
+                sortBy,
+                includeTotal,
+                summary,
+            ),
+            lambda: PostMapper.getPostsByCursor(
+                cursor=cursor,
+                pageSize=pageSize,
+                filterLabel=filterLabel,
+                sortBy=sortBy,
+                includeTotal=includeTotal,
+                summary=summary,
+            ),
         )
+        if summary:
+            PostControl._applyViewer(results["posts"], viewerId)
         return results
 
+    @staticmethod
+    def _applyViewer(posts: list[dict], viewerId: int = None) -> None:
+        """
+        Set likedByViewer on cached summary dicts for the current viewer.
+        """
+        liked = set()
+        if viewerId is not None:
+            liked = PostMapper.getLikedPostIds(viewerId, [p["id"] for p in posts])
+        for p in posts:
+            p["likedByViewer"] = (p["id"] in liked) if viewerId is not None else None
+
     @staticmethod
     def retrievePostById(postId: int) -> Post:
         """
@@ -41,19 +112,41 @@ class PostControl:
         return post
 
     @staticmethod
-    def retrieveRecentlyInteractedPosts(accountId: int) -> list[Post]:
+    def retrievePostViewById(postId: int) -> dict | None:
+        """
+        Public view of a post as a dict, served from the cache when
+        possible. Returns None if the post doesn't exist.
+        """
+
+        def load():
+            post = PostMapper.getPostById(postId=postId)
+            return post.toDict() if post else None
+
+        return CacheUtils.cached(
+            lambda: CacheUtils.versioned_key(f"{POST_CACHE}:{postId}", "view"),
+            load,
+        )
+
+    @staticmethod
+    def retrieveRecentlyInteractedPosts(
+        accountId: int, summary: bool = False, viewerId: int = None
+    ) -> list[Post]:
         """
         Retrieve posts that the user has recently interacted with.
         This could be based on likes, comments, or other interactions.
         """
         # Placeholder for actual implementation
         # Retrieve posts based on recent interactions of the user
-        return PostMapper.getRecentlyInteractedPosts(accountId=accountId)
+        return PostMapper.getRecentlyInteractedPosts(
+            accountId=accountId, summary=summary, viewerId=viewerId
+        )
 
     @staticmethod
-    def createPost(postData: dict) -> tuple[Post, bool]:
+    def createPost(postData: dict, author: dict = None) -> tuple[Post, bool]:
         """
         Create a new post in the database.
+        `author` ({name, profilePicUrl}) is the poster's display info if
+        the caller already has it.
         """
         # should retrieve the labels
         # from the postData and get them from the label gateway ?
@@ -62,7 +155,7 @@ class PostControl:
         listofLabels = LabelGateway.getLabelsbyIds(labels)
         # Create Post entity from dictionary and labels
         post = Post.fromDict(postData, labels=listofLabels)
-        success = PostMapper.createPost(post)
+        success = PostMapper.createPost(post, author=author)
         return post, success  # Return the created post and success status
 
     @staticmethod
@@ -77,9 +170,17 @@ class PostControl:
         return success  # Return the success status of the deletion
 
     @staticmethod
-    def toggleLikes(postId: int, accountId: int) -> dict[bool, str]:
+    def toggleLikes(postId: int, accountId: int) -> Optional[dict[str, any]]:
         """
         Toggle the like status of a post for a given account.
+        Returns None if the post doesn't exist.
         """
         msg = PostMapper.createDeletePostLikes(postId=postId, accountId=accountId)
         return msg  # Return the success status of the like toggle operation
+
+    @staticmethod
+    def applyLikes(accountId: int, operations: list[dict]) -> list[dict]:
+        """
+        Apply a batch of like/unlike operations for one account.
+        """
+        return PostMapper.applyPostLikes(accountId=accountId, operations=operations)
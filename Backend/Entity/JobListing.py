@@ -4,6 +4,7 @@ from typing import List, Optional
 from Entity.Company import Company
 from enum import Enum
 from Entity.JobApplication import JobApplication
+from sqlalchemy import inspect
 
 
 class WorkArrangement(Enum):
@@ -185,9 +186,24 @@ class JobListing:
         }
 
     @classmethod
-    def from_JobListingModel(cls, orm_obj, *, numApplicants: int = 0) -> "JobListing":
+    def from_JobListingModel(
+        cls, orm_obj, *, numApplicants: int = 0, applications: Optional[list] = None
+    ) -> "JobListing":
+        """
+        Relationships the query didn't load are left empty rather than
+        lazy-loaded (they are lazy="raise" on the model).
+        `applications` overrides jobApplication with a separately
+        loaded page of JobApplicationModels.
+        """
         from Entity.Company import Company  # local import avoids circulars
 
+        unloaded = inspect(orm_obj).unloaded
+
+        def loaded(name):
+            return None if name in unloaded else getattr(orm_obj, name)
+
+        fieldOfWork = loaded("fieldOfWork")
+        company = loaded("company")
         return cls(
             _JobListing__jobId=orm_obj.jobId,
             _JobListing__title=orm_obj.title,
@@ -198,21 +214,24 @@ class JobListing:
             _JobListing__jobType=orm_obj.jobType,
             _JobListing__createdAt=orm_obj.createdAt,
             _JobListing__workArrangement=orm_obj.workArrangement,
-            _JobListing__fieldOfWork=getattr(
-                orm_obj.fieldOfWork, "description", orm_obj.fieldOfWork
-            ),
+            _JobListing__fieldOfWork=fieldOfWork.description if fieldOfWork else None,
             _JobListing__responsibilities=[
-                r.responsibility for r in orm_obj.responsibilities if r.responsibility
+                r.responsibility
+                for r in loaded("responsibilities") or []
+                if r.responsibility
             ],
             _JobListing__isDeleted=orm_obj.isDeleted,
             _JobListing__company=(
-                Company.from_CompanyModel(orm_obj.company) if orm_obj.company else None
+                Company.from_CompanyModel(company) if company else None
             ),
             _JobListing__experiencePreferred=orm_obj.experiencePreferred or 0,
             _JobListing__numApplicants=numApplicants,
-            _JobListing__jobApplication=(
-                [JobApplication.from_model(a) for a in orm_obj.jobApplication]
-                if orm_obj.jobApplication
-                else []
-            ),
+            _JobListing__jobApplication=[
+                JobApplication.from_model(a)
+                for a in (
+                    applications
+                    if applications is not None
+                    else loaded("jobApplication") or []
+                )
+            ],
         )
@@ -24,6 +24,10 @@ class Post:
     __accountUsername: Optional[str] = None
     __accountDisplayPicture: Optional[str] = None
     __likedBy: List[int] = field(default_factory=list)
+    # feed-summary fields, only populated when counts are loaded separately
+    __likeCount: Optional[int] = None
+    __commentCount: Optional[int] = None
+    __likedByViewer: Optional[bool] = None
 
     # ─────────── Public, read-only properties ───────────
     @property
@@ -74,6 +78,22 @@ class Post:
     def likedBy(self) -> List[int]:
         return list(self.__likedBy)
 
+    @property
+    def likeCount(self) -> int:
+        if self.__likeCount is None:
+            return len(self.__likedBy)
+        return self.__likeCount
+
+    @property
+    def commentCount(self) -> int:
+        if self.__commentCount is None:
+            return len(self.__associated_comments)
+        return self.__commentCount
+
+    @property
+    def likedByViewer(self) -> Optional[bool]:
+        return self.__likedByViewer
+
     # ─────────── Internal mutation methods ───────────
     def mark_deleted(self) -> None:
         """Soft-delete this post."""
@@ -113,6 +133,16 @@ class Post:
         if account_id in self.__likedBy:
             self.__likedBy.remove(account_id)
 
+    def setSummary(
+        self,
+        likeCount: int,
+        commentCount: int,
+        likedByViewer: Optional[bool] = None,
+    ) -> None:
+        self.__likeCount = likeCount
+        self.__commentCount = commentCount
+        self.__likedByViewer = likedByViewer
+
     # ─────────── Helpers & Converters ───────────
     @staticmethod
     def getSingaporeTimezone() -> datetime:
@@ -173,3 +203,15 @@ class Post:
             "displayPicUrl": self.__accountDisplayPicture,
             "likedBy": self.__likedBy,
         }
+
+    def toSummaryDict(self) -> Dict[str, Any]:
+        """
+        Feed representation: counts and a short comment preview instead of
+        the full comment thread and liker list.
+        """
+        data = self.toDict()
+        del data["likedBy"]
+        data["likeCount"] = self.likeCount
+        data["commentCount"] = self.commentCount
+        data["likedByViewer"] = self.__likedByViewer
+        return data
@@ -1,36 +1,21 @@
-from flask import Blueprint, request, jsonify, abort
+from flask import Blueprint, request, jsonify, abort, g
 from Control.CommentControl import CommentControl
 import traceback
 from Security.ValidateInputs import validate_comment
 from Security.Limiter import limiter, get_account_key
-from Security.JWTUtils import JWTUtils
+from Security.Principal import login_required
 
 comment_bp = Blueprint("comment", __name__)
 
 
-def _authenticate():
-    """
-    Extract and verify JWT from cookie. Abort with 401 on failure.
-    Returns the decoded claims (dict).
-    """
-    token = JWTUtils.get_token_from_cookie()
-    if not token:
-        abort(401, description="Authentication required")
-    try:
-        claims = JWTUtils.decode_jwt_token(token)
-    except Exception:
-        abort(401, description="Invalid or expired token")
-    return claims
-
-
 @comment_bp.route("/comment/<post_id>", methods=["POST"])
 @limiter.limit("15 per hour", key_func=get_account_key)
+@login_required
 def addComment(post_id):
     """
     Add a comment to a post.
     """
-    claims = _authenticate()
-    user_id = claims.get("sub")
+    user_id = g.principal.accountId
     try:
         # Get the JSON data from the request
         data = request.get_json()
@@ -62,12 +47,12 @@ def addComment(post_id):
 
 
 @comment_bp.route("/deleteComment/<comment_id>", methods=["POST"])
+@login_required
 def deleteComment(comment_id):
     """
     Delete a comment by its ID.
     """
-    claims = _authenticate()
-    user_id = claims.get("sub")
+    user_id = g.principal.accountId
     try:
         # Ensure comment exists
         comment_entity = CommentControl.getCommentById(comment_id)
@@ -1,46 +1,110 @@
 # job_listing_routes.py
 
-from flask import Blueprint, request, jsonify, abort
-from Security.JWTUtils import JWTUtils
+from flask import Blueprint, request, jsonify, abort, g
 from Control.JobApplicationControl import JobApplicationControl
 from Control.JobListingControl import JobListingControl
 from Security.Limiter import limiter, get_company_key
+from Security.Principal import login_required, owner_required, roles_required
 from Security.ValidateInputs import validate_job_listing
 from Security import SplunkUtils
+from Entity.JobListing import JobType, WorkArrangement
+from SQLModels.AccountModel import Role
+from datetime import datetime
+from Utils.ResponseUtils import conditional_json, REFERENCE_MAX_AGE
 
 job_listing_bp = Blueprint("job_listing", __name__)
+MAX_SEARCH_PAGE_SIZE = 50
 SplunkLogging = SplunkUtils.SplunkLogger()
 
 
-def _authenticate():
-    """
-    Pulls and validates the JWT from the session_token cookie.
-    Aborts 401 if missing/invalid.
-    """
-    token = JWTUtils.get_token_from_cookie()
-    if not token:
-        abort(401, "Authentication required")
-    try:
-        return JWTUtils.decode_jwt_token(token)
-    except Exception:
-        abort(401, "Invalid or expired token")
-
-
 # GET all job listings
 @job_listing_bp.route("/joblistings", methods=["GET"])
 def getAllJobListings():
     listings = JobListingControl.getAllJobListings()
-    print(f"All job listings: {[listing.to_dict() for listing in listings]}")
-    return jsonify([listing.to_dict() for listing in listings]), 200
+    return conditional_json([listing.to_dict() for listing in listings])
+
+
+def _parse_job_filters(args) -> dict:
+    """
+    Read job board filters from the query string.
+    Raises ValueError for values that don't parse.
+    """
+
+    def _int(name):
+        raw = args.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            return int(raw)
+        except ValueError:
+            raise ValueError(f"{name} must be an integer")
+
+    def _date(name):
+        raw = args.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            return datetime.fromisoformat(raw)
+        except ValueError:
+            raise ValueError(f"{name} must be an ISO date")
+
+    try:
+        jobTypes = [JobType(v) for v in args.getlist("jobType")]
+        arrangements = [WorkArrangement(v) for v in args.getlist("workArrangement")]
+    except ValueError as e:
+        raise ValueError(f"Invalid filter value: {e}")
+
+    return {
+        "fieldOfWork": args.get("fieldOfWork"),
+        "jobType": jobTypes,
+        "workArrangement": arrangements,
+        "minSalary": _int("minSalary"),
+        "maxSalary": _int("maxSalary"),
+        "deadlineFrom": _date("deadlineFrom"),
+        "deadlineTo": _date("deadlineTo"),
+        "companyId": _int("companyId"),
+        "q": (args.get("q") or "").strip() or None,
+    }
+
+
+@job_listing_bp.route("/joblistings/search", methods=["GET"])
+def searchJobListings():
+    """
+    Job board search. Filters: fieldOfWork, jobType and workArrangement
+    (repeatable), minSalary, maxSalary, deadlineFrom, deadlineTo,
+    companyId, q. Sorts: newest (default), deadline, salary.
+    Pages with `cursor`/`pageSize`; `facets=1` adds per-value counts.
+    """
+    try:
+        filters = _parse_job_filters(request.args)
+        pageSize = request.args.get("pageSize", default=20, type=int)
+        results = JobListingControl.searchJobListings(
+            filters,
+            sortBy=request.args.get("sortBy") or "newest",
+            cursor=request.args.get("cursor"),
+            pageSize=max(1, min(pageSize, MAX_SEARCH_PAGE_SIZE)),
+            includeFacets=request.args.get("facets", "").lower()
+            in ("1", "true", "yes"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return conditional_json(results)
 
 
 # GET a single job detail
 @job_listing_bp.route("/jobDetails/<int:job_id>", methods=["GET"])
 def getJobDetails(job_id):
-    listings = JobListingControl.getJobDetails(job_id)
-    return (
-        jsonify(listings.to_dict()) if listings else jsonify({"error": "Job not found"})
-    ), 200
+    """
+    Job listing with its applicant count and the first page of applicants;
+    pass `applicantCursor` from `applicantsNextCursor` for the next page.
+    """
+    try:
+        details = JobListingControl.getJobDetails(
+            job_id, applicantCursor=request.args.get("applicantCursor")
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return (jsonify(details) if details else jsonify({"error": "Job not found"})), 200
 
 
 @job_listing_bp.route(
@@ -50,16 +114,16 @@ def getJobDetails(job_id):
 def getCompanyJobListings(company_id):
     # Pass company_id so you only get jobs for that company
     listings = JobListingControl.getAllJobListings(company_id=company_id)
-    print(f"Company job listings: {[listing.to_dict() for listing in listings]}")
     return jsonify([listing.to_dict() for listing in listings]), 200
 
 
 # POST new job listing
 @limiter.limit("15 per hour", key_func=get_company_key)
 @job_listing_bp.route("/addJob", methods=["POST"])
+@login_required
 def createJobListing():
-    claims = _authenticate()
-    company_id = claims.get("companyId")
+    role = g.principal.role
+    company_id = g.principal.companyId
 
     job_data = request.get_json() or {}
     # 401 if client tries to forge another company’s ID
@@ -76,7 +140,7 @@ def createJobListing():
                 "reason": "Validation error",
                 "errors": errors,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -96,7 +160,7 @@ def createJobListing():
                 "jobTitle": job_data.get("title"),
                 "companyId": job_data.get("company_id"),
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
                 "path": request.path,
@@ -111,7 +175,7 @@ def createJobListing():
                 "event": "Create Job Listing Failed",
                 "reason": "Server error",
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -123,23 +187,22 @@ def createJobListing():
 
 
 @job_listing_bp.route("/deleteJob/<int:jobId>", methods=["POST"])
+@roles_required(
+    Role.Admin,
+    Role.Company,
+    message="Only company users or admins may delete job listings",
+)
 def deleteJobListing(jobId):
     """
     Deletes a job listing by its jobId.
     """
-    claims = _authenticate()
-    company_id = claims.get("companyId")
-    role = claims.get("role")
-    is_admin = role == "Admin"
-    is_company = role == "Company"
-
-    # only Company users or Admins may proceed
-    if not is_admin and not is_company:
-        abort(403, "Only company users or admins may delete job listings")
-    job = JobListingControl.getJobDetails(jobId)  # returns a JobListing entity
-    if not job:
+    company_id = g.principal.companyId
+    role = g.principal.role
+    is_admin = g.principal.has_role(Role.Admin)
+    owner = JobListingControl.getJobOwner(jobId)
+    if owner is None:
         abort(404, "Job listing not found")
-    if not is_admin and job.company.companyId != company_id:
+    if not is_admin and owner != company_id:
         abort(403, "Cannot delete job listing for another company")
     success = JobListingControl.deleteJob(jobId)
 
@@ -149,7 +212,7 @@ def deleteJobListing(jobId):
                 "event": "Delete Job Listing Success",
                 "jobId": jobId,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -163,7 +226,7 @@ def deleteJobListing(jobId):
                 "event": "Delete Job Listing Fail",
                 "jobId": jobId,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -178,7 +241,9 @@ def getFieldOfWork():
     """
     Retrieves all field of work options.
     """
-    return JobApplicationControl.getAllFieldOfWork()
+    return conditional_json(
+        JobApplicationControl.getAllFieldOfWork(), max_age=REFERENCE_MAX_AGE
+    )
 
 
 @job_listing_bp.route("/getBookmarkedJob/<int:userId>", methods=["GET"])
@@ -191,12 +256,12 @@ def getBookmarkedJobs(userId):
 
 
 @job_listing_bp.route("/addBookmark", methods=["POST"])
+@login_required
 def addBookmark():
     """
     Adds a job to the user's bookmarks.
     """
-    claims = _authenticate()
-    user_id = claims.get("userId")
+    user_id = g.principal.userId
 
     data = request.get_json() or {}
     jobId = data.get("jobId")
@@ -212,14 +277,13 @@ def addBookmark():
 
 
 @job_listing_bp.route("/removeBookmark/<int:userId>/<int:jobId>", methods=["DELETE"])
+@owner_required(
+    "userId", "userId", "Forbidden: cannot remove another user's bookmark"
+)
 def removeBookmark(userId, jobId):
     """
     Removes a job from the user's bookmarks.
     """
-    claims = _authenticate()
-    auth_user = claims.get("userId")
-    if userId != auth_user:
-        abort(403, "Forbidden: cannot remove another user's bookmark")
 
     if not userId or not jobId:
         return jsonify({"error": "User ID and Job ID are required"}), 400
@@ -249,10 +313,13 @@ def getAllViolations():
     Retrieves all violations.
     :return: List of all violations.
     """
-    return JobListingControl.getAllViolations()
+    return conditional_json(
+        JobListingControl.getAllViolations(), max_age=REFERENCE_MAX_AGE
+    )
 
 
 @job_listing_bp.route("/setViolation/<int:jobId>/<int:violationId>", methods=["POST"])
+@login_required
 def setViolation(jobId, violationId):
     """
     Sets a violation for a job listing.
@@ -260,9 +327,8 @@ def setViolation(jobId, violationId):
     :param violationId: ID of the violation to set.
     :return: Success message or error.
     """
-    claims = _authenticate()
-    role = claims.get("role")
-    user_id = claims.get("userId")
+    role = g.principal.role
+    user_id = g.principal.userId
 
     success = JobListingControl.setViolation(jobId, violationId)
 
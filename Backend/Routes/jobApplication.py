@@ -1,36 +1,32 @@
 # job_application_routes.py
 
-from flask import Blueprint, request, jsonify, abort, send_file
+from flask import Blueprint, request, jsonify, abort, g, send_file
 from Control.JobApplicationControl import JobApplicationControl
 from Control.JobListingControl import JobListingControl
-from Security.JWTUtils import JWTUtils
+from Security.Principal import login_required, owner_required, roles_required
 from Security.Limiter import limiter, get_user_key
 from Security.ValidateFiles import enforce_pdf_limits, sanitize_pdf
 from Security import SplunkUtils
 from Utils.UploadDocUtil import download_by_uri
 from Security.FileEncUtils import decrypt_file_gcm
+from Entity.JobApplication import Status
+from SQLModels.AccountModel import Role
+from Utils.ResponseUtils import conditional_json
+from datetime import datetime
 from io import BytesIO
 import re
 
 job_application_bp = Blueprint("job_application", __name__)
+MAX_APPLICANT_PAGE_SIZE = 100
 SplunkLogging = SplunkUtils.SplunkLogger()
 
 
-def _authenticate():
-    token = JWTUtils.get_token_from_cookie()
-    if not token:
-        abort(401, description="Authentication required")
-    try:
-        return JWTUtils.decode_jwt_token(token)
-    except Exception:
-        abort(401, description="Invalid or expired token")
-
-
 @job_application_bp.route("/applyJob", methods=["POST"])
 @limiter.limit("5 per hour", key_func=get_user_key)
+@login_required
 def applyJob():
-    claims = _authenticate()
-    token_user = claims.get("userId")
+    role = g.principal.role
+    token_user = g.principal.userId
     # determine content type
     if request.content_type.startswith("multipart/form-data"):
         userId = request.form.get("userId", type=int)
@@ -47,7 +43,7 @@ def applyJob():
                         "reason": "Invalid PDF upload",
                         "error": str(e),
                         "userId": userId,
-                        "role": claims.get("role"),
+                        "role": role,
                         "jobId": jobId,
                         "ip": SplunkLogging.get_real_ip(request),
                         "user_agent": str(request.user_agent),
@@ -72,7 +68,7 @@ def applyJob():
                 "event": "Job Application Failed",
                 "reason": "Job ID missing",
                 "userId": userId,
-                "role": claims.get("role"),
+                "role": role,
                 "ip": SplunkLogging.get_real_ip(request),
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -89,7 +85,7 @@ def applyJob():
                 "event": "Job Applied Success",
                 "userId": userId,
                 "jobId": jobId,
-                "role": claims.get("role"),
+                "role": role,
                 "ip": SplunkLogging.get_real_ip(request),
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -104,7 +100,7 @@ def applyJob():
                 "reason": "Internal error",
                 "userId": userId,
                 "jobId": jobId,
-                "role": claims.get("role"),
+                "role": role,
                 "ip": SplunkLogging.get_real_ip(request),
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -115,22 +111,21 @@ def applyJob():
 
 
 @job_application_bp.route("/approveApplication/<int:applicationId>", methods=["POST"])
+@roles_required(Role.Company, message="Only company users may approve applications")
 def approveApplication(applicationId):
-    claims = _authenticate()
-    company_id = claims.get("companyId")
-    if company_id is None:
-        abort(403, "Only company users may approve applications")
+    role = g.principal.role
+    company_id = g.principal.companyId
 
     app_data = JobApplicationControl.getApplicationById(applicationId)
     if not app_data:
         abort(404)
     job_id = app_data["jobId"]
 
-    job = JobListingControl.getJobDetails(job_id)
-    if not job:
+    owner = JobListingControl.getJobOwner(job_id)
+    if owner is None:
         abort(404, "Associated job not found")
 
-    if job.company.companyId != company_id:
+    if owner != company_id:
         abort(403, "Cannot approve an application for another company")
 
     success = JobApplicationControl.approveApplication(applicationId)
@@ -141,7 +136,7 @@ def approveApplication(applicationId):
                 "event": "Approve Application Success",
                 "applicationId": applicationId,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -157,7 +152,7 @@ def approveApplication(applicationId):
                 "event": "Approve Application Failed",
                 "applicationId": applicationId,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -169,22 +164,21 @@ def approveApplication(applicationId):
 
 
 @job_application_bp.route("/rejectApplication/<int:applicationId>", methods=["DELETE"])
+@roles_required(Role.Company, message="Only company users may approve applications")
 def rejectApplication(applicationId):
-    claims = _authenticate()
-    company_id = claims.get("companyId")
-    if company_id is None:
-        abort(403, "Only company users may approve applications")
+    role = g.principal.role
+    company_id = g.principal.companyId
 
     app_data = JobApplicationControl.getApplicationById(applicationId)
     if not app_data:
         abort(404)
     job_id = app_data["jobId"]
 
-    job = JobListingControl.getJobDetails(job_id)
-    if not job:
+    owner = JobListingControl.getJobOwner(job_id)
+    if owner is None:
         abort(404, "Associated job not found")
 
-    if job.company.companyId != company_id:
+    if owner != company_id:
         abort(403, "Cannot approve an application for another company")
 
     success = JobApplicationControl.rejectApplication(applicationId)
@@ -195,7 +189,7 @@ def rejectApplication(applicationId):
                 "event": "Reject Application Success",
                 "applicationId": applicationId,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -209,7 +203,7 @@ def rejectApplication(applicationId):
                 "event": "Reject Application Failed",
                 "applicationId": applicationId,
                 "ip": SplunkLogging.get_real_ip(request),
-                "role": claims.get("role"),
+                "role": role,
                 "company_id": company_id,
                 "user_agent": str(request.user_agent),
                 "method": request.method,
@@ -220,11 +214,10 @@ def rejectApplication(applicationId):
 
 
 @job_application_bp.route("/getApplicantsByCompanyId/<int:companyId>", methods=["GET"])
+@owner_required(
+    "companyId", "companyId", "Cannot view applications for another company"
+)
 def getApplicantsByCompanyId(companyId):
-    claims = _authenticate()
-    my_cid = claims.get("companyId")
-    if my_cid is None or my_cid != companyId:
-        abort(403, "Cannot view applications for another company")
     applicants = JobApplicationControl.getApplicationsByCompanyId(companyId)
 
     return (
@@ -234,6 +227,64 @@ def getApplicantsByCompanyId(companyId):
     ), 200
 
 
+def _parse_applicant_filters(args) -> dict:
+    """
+    Read applicant dashboard filters from the query string.
+    Raises ValueError for values that don't parse.
+    """
+
+    def _date(name):
+        raw = args.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            return datetime.fromisoformat(raw)
+        except ValueError:
+            raise ValueError(f"{name} must be an ISO date")
+
+    try:
+        statuses = [Status(v) for v in args.getlist("status")]
+    except ValueError as e:
+        raise ValueError(f"Invalid filter value: {e}")
+    jobId = args.get("jobId")
+    if jobId not in (None, "") and not jobId.isdigit():
+        raise ValueError("jobId must be an integer")
+
+    return {
+        "status": statuses,
+        "jobId": int(jobId) if jobId else None,
+        "appliedFrom": _date("appliedFrom"),
+        "appliedTo": _date("appliedTo"),
+        "name": (args.get("name") or "").strip() or None,
+    }
+
+
+@job_application_bp.route("/companyApplicants/<int:companyId>", methods=["GET"])
+@owner_required(
+    "companyId", "companyId", "Cannot view applications for another company"
+)
+def searchCompanyApplicants(companyId):
+    """
+    Applicant dashboard. Filters: status (repeatable), jobId, appliedFrom,
+    appliedTo, name. Pages with `cursor`/`pageSize`; `counts=1` adds
+    per-status totals.
+    """
+    try:
+        filters = _parse_applicant_filters(request.args)
+        pageSize = request.args.get("pageSize", default=20, type=int)
+        results = JobApplicationControl.searchCompanyApplications(
+            companyId,
+            filters,
+            cursor=request.args.get("cursor"),
+            pageSize=max(1, min(pageSize, MAX_APPLICANT_PAGE_SIZE)),
+            includeCounts=request.args.get("counts", "").lower()
+            in ("1", "true", "yes"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return conditional_json(results, public=False)
+
+
 @job_application_bp.route("/getAppliedJobId/<int:userId>", methods=["GET"])
 def getAppliedJobs(userId):
     applied_job_ids = JobApplicationControl.getAppliedJobIds(userId)
@@ -247,11 +298,8 @@ def get_latest_applied_job(userId):
 
 
 @job_application_bp.route("/resume/view", methods=["GET"])
+@roles_required(Role.Company, message="Only company users may view resumes")
 def view_resume():
-    claims = _authenticate()
-    company_id = claims.get("companyId")
-    if company_id is None:
-        abort(403, "Only company users may view resumes")
     gs_uri = request.args.get("uri")
     if not gs_uri or not gs_uri.startswith("gs://"):
         abort(400, description="Missing or invalid URI")
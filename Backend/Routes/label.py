@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify
 from Control.LabelControl import LabelControl
 import traceback
+from Utils.ResponseUtils import conditional_json
 
 
 label_bp = Blueprint("label", __name__)
@@ -17,7 +18,8 @@ def getAllLabels():
 
         if labels:
             # Convert each label to a dictionary
-            return jsonify([label.toDict() for label in labels]), 200
+            # usage counts move with every post, so keep max-age short
+            return conditional_json([label.toDict() for label in labels], max_age=60)
         else:
             return jsonify({"error": "No labels found"}), 404
     except Exception as e:
@@ -0,0 +1,33 @@
+from flask import Blueprint, jsonify
+from Security import AuthUtils
+from Security.JWTUtils import JWTUtils
+from Security.Principal import roles_required
+from Security.SplunkUtils import SplunkLogger
+from SQLModels.AccountModel import Role
+from SQLModels.base import db_context
+from Utils.CsrfUtils import CsrfUtils
+from Utils.StartupUtils import startup_report
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+@roles_required(Role.Admin)
+def get_metrics():
+    """
+    Per-worker runtime counters, admin only.
+    """
+
+    return (
+        jsonify(
+            {
+                "splunk": SplunkLogger.stats(),
+                "dbPool": db_context.get_pool_stats(),
+                "startup": startup_report(),
+                "passwordHashing": AuthUtils.stats(),
+                "jwtClaimsCache": JWTUtils.cache_stats(),
+                "csrf": CsrfUtils.stats(),
+            }
+        ),
+        200,
+    )
@@ -1,32 +1,40 @@
-from flask import Blueprint, request, jsonify, abort
+from flask import Blueprint, request, jsonify, abort, g
 from Control.PostControl import PostControl
 import traceback
 from Security.ValidateInputs import validate_post
 from Security.Limiter import limiter, get_account_key
-from Security.JWTUtils import JWTUtils
+from Security.Principal import current_principal, login_required, owner_required
+from Utils.ResponseUtils import conditional_json
 
 post_bp = Blueprint("post", __name__)
 
+MAX_PAGE_SIZE = 50
+MAX_LIKE_BATCH = 100
+
+
+def _viewer_id():
+    """
+    Account id of the caller if they carry a valid session cookie,
+    otherwise None. Used to personalise otherwise public reads.
+    """
+    principal = current_principal()
+    return principal.accountId if principal else None
 
-def _authenticate():
-    token = JWTUtils.get_token_from_cookie()
-    if not token:
-        abort(401, description="Authentication required")
-    try:
-        claims = JWTUtils.decode_jwt_token(token)
-    except Exception:
-        abort(401, description="Invalid or expired token")
-    return claims
+
+def _summary_view():
+    """`?view=summary` returns counts and a comment preview per post."""
+    return request.args.get("view") == "summary"
 
 
 @post_bp.route("/createPost", methods=["POST"])
 @limiter.limit("10 per hour", key_func=get_account_key)
+@login_required
 def createPost():
     """
     Create a new post in the database.
     """
-    claims = _authenticate()
-    user_id = claims.get("sub")
+    principal = g.principal
+    user_id = principal.accountId
 
     try:
         data = request.get_json()
@@ -46,7 +54,13 @@ def createPost():
         if errors:
             return jsonify({"error": errors}), 400
 
-        post, success = PostControl.createPost(postData)
+        post, success = PostControl.createPost(
+            postData,
+            author={
+                "name": principal.name,
+                "profilePicUrl": principal.profilePicUrl,
+            },
+        )
         if success:
             return jsonify(post.toDict()), 201
         else:
@@ -59,13 +73,13 @@ def createPost():
 
 
 @post_bp.route("/post/<int:post_id>", methods=["POST"])
+@login_required
 def delete_post(post_id):
     """
     Delete a post by its ID; only the owner, Company, or Admin may delete.
     """
-    claims = _authenticate()
-    user_id = claims.get("sub")
-    role = claims.get("role")
+    user_id = g.principal.accountId
+    role = g.principal.role
 
     try:
         # verify post exists
@@ -96,18 +110,46 @@ def delete_post(post_id):
 def get_paginated_posts():
     """
     Retrieve paginated posts from the database.
+    Passing `cursor` (empty for the first page) switches to keyset
+    pagination; the response then carries `nextCursor`/`hasMore` and only
+    includes `totalCount` when `includeTotal` is set.
     """
     try:
-        page = request.args.get("page", default=1, type=int)
+        summary = _summary_view()
+        viewerId = _viewer_id() if summary else None
         pageSize = request.args.get("pageSize", default=10, type=int)
-        print(
-            f"Page: {page}, Page Size: {pageSize}"
-        )  # Debugging output to check pagination parameters
+        pageSize = max(1, min(pageSize, MAX_PAGE_SIZE))
         filterLabel = request.args.get("filterLabel", default=None, type=str)
         sortBy = request.args.get("sortBy", default=None, type=str)
 
+        if "cursor" in request.args:
+            includeTotal = request.args.get("includeTotal", "").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+            try:
+                results = PostControl.retrieveCursorPosts(
+                    cursor=request.args.get("cursor"),
+                    pageSize=pageSize,
+                    sortBy=sortBy,
+                    filterLabel=filterLabel,
+                    includeTotal=includeTotal,
+                    summary=summary,
+                    viewerId=viewerId,
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            return jsonify(results), 200
+
+        page = max(1, request.args.get("page", default=1, type=int))
         results = PostControl.retrievePaginatedPosts(
-            page=page, pageSize=pageSize, sortBy=sortBy, filterLabel=filterLabel
+            page=page,
+            pageSize=pageSize,
+            sortBy=sortBy,
+            filterLabel=filterLabel,
+            summary=summary,
+            viewerId=viewerId,
         )  # Use the control layer to retrieve paginated posts
 
         return jsonify(results), 200  # Return the paginated results as JSON
@@ -124,13 +166,12 @@ def get_post_by_id(post_id):
     """
     try:
 
-        post = PostControl.retrievePostById(
+        post = PostControl.retrievePostViewById(
             post_id
         )  # Use the control layer to retrieve the post by its ID
 
         if post:
-            # Convert the post to a dictionary and return it as JSON
-            return jsonify(post.toDict()), 200
+            return conditional_json(post)
         else:
             return jsonify({"error": "Post not found"}), 404
     except Exception as e:
@@ -140,18 +181,20 @@ def get_post_by_id(post_id):
 
 
 @post_bp.route("/toggleLikes/<int:post_id>/<int:account_id>", methods=["POST"])
+@owner_required("account_id", message="Cannot like on behalf of another user")
 def toggleLikes(post_id, account_id):
     """
     Toggle the like status of a post for a given account.
     """
-    claims = _authenticate()
-    if claims.get("sub") != account_id:
-        abort(403, description="Cannot like on behalf of another user")
     try:
 
         result = PostControl.toggleLikes(
             post_id, account_id
         )  # Use the control layer to toggle likes for the post
+        if result is None:
+            return jsonify({"error": "Post not found"}), 404
+        if not result["success"]:
+            return jsonify(result), 500
 
         return jsonify(result), 200  # Return the result as JSON
     except Exception as e:
@@ -160,18 +203,58 @@ def toggleLikes(post_id, account_id):
         return jsonify({"error": str(e)}), 500
 
 
+@post_bp.route("/toggleLikes/batch", methods=["POST"])
+@login_required
+def applyLikesBatch():
+    """
+    Apply several like/unlike operations for the current user in one
+    transaction. Body: {"operations": [{"postId": 1, "liked": true}, ...]}
+    """
+    data = request.get_json(silent=True) or {}
+    operations = data.get("operations")
+    if not isinstance(operations, list) or not operations:
+        return jsonify({"error": "operations must be a non-empty list"}), 400
+    if len(operations) > MAX_LIKE_BATCH:
+        return (
+            jsonify({"error": f"At most {MAX_LIKE_BATCH} operations per batch"}),
+            400,
+        )
+    for op in operations:
+        if (
+            not isinstance(op, dict)
+            or not isinstance(op.get("postId"), int)
+            or not isinstance(op.get("liked"), bool)
+        ):
+            return (
+                jsonify({"error": "Each operation needs an int postId and bool liked"}),
+                400,
+            )
+
+    try:
+        results = PostControl.applyLikes(g.principal.accountId, operations)
+        return jsonify({"success": True, "results": results}), 200
+    except Exception as e:
+        print(f"Error applying like batch: {e}")
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
+
+
 @post_bp.route("/RecentlyInteractedPosts/<int:account_id>", methods=["GET"])
 def get_recently_interacted_posts(account_id):
     """
     Retrieve posts that the user has recently interacted with.
     """
     try:
-
+        summary = _summary_view()
         posts = PostControl.retrieveRecentlyInteractedPosts(
-            account_id
+            account_id,
+            summary=summary,
+            viewerId=_viewer_id() if summary else None,
         )  # Use the control layer to retrieve recently interacted posts
         return (
-            jsonify([post.toDict() for post in posts]),
+            jsonify(
+                [post.toSummaryDict() if summary else post.toDict() for post in posts]
+            ),
             200,
         )  # Convert each post to a dictionary
 
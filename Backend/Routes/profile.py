@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, abort, send_file
+from flask import Blueprint, request, jsonify, abort, g, send_file
 from Control.AccountControl import AccountControl
 from Security.Limiter import limiter, get_account_key
 from Security.ValidateFiles import (
@@ -10,9 +10,11 @@ from Security.ValidateFiles import (
 from Security.ValidateInputs import validate_profile
 from Security.AuthUtils import verify_hash_password, hash_password
 from Security.JWTUtils import JWTUtils
+from Security.Principal import login_required, owner_required, roles_required
 from Security import SplunkUtils
 from SQLModels.AccountModel import Role
 from Utils.UploadDocUtil import download_by_uri
+from Utils.ResponseUtils import conditional_json
 from Security.FileEncUtils import decrypt_file_gcm
 from io import BytesIO
 import re
@@ -22,17 +24,6 @@ SplunkLogging = SplunkUtils.SplunkLogger()
 profile_bp = Blueprint("profile", __name__, url_prefix="/profile")
 
 
-def _authenticate():
-    token = JWTUtils.get_token_from_cookie()
-    if not token:
-        abort(401, description="Authentication required")
-    try:
-        claims = JWTUtils.decode_jwt_token(token)
-    except Exception:
-        abort(401, description="Invalid or expired token")
-    return claims
-
-
 @profile_bp.route("/<int:account_id>", methods=["GET"])
 def get_user(account_id):
 
@@ -86,9 +77,9 @@ def get_user(account_id):
 
 @profile_bp.route("/save", methods=["POST"])
 @limiter.limit("1 per hour", key_func=get_account_key)
+@login_required
 def save_profile():
-    claims = _authenticate()
-    user_id = claims.get("sub")
+    user_id = g.principal.accountId
     updated_data = request.form.to_dict()
     try:
         form_account_id = int(updated_data.get("accountId", user_id))
@@ -216,11 +207,8 @@ def save_profile():
 
 
 @profile_bp.route("/disable/<int:account_id>", methods=["POST"])
+@owner_required("account_id", message="Forbidden to disable this account")
 def disable(account_id):
-    claims = _authenticate()
-    user_id = claims.get("sub")
-    if user_id != account_id:
-        abort(403, description="Forbidden to disable this account")
 
     auth_data = request.get_json()
 
@@ -261,9 +249,9 @@ def disable(account_id):
 
 
 @profile_bp.route("/portfolio/view", methods=["GET"])
+@login_required
 def view_portfolio():
-    claims = _authenticate()
-    user_id = claims.get("sub")
+    user_id = g.principal.accountId
 
     gs_uri = request.args.get("uri")
     if not gs_uri or not gs_uri.startswith("gs://"):
@@ -300,12 +288,15 @@ def get_all_companies():
     :return: List of all companies.
     """
     companies = AccountControl.getAllCompanies()
-    return jsonify([company.to_dict() for company in companies]), 200
+    return conditional_json(
+        [company.to_dict() for company in companies], public=False
+    )
 
 
 @profile_bp.route(
     "/setCompanyVerified/<int:company_id>/<int:verified>", methods=["POST"]
 )
+@roles_required(Role.Admin)
 def set_company_verified(company_id, verified):
     """
     Sets the verification status of a company.
@@ -313,9 +304,6 @@ def set_company_verified(company_id, verified):
     :param verified: Verification status (1 for True, 0 for False).
     :return: Success message or error.
     """
-    claims = _authenticate()
-    if claims.get("role") != Role.Admin.value:
-        abort(403, description="Forbidden")
     success = AccountControl.setCompanyVerified(company_id, verified)
     return (
         jsonify({"message": "Company verification status updated successfully!"})
@@ -325,10 +313,8 @@ def set_company_verified(company_id, verified):
 
 
 @profile_bp.route("/companydoc/view", methods=["GET"])
+@roles_required(Role.Admin)
 def view_companydoc():
-    claims = _authenticate()
-    if claims.get("role") != Role.Admin.value:
-        abort(403, description="Forbidden")
 
     gs_uri = request.args.get("uri")
     if not gs_uri or not gs_uri.startswith("gs://"):
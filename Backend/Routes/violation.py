@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify
 from Control.ViolationControl import ViolationControl
 import traceback
+from Utils.ResponseUtils import conditional_json, REFERENCE_MAX_AGE
 
 
 violation_bp = Blueprint("violation", __name__)
@@ -16,7 +17,10 @@ def violations():
         violations = ViolationControl.retrieveAllViolations()
         if violations:
             # Convert each violation to a dictionary
-            return jsonify([violation.toDict() for violation in violations]), 200
+            return conditional_json(
+                [violation.toDict() for violation in violations],
+                max_age=REFERENCE_MAX_AGE,
+            )
         else:
             return jsonify({"message": "No violations found"}), 404
 
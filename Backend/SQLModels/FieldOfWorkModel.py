@@ -9,7 +9,8 @@ class FieldOfWorkModel(Base):
     fieldOfWorkId = Column(Integer, primary_key=True, autoincrement=True)
     description = Column(String(100), unique=True, nullable=False)
 
-    # Reverse relationship to JobListingModel
+    # Reverse relationship to JobListingModel; never loaded implicitly,
+    # a field of work can have any number of listings
     jobListing = relationship(
-        "JobListingModel", back_populates="fieldOfWork", lazy="selectin"
+        "JobListingModel", back_populates="fieldOfWork", lazy="raise"
     )
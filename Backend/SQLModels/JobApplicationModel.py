@@ -1,5 +1,5 @@
 from .base import Base
-from sqlalchemy import Column, ForeignKey, Integer, Enum, DateTime, String
+from sqlalchemy import Column, ForeignKey, Integer, Enum, DateTime, String, Index
 from sqlalchemy.orm import relationship
 
 from Entity.JobApplication import Status
@@ -23,3 +23,8 @@ class JobApplicationModel(Base):
     resumeURL = Column(String, nullable=False, default="https://www.example.com/")
     jobListing = relationship("JobListingModel", back_populates="jobApplication")
     user = relationship("UserModel", back_populates="jobApplications")
+
+    # applicant lists page newest-first within a job
+    __table_args__ = (
+        Index("ix_job_application_job_applied", "jobId", "appliedAt", "applicationId"),
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import String
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import Boolean
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 from SQLModels.ResponsibilityModel import ResponsibilityModel  # noqa: F401
 from SQLModels.CompanyModel import CompanyModel  # noqa: F401
@@ -49,23 +50,33 @@ class JobListingModel(Base):
     )
     isDeleted = Column(Boolean, nullable=False, default=False)
 
+    # job board sorts (see JobListingMapper.JOB_SORTS) and common filters
+    __table_args__ = (
+        Index("ix_job_board_created", "isDeleted", "createdAt", "jobId"),
+        Index("ix_job_board_deadline", "isDeleted", "applicationDeadline", "jobId"),
+        Index("ix_job_board_salary", "isDeleted", "maxSalary", "jobId"),
+        Index("ix_job_company", "companyId", "isDeleted", "createdAt"),
+    )
+
+    # Relationships raise unless loaded explicitly: every query picks
+    # the loader options for its view (see JobListingMapper)
     # Foreign key to CompanyModel
-    company = relationship("CompanyModel", lazy="selectin")
+    company = relationship("CompanyModel", lazy="raise")
     fieldOfWork = relationship(
         "FieldOfWorkModel",
         back_populates="jobListing",
-        lazy="selectin",
+        lazy="raise",
     )
     # Relationship to JobApplicationModel
     responsibilities = relationship(
         "ResponsibilityModel",
         back_populates="jobListing",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     jobApplication = relationship(
         "JobApplicationModel",
         back_populates="jobListing",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
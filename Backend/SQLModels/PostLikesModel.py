@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.orm import relationship
 from .base import Base
 from datetime import datetime
@@ -14,6 +14,9 @@ class PostLikesModel(Base):
     accountId = Column(Integer, ForeignKey("Account.accountId"), nullable=False)
     postId = Column(Integer, ForeignKey("Post.postId"), nullable=False)
 
+    # one like per account per post; the like toggle depends on this
+    __table_args__ = (UniqueConstraint("postId", "accountId", name="_post_account_uc"),)
+
     # rs
     account = relationship("AccountModel", back_populates="postLikes")
     post = relationship("PostModel", back_populates="postLikes")
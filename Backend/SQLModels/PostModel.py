@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, and_
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, and_
 from sqlalchemy.orm import relationship
 from .base import Base
 from datetime import datetime
@@ -21,6 +21,18 @@ class PostModel(Base):
 
     isDeleted = Column(Integer, default=0, nullable=False)
 
+    # denormalised counters, kept in step by PostMapper/CommentMapper
+    # (`flask posts reconcile-counters` rebuilds them)
+    likeCount = Column(Integer, default=0, server_default="0", nullable=False)
+    commentCount = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # feed sorts: WHERE isDeleted = 0 ORDER BY <key> DESC, postId DESC
+    __table_args__ = (
+        Index("ix_post_feed_likes", "isDeleted", "likeCount", "postId"),
+        Index("ix_post_feed_comments", "isDeleted", "commentCount", "postId"),
+        Index("ix_post_feed_date", "isDeleted", "date", "postId"),
+    )
+
     # Relationship
     account = relationship("AccountModel", back_populates="posts")
     postLabels = relationship("PostLabelModel", back_populates="post")
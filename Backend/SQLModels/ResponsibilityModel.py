@@ -10,7 +10,7 @@ class ResponsibilityModel(Base):
     jobId = Column(Integer, ForeignKey("JobListing.jobId"), nullable=False)
     responsibility = Column(String, nullable=False)
     jobListing = relationship(
-        "JobListingModel", back_populates="responsibilities", lazy="selectin"
+        "JobListingModel", back_populates="responsibilities", lazy="raise"
     )
 
     def __repr__(self):
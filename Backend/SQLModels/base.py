@@ -1,17 +1,42 @@
 # Backend/SQLModels/DatabaseContext.py
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
+from contextvars import ContextVar
 import os
+import random
+import threading
 from typing import Optional, List, Dict, Any
 from sshtunnel import SSHTunnelForwarder
 from pathlib import Path
 import logging
+from SQLModels.pool import engine_options, install_idle_ping, pool_settings, pool_stats
+from Utils.StartupUtils import timed
 
 
 Base = declarative_base()
 
+# Read-your-writes state for the current request (reset by the app per
+# request): pinned sends readonly sessions to the primary, wrote records
+# that this request committed a write.
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+_wrote: ContextVar[bool] = ContextVar("wrote", default=False)
+
+
+def _mark_flush(session, flush_context):
+    session.info["wrote"] = True
+
+
+def _mark_dml(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["wrote"] = True
+
 
 class DatabaseContext:
     """
@@ -22,18 +47,28 @@ class DatabaseContext:
     def __init__(self):
         self.engine: Optional[object] = None
         self.SessionLocal: Optional[object] = None
+        self.replica_engines: List[object] = []
+        self.ReplicaSessions: List[object] = []
+        self.pool_settings: Dict[str, Any] = {}
         self.ssh_tunnel: Optional[object] = None
         self._is_initialized = False
+        self._init_lock = threading.Lock()
         self.connection_info = {}
-        self.initialize()  # Automatically initialize on instantiation
+        # connects on first use (get_session/get_engine), not at import,
+        # so importing the app (e.g. gunicorn --preload) stays cheap
 
     def initialize(self) -> bool:
         """Initialize database connection - equivalent to EF's OnConfiguring"""
         if self._is_initialized:
-            # print("→ Database context already initialized")
-            logging.info("→ Database context already initialized")
             return True
 
+        with self._init_lock:
+            if self._is_initialized:
+                return True
+            with timed("database"):
+                return self._initialize()
+
+    def _initialize(self) -> bool:
         try:
             # print("→ Initializing Database Context...")
             logging.info("→ Initializing Database Context...")
@@ -85,6 +120,16 @@ class DatabaseContext:
 
     def _setup_connection(self):
         """Setup SSH tunnel or direct connection"""
+        if os.getenv("DATABASE_URL"):
+            url = make_url(os.getenv("DATABASE_URL"))
+            self.connection_info = {
+                "host": url.host,
+                "port": url.port,
+                "connection_type": "URL",
+            }
+            logging.info(f"→ Using DATABASE_URL ({url.drivername})")
+            return
+
         use_ssh = os.environ.get("USE_SSH_TUNNEL", "False") in ("1", "true", "yes")
 
         if use_ssh:
@@ -120,7 +165,44 @@ class DatabaseContext:
             )
 
     def _create_engine(self):
-        """Create SQLAlchemy engine and session factory"""
+        """
+        Create the primary engine, any read replica engines
+        (DATABASE_REPLICA_URLS, comma separated) and their session factories
+        """
+        self.pool_settings = pool_settings()
+        self.engine = self._make_engine(
+            os.getenv("DATABASE_URL") or self._mysql_url()
+        )
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+        event.listen(self.SessionLocal, "after_flush", _mark_flush)
+        event.listen(self.SessionLocal, "do_orm_execute", _mark_dml)
+
+        replica_urls = [
+            u.strip()
+            for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+            if u.strip()
+        ]
+        self.replica_engines = [self._make_engine(u) for u in replica_urls]
+        self.ReplicaSessions = [
+            sessionmaker(autocommit=False, autoflush=False, bind=e)
+            for e in self.replica_engines
+        ]
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+    def _make_engine(self, url: str):
+        """Engine with the configured pool for one database URL"""
+        logging.info(
+            f"→ Creating engine: {make_url(url).render_as_string(hide_password=True)}"
+        )
+        engine = create_engine(url, echo=False, **engine_options(self.pool_settings))
+        if self.pool_settings["pre_ping"] == "idle":
+            install_idle_ping(engine, self.pool_settings["ping_idle"])
+        return engine
+
+    def _mysql_url(self) -> str:
+        """Connection string for the tunnel/container set up above"""
         db_credentials = {
             "user": os.getenv("MYSQL_USER"),
             "password": os.getenv("MYSQL_PASSWORD"),
@@ -132,27 +214,7 @@ class DatabaseContext:
             f"@{self.connection_info['host']}:{self.connection_info['port']}/{db_credentials['database']}"  # noqa: E501
         )
 
-        # print(
-        #     f"→ Creating engine: mysql+pymysql://{db_credentials['user']}\
-        #       :***@{self.connection_info['host']}:{self.connection_info['port']}/\
-        #         {db_credentials['database']}"
-        # )
-        logging.info(
-            f"→ Creating engine: mysql+pymysql://{db_credentials['user']}\
-                :***@{self.connection_info['host']}:{self.connection_info['port']}/\
-                    {db_credentials['database']}"
-        )
-        self.engine = create_engine(
-            connection_string,
-            echo=False,
-            pool_pre_ping=True,
-            pool_recycle=3600,  # Recycle connections every hour
-        )
-
-        self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
-        )
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+        return connection_string
 
     def _test_connection(self):
         """Test database connection"""
@@ -167,36 +229,73 @@ class DatabaseContext:
 
     def get_session(self):
         """Get a database session - equivalent to EF's DbContext"""
-        if not self._is_initialized:
-            raise RuntimeError(
-                "Database context not initialized. Call initialize() first."
-            )
+        self.initialize()
         return self.SessionLocal()
 
     def get_engine(self):
         """Get the SQLAlchemy engine"""
-        if not self._is_initialized:
-            raise RuntimeError(
-                "Database context not initialized. Call initialize() first."
-            )
+        self.initialize()
         return self.engine
 
     @contextmanager
-    def session_scope(self):
-        """Transactional scope - like EF's using(context) pattern"""
+    def session_scope(self, readonly: bool = False):
+        """
+        Transactional scope - like EF's using(context) pattern.
+        readonly=True may be served by a read replica (never committed);
+        it stays on the primary if no replica is configured or reads are
+        pinned there for read-your-writes.
+        """
+        self.initialize()
+        if readonly and self.ReplicaSessions and not _pinned_to_primary.get():
+            session = random.choice(self.ReplicaSessions)()
+            try:
+                yield session
+            finally:
+                session.rollback()
+                session.close()
+            return
+
         session = self.get_session()
         try:
             yield session
             session.commit()
+            if session.info.get("wrote"):
+                # later reads in this request must see the write too
+                _wrote.set(True)
+                _pinned_to_primary.set(True)
         except Exception:
             session.rollback()
             raise
         finally:
             session.close()
 
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.ReplicaSessions)
+
+    def begin_request(self, pin_to_primary: bool = False) -> None:
+        """
+        Reset read-your-writes state at the start of a request. Pin when
+        the client wrote recently, so its reads don't hit a lagging replica.
+        """
+        _pinned_to_primary.set(pin_to_primary)
+        _wrote.set(False)
+
+    def wrote_in_request(self) -> bool:
+        """Whether a primary session committed a write in this request"""
+        return _wrote.get()
+
+    @contextmanager
+    def primary_reads(self):
+        """Send readonly sessions to the primary inside this block"""
+        token = _pinned_to_primary.set(True)
+        try:
+            yield
+        finally:
+            _pinned_to_primary.reset(token)
+
     def create_database(self):
-        if not self._is_initialized:
-            raise RuntimeError("Database context not initialized.")
+        self.initialize()
 
         try:
             # print("→ Registering models...")
@@ -238,8 +337,7 @@ class DatabaseContext:
 
     def get_table_info(self, table_name: str) -> Optional[List[Dict[str, Any]]]:
         """Get table schema information"""
-        if not self._is_initialized:
-            raise RuntimeError("Database context not initialized.")
+        self.initialize()
 
         try:
             with self.session_scope() as session:
@@ -263,8 +361,7 @@ class DatabaseContext:
 
     def get_tables(self) -> List[str]:
         """Get list of all tables"""
-        if not self._is_initialized:
-            raise RuntimeError("Database context not initialized.")
+        self.initialize()
 
         with self.session_scope() as session:
             result = session.execute(text("SHOW TABLES"))
@@ -292,6 +389,25 @@ class DatabaseContext:
             ),
         }
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Connection pool counters for this worker"""
+        if not self.engine:
+            return {}
+        stats = pool_stats(self.engine)
+        if self.replica_engines:
+            stats["replicas"] = [pool_stats(e) for e in self.replica_engines]
+        return stats
+
+    def release_connections(self, close: bool = True) -> None:
+        """
+        Drop pooled connections but keep the context usable; new ones are
+        opened on demand. Call with close=False in a freshly forked worker
+        so it doesn't close sockets that still belong to the parent.
+        """
+        for engine in [self.engine, *self.replica_engines]:
+            if engine is not None:
+                engine.dispose(close=close)
+
     def dispose(self):
         """Dispose of resources - equivalent to EF's Dispose()"""
         logging.info("→ Disposing Database Context...")
@@ -299,6 +415,8 @@ class DatabaseContext:
         if self.engine:
             self.engine.dispose()
             logging.info("→ Database engine disposed")
+        for engine in self.replica_engines:
+            engine.dispose()
 
         if self.ssh_tunnel:
             self.ssh_tunnel.stop()
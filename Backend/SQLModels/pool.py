@@ -0,0 +1,213 @@
+# Backend/SQLModels/pool.py
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+# How a pooled connection is checked before use:
+#   always - SELECT 1 on every checkout (SQLAlchemy's pool_pre_ping)
+#   idle   - ping only connections idle longer than DB_POOL_PING_IDLE seconds
+#   never  - rely on pool_recycle and the retry in the caller
+PRE_PING_MODES = ("always", "idle", "never")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.lower() in ("1", "true", "yes")
+
+
+def pool_settings() -> Dict[str, Any]:
+    """
+    Pool configuration from the environment:
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_POOL_LIFO, DB_POOL_PRE_PING (always|idle|never), DB_POOL_PING_IDLE.
+
+    Every gunicorn worker (WEB_CONCURRENCY, default 4) has its own pool.
+    If DB_MAX_CONNECTIONS is set, size + overflow per worker is capped so
+    all workers together stay within it.
+    """
+    size = int(os.getenv("DB_POOL_SIZE", 5))
+    overflow = int(os.getenv("DB_MAX_OVERFLOW", 10))
+
+    budget = os.getenv("DB_MAX_CONNECTIONS")
+    if budget:
+        workers = max(1, int(os.getenv("WEB_CONCURRENCY", 4)))
+        perWorker = max(1, int(budget) // workers)
+        if size + overflow > perWorker:
+            size = min(size, perWorker)
+            overflow = perWorker - size
+            logging.info(
+                f"→ Pool capped to {size}+{overflow} per worker "
+                f"({budget} connections / {workers} workers)"
+            )
+
+    prePing = os.getenv("DB_POOL_PRE_PING", "idle").lower()
+    if prePing not in PRE_PING_MODES:
+        raise ValueError(f"DB_POOL_PRE_PING must be one of {PRE_PING_MODES}")
+
+    return {
+        "pool_size": size,
+        "max_overflow": overflow,
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 3600)),
+        "pool_use_lifo": _env_bool("DB_POOL_LIFO", True),
+        "pre_ping": prePing,
+        "ping_idle": float(os.getenv("DB_POOL_PING_IDLE", 30)),
+    }
+
+
+def engine_options(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """create_engine keyword arguments for `settings`."""
+    return {
+        "poolclass": MeteredQueuePool,
+        "pool_size": settings["pool_size"],
+        "max_overflow": settings["max_overflow"],
+        "pool_timeout": settings["pool_timeout"],
+        "pool_recycle": settings["pool_recycle"],
+        "pool_use_lifo": settings["pool_use_lifo"],
+        "pool_pre_ping": settings["pre_ping"] == "always",
+    }
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    QueuePool that counts checkouts, time spent waiting for a free
+    connection, timeouts, overflow use, reconnects and invalidations.
+    Counters are per process, like the pool itself.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # recreate() (engine.dispose) passes the old pool's listeners along
+        inherited = "_dispatch" in kwargs
+        super().__init__(*args, **kwargs)
+        self._metricsLock = threading.Lock()
+        self._counters = {
+            "checkouts": 0,
+            "checkoutMsTotal": 0.0,
+            "checkoutMsMax": 0.0,
+            "waits": 0,
+            "waitMsTotal": 0.0,
+            "timeouts": 0,
+            "overflowPeak": 0,
+            "connects": 0,
+            "invalidations": 0,
+            "pings": 0,
+            "pingFailures": 0,
+        }
+        if not inherited:
+            event.listen(self, "connect", self._onConnect)
+            event.listen(self, "checkin", self._onCheckin)
+            event.listen(self, "invalidate", self._onInvalidate)
+            event.listen(self, "soft_invalidate", self._onInvalidate)
+
+    def recreate(self):
+        # the inherited listeners write to our counters; keep them shared
+        pool = super().recreate()
+        pool._metricsLock = self._metricsLock
+        pool._counters = self._counters
+        return pool
+
+    def count(self, name: str, amount: float = 1) -> None:
+        with self._metricsLock:
+            self._counters[name] += amount
+
+    def _do_get(self):
+        # the base class blocks on the queue only when overflow is used up
+        willWait = (
+            self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+            and self._pool.empty()
+        )
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.count("timeouts")
+            raise
+        elapsed = (time.perf_counter() - start) * 1000
+
+        with self._metricsLock:
+            c = self._counters
+            c["checkouts"] += 1
+            c["checkoutMsTotal"] += elapsed
+            c["checkoutMsMax"] = max(c["checkoutMsMax"], elapsed)
+            if willWait:
+                c["waits"] += 1
+                c["waitMsTotal"] += elapsed
+            c["overflowPeak"] = max(c["overflowPeak"], self._overflow)
+        return record
+
+    def _onConnect(self, dbapiConnection, record):
+        record.info["checkedInAt"] = time.monotonic()
+        self.count("connects")
+
+    def _onCheckin(self, dbapiConnection, record):
+        record.info["checkedInAt"] = time.monotonic()
+
+    def _onInvalidate(self, dbapiConnection, record, exception):
+        self.count("invalidations")
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus the pool's current occupancy."""
+        with self._metricsLock:
+            counters = dict(self._counters)
+        checkouts = counters["checkouts"] or 1
+        counters["checkoutMsAvg"] = round(counters["checkoutMsTotal"] / checkouts, 3)
+        counters["checkoutMsTotal"] = round(counters["checkoutMsTotal"], 3)
+        counters["checkoutMsMax"] = round(counters["checkoutMsMax"], 3)
+        counters["waitMsTotal"] = round(counters["waitMsTotal"], 3)
+        counters.update(
+            {
+                "size": self.size(),
+                "checkedOut": self.checkedout(),
+                "idle": self.checkedin(),
+                "overflow": max(0, self.overflow()),
+                "maxOverflow": self._max_overflow,
+            }
+        )
+        return counters
+
+
+def install_idle_ping(engine, idleSeconds: float) -> None:
+    """
+    Ping a connection on checkout only if it sat idle for longer than
+    `idleSeconds`; a failed ping makes the pool discard it and connect
+    again. Recently used connections skip the round trip entirely.
+    """
+    pool = engine.pool
+
+    @event.listens_for(pool, "checkout")
+    def _ping_if_idle(dbapiConnection, record, proxy):
+        idleFor = time.monotonic() - record.info.get("checkedInAt", 0)
+        if idleFor < idleSeconds:
+            return
+        if isinstance(pool, MeteredQueuePool):
+            pool.count("pings")
+        try:
+            ping = getattr(dbapiConnection, "ping", None)
+            if ping is not None:
+                ping(reconnect=False)  # pymysql: COM_PING, no query
+            else:
+                cursor = dbapiConnection.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                finally:
+                    cursor.close()
+        except Exception as e:
+            if isinstance(pool, MeteredQueuePool):
+                pool.count("pingFailures")
+            raise exc.DisconnectionError(f"Idle connection failed ping: {e}")
+
+
+def pool_stats(engine) -> Dict[str, Any]:
+    """Pool counters for an engine, or just its status line if unmetered."""
+    pool = engine.pool
+    if isinstance(pool, MeteredQueuePool):
+        return pool.stats()
+    return {"status": pool.status()}
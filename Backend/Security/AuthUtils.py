@@ -1,10 +1,309 @@
+import multiprocessing
+import os
+import re
+import signal
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, Optional
+
 import bcrypt
 
+# bcrypt work factor for new hashes; existing hashes keep the cost they
+# were created with, since it's stored in the hash itself
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+# hashing runs in this many child processes per web worker (0 = inline)
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", 2))
+# calls queued or running in the pool before new ones are refused
+BCRYPT_MAX_PENDING = int(os.getenv("BCRYPT_MAX_PENDING", BCRYPT_WORKERS * 4))
+# seconds a caller waits for its result before giving up
+BCRYPT_TIMEOUT = float(os.getenv("BCRYPT_TIMEOUT", 5))
+
+# Hashes are standard modular-crypt bcrypt strings, "$2b$<cost>$<salt+hash>";
+# the scheme and cost prefix is the version that needs_rehash() compares.
+HASH_SCHEME = "2b"
+_HASH_PREFIX = re.compile(r"^\$(2[abxy]?)\$(\d{2})\$")
+
+
+class HasherBusy(Exception):
+    """The hashing pool is saturated; the caller should answer 503."""
+
+
+def _hashpw(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+
+def _init_worker():
+    # signals meant for the web worker shouldn't kill hashes mid-flight;
+    # the pool is shut down by its owner
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a small process pool so a burst of logins can't hold
+    every web worker on CPU. At most `maxPending` jobs may be queued or
+    running in the pool; beyond that callers get HasherBusy at once
+    instead of waiting behind the queue. A job's slot is freed when it
+    finishes or is cancelled, not when its caller stops waiting, so jobs
+    abandoned on timeout still count. With `workers=0` bcrypt runs inline.
+    """
+
+    def __init__(self, workers: int, maxPending: int, timeout: float, rounds: int):
+        self.workers = workers
+        self.maxPending = max(1, maxPending)
+        self.timeout = timeout
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        # rehash threads started and not yet finished, in either mode
+        self._rehashing = 0
+        self.maxRehashing = max(1, self.maxPending // 2)
+        self._counters = {
+            "hashes": 0,
+            "verifies": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "poolRestarts": 0,
+            "rehashes": 0,
+            "rehashSkipped": 0,
+            "rehashFailed": 0,
+            "msTotal": 0.0,
+            "msMax": 0.0,
+        }
+
+    def hash(self, password: str, rounds: Optional[int] = None) -> str:
+        hashed = self._run(
+            "hashes", _hashpw, password.encode("utf-8"), rounds or self.rounds
+        )
+        return hashed.decode("utf-8")
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self._run(
+            "verifies", _checkpw, password.encode("utf-8"), hashed.encode("utf-8")
+        )
+
+    def _run(self, kind: str, fn, *args):
+        start = time.perf_counter()
+        if self.workers <= 0:
+            result = fn(*args)
+            self._record(kind, start)
+            return result
+
+        with self._lock:
+            if self._pending >= self.maxPending:
+                self._counters["rejected"] += 1
+                raise HasherBusy("Password hashing is at capacity")
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException as e:
+            self._release()
+            if isinstance(e, BrokenProcessPool):
+                self._reset()
+                raise HasherBusy("Password hashing pool restarted")
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            result = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            # drop the job if it hasn't started; a running one keeps its
+            # slot until it finishes
+            future.cancel()
+            self._incr("timeouts")
+            raise HasherBusy("Password hashing timed out")
+        except BrokenProcessPool:
+            self._reset()
+            raise HasherBusy("Password hashing pool restarted")
+        self._record(kind, start)
+        return result
+
+    def _release(self, future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def rehash_in_background(
+        self, password: str, oldHash: str, save: Callable[[str, str], bool]
+    ) -> bool:
+        """
+        Hash `password` at the current cost on a background thread and
+        hand (oldHash, newHash) to `save`. Skipped when the pool is half
+        full or `maxRehashing` rehashes are already running, so upgrades
+        never compete with logins and inline mode can't pile up threads;
+        the next login retries. Returns False if skipped.
+        """
+        with self._lock:
+            if self._rehashing >= self.maxRehashing or (
+                self.workers > 0 and self._pending >= self.maxPending // 2
+            ):
+                self._counters["rehashSkipped"] += 1
+                return False
+            self._rehashing += 1
+
+        def run():
+            try:
+                newHash = self.hash(password)
+                if save(oldHash, newHash):
+                    self._incr("rehashes")
+                else:
+                    self._incr("rehashFailed")
+            except HasherBusy:
+                self._incr("rehashSkipped")
+            except Exception as e:
+                print(f"Password rehash failed: {e}")
+                self._incr("rehashFailed")
+            finally:
+                with self._lock:
+                    self._rehashing -= 1
+
+        threading.Thread(target=run, name="bcrypt-rehash", daemon=True).start()
+        return True
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # a pool created before a fork belongs to the parent
+        pid = os.getpid()
+        if self._executor is None or self._pid != pid:
+            with self._lock:
+                if self._executor is None or self._pid != pid:
+                    # web workers run background threads (log shipper,
+                    # rehashes); forking one of them isn't safe
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                        initializer=_init_worker,
+                    )
+                    self._pid = pid
+        return self._executor
+
+    def _reset(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._counters["poolRestarts"] += 1
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop this process's pool; the next call starts a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _record(self, kind: str, start: float) -> None:
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            c = self._counters
+            c[kind] += 1
+            c["msTotal"] += elapsed
+            c["msMax"] = max(c["msMax"], elapsed)
+
+    def _incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def stats(self) -> Dict[str, object]:
+        """Call counts, latency including queueing, and current occupancy."""
+        with self._lock:
+            counters = dict(self._counters)
+            counters["pending"] = self._pending
+            counters["rehashing"] = self._rehashing
+        calls = (counters["hashes"] + counters["verifies"]) or 1
+        counters["msAvg"] = round(counters["msTotal"] / calls, 3)
+        counters["msTotal"] = round(counters["msTotal"], 3)
+        counters["msMax"] = round(counters["msMax"], 3)
+        counters.update(
+            {
+                "workers": self.workers,
+                "maxPending": self.maxPending,
+                "maxRehashing": self.maxRehashing,
+                "rounds": self.rounds,
+            }
+        )
+        return counters
+
+
+hasher = PasswordHasher(
+    workers=BCRYPT_WORKERS,
+    maxPending=BCRYPT_MAX_PENDING,
+    timeout=BCRYPT_TIMEOUT,
+    rounds=BCRYPT_ROUNDS,
+)
+
 
 def hash_password(password: str) -> str:
-    HashedPassword = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-    return HashedPassword.decode("utf-8")
+    """bcrypt hash of `password`. Raises HasherBusy if the pool is full."""
+    return hasher.hash(password)
 
 
 def verify_hash_password(password: str, hashPassword: str) -> bool:
-    return bcrypt.checkpw(password.encode("utf-8"), hashPassword.encode("utf-8"))
+    """Check `password` against a bcrypt hash. Raises HasherBusy if full."""
+    return hasher.verify(password, hashPassword)
+
+
+def stats() -> Dict[str, object]:
+    return hasher.stats()
+
+
+def hash_cost(hashPassword: str) -> Optional[int]:
+    """Cost factor encoded in a bcrypt hash, or None if it isn't one."""
+    match = _HASH_PREFIX.match(hashPassword or "")
+    return int(match.group(2)) if match else None
+
+
+def needs_rehash(hashPassword: str, rounds: Optional[int] = None) -> bool:
+    """
+    True if the hash uses another bcrypt variant or a cost other than
+    `rounds` (BCRYPT_ROUNDS by default), so lowering the cost migrates
+    accounts too.
+    """
+    match = _HASH_PREFIX.match(hashPassword or "")
+    if not match:
+        return True
+    return match.group(1) != HASH_SCHEME or int(match.group(2)) != (
+        rounds or hasher.rounds
+    )
+
+
+def rehash_in_background(
+    password: str, oldHash: str, save: Callable[[str, str], bool]
+) -> bool:
+    """Upgrade a verified password's hash without delaying the caller."""
+    return hasher.rehash_in_background(password, oldHash, save)
+
+
+def benchmark(rounds: Iterable[int], samples: int = 3) -> Dict[int, float]:
+    """
+    Median milliseconds for one bcrypt verify at each cost, measured
+    inline on this host. Stops after the first cost slower than 5 s,
+    since each step doubles the time.
+    """
+    password = b"benchmark-password"
+    results = {}
+    for cost in rounds:
+        hashed = bcrypt.hashpw(password, bcrypt.gensalt(cost))
+        timings = []
+        for _ in range(max(1, samples)):
+            start = time.perf_counter()
+            bcrypt.checkpw(password, hashed)
+            timings.append((time.perf_counter() - start) * 1000)
+        results[cost] = round(statistics.median(timings), 3)
+        if results[cost] > 5000:
+            break
+    return results
+
+
+def calibrate_rounds(timings: Dict[int, float], targetMs: float) -> int:
+    """Highest benchmarked cost whose verify fits in `targetMs`."""
+    fitting = [cost for cost, ms in timings.items() if ms <= targetMs]
+    return max(fitting) if fitting else min(timings)
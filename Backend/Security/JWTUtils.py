@@ -1,9 +1,79 @@
+import hashlib
 import jwt
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from flask import request
+from flask import g, request
 import uuid
 
+# verified claims kept per process, keyed by the token's SHA-256 digest
+CLAIMS_CACHE_SIZE = int(os.getenv("JWT_CLAIMS_CACHE_SIZE", 4096))
+
+
+class ClaimsCache:
+    """
+    Bounded LRU of decoded, verified token claims. An entry lives no
+    longer than the token itself would verify: until the earlier of `exp`
+    and `origIat` + the maximum lifetime. The same token bytes always
+    verify the same way, so a hit is as good as a fresh decode; session
+    revocation is checked separately against the account's session id.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, key: bytes):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            claims, expiresAt = entry
+            if time.time() >= expiresAt:
+                del self._entries[key]
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+        # callers may modify what they get back
+        return dict(claims)
+
+    def put(self, key: bytes, claims: dict, expiresAt: float) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (dict(claims), expiresAt)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+            counters["size"] = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hitRate"] = round(counters["hits"] / lookups, 3) if lookups else 0.0
+        counters["maxSize"] = self.maxsize
+        return counters
+
+
+_claims_cache = ClaimsCache(CLAIMS_CACHE_SIZE)
+
 
 class JWTUtils:
     SECRET_KEY = os.getenv("JWT_SECRET")
@@ -46,7 +116,23 @@ class JWTUtils:
 
     @staticmethod
     def decode_jwt_token(token: str) -> dict:
+        """
+        Verified claims for `token`, from the per-process cache when this
+        token was verified before. Raises jwt.PyJWTError if invalid.
+        """
+        key = ClaimsCache.key(token)
+        claims = _claims_cache.get(key)
+        if claims is not None:
+            return claims
+
+        claims = JWTUtils._verify(token)
+        orig = datetime.fromisoformat(claims["origIat"])
+        expiresAt = min(claims["exp"], (orig + JWTUtils.EXPIRATION).timestamp())
+        _claims_cache.put(key, claims, expiresAt)
+        return claims
 
+    @staticmethod
+    def _verify(token: str) -> dict:
         data = jwt.decode(
             token,
             JWTUtils.SECRET_KEY,
@@ -65,6 +151,28 @@ class JWTUtils:
 
         return data
 
+    @staticmethod
+    def get_request_claims():
+        """
+        Claims of the current request's session cookie, decoded once per
+        request and kept on ``g.claims``; None without a cookie.
+        Raises jwt.PyJWTError if the token is invalid.
+        """
+        if "claims" not in g:
+            token = JWTUtils.get_token_from_cookie()
+            g.claims = JWTUtils.decode_jwt_token(token) if token else None
+        return g.claims
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """Hit/miss counters for the verified-claims cache."""
+        return _claims_cache.stats()
+
+    @staticmethod
+    def clear_claims_cache() -> None:
+        """Forget every cached verification, e.g. after rotating the key."""
+        _claims_cache.clear()
+
     @staticmethod
     def set_auth_cookie(response, token: str, name: str = "session_token"):
         expires = datetime.now(timezone.utc) + JWTUtils.EXPIRATION
@@ -3,6 +3,8 @@ from flask_limiter.util import get_remote_address
 from flask import request
 import redis
 import os
+import threading
+from Utils.StartupUtils import timed
 
 # Flask-Limiter Setup
 limiter = Limiter(
@@ -19,15 +21,35 @@ def get_register_key():
     return email or get_remote_address()
 
 
+_redis = None
+_redis_lock = threading.Lock()
+
+
+def get_redis() -> redis.Redis:
+    """
+    Shared Redis client, created on first use. redis-py opens connections
+    lazily and resets its pool after a fork, so one client per process is
+    safe with gunicorn --preload.
+    """
+    global _redis
+    if _redis is None:
+        with _redis_lock:
+            if _redis is None:
+                with timed("redis"):
+                    _redis = redis.Redis(
+                        host=os.getenv("REDIS_HOST", "localhost"),
+                        port=6379,
+                        decode_responses=True,
+                    )
+    return _redis
+
+
 # /login
-r = redis.Redis(
-    host=os.getenv("REDIS_HOST", "localhost"), port=6379, decode_responses=True
-)
 
 
 def get_failed_attempts_count(email: str) -> int:
     key = f"failcount:{email}"
-    count_str = r.get(key)
+    count_str = get_redis().get(key)
     if count_str:
         return int(count_str)
     return 0
@@ -35,12 +57,13 @@ def get_failed_attempts_count(email: str) -> int:
 
 def is_locked(email: str) -> bool:
     """Check if the user is locked due to failed login attempts."""
-    return r.exists(f"lockout:{email}")
+    return get_redis().exists(f"lockout:{email}")
 
 
 def increment_failed_attempts(email: str) -> int:
     """Increase failed attempt count and lock account if needed."""
     key = f"failcount:{email}"
+    r = get_redis()
     count = r.incr(key)
     r.expire(key, 3600)  # expire fail count in 1 hour
 
@@ -52,8 +75,7 @@ def increment_failed_attempts(email: str) -> int:
 
 def reset_login_attempts(email: str):
     """Clear failure and lockout state on successful login."""
-    r.delete(f"failcount:{email}")
-    r.delete(f"lockout:{email}")
+    get_redis().delete(f"failcount:{email}", f"lockout:{email}")
 
 
 # get account ID
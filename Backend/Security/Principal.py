@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Optional
+
+import jwt
+from flask import abort, current_app, g
+
+from Security import SessionCache
+from Security.JWTUtils import JWTUtils
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller, built once per request from the session."""
+
+    accountId: int
+    role: str
+    name: Optional[str] = None
+    profilePicUrl: Optional[str] = None
+    userId: Optional[int] = None
+    companyId: Optional[int] = None
+    verified: Optional[bool] = None
+    jti: Optional[str] = None
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "Principal":
+        return cls(
+            accountId=claims["sub"],
+            role=claims.get("role"),
+            name=claims.get("name"),
+            profilePicUrl=claims.get("profilePicUrl"),
+            userId=claims.get("userId"),
+            companyId=claims.get("companyId"),
+            verified=claims.get("verified"),
+            jti=claims.get("jti"),
+        )
+
+    def has_role(self, *roles) -> bool:
+        return self.role in {getattr(r, "value", r) for r in roles}
+
+
+def init_app(app, sessionLoader: Callable[[int], Optional[dict]]) -> None:
+    """
+    Register the loader for an account's session binding
+    ({"sessionId", "isDisabled"} or None), looked up through SessionCache.
+    """
+    app.extensions["principal"] = sessionLoader
+
+
+def authenticate_request() -> Optional[str]:
+    """
+    Decode the session cookie and check its jti against the account's
+    current session binding, once per request. On success ``g.principal``
+    is the caller; otherwise it is None.
+    :return: error message, or None if the session is valid or absent.
+    """
+    if "session_error" in g:
+        return g.session_error
+
+    g.principal = None
+    g.session_error = None
+    try:
+        claims = JWTUtils.get_request_claims()
+    except jwt.PyJWTError:
+        g.session_error = "Invalid or expired token"
+        return g.session_error
+    if claims is None:
+        return None
+
+    state = SessionCache.get_session_state(
+        claims.get("sub"), current_app.extensions["principal"]
+    )
+    if state is None or state["isDisabled"] or claims.get("jti") != state["sessionId"]:
+        g.session_error = "Session invalidated; please log in again"
+    else:
+        g.principal = Principal.from_claims(claims)
+    return g.session_error
+
+
+def current_principal() -> Optional[Principal]:
+    """The authenticated caller, or None for anonymous/invalid sessions."""
+    authenticate_request()
+    return g.principal
+
+
+def login_required(view):
+    """Abort 401 unless the request carries a valid session."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_principal() is None:
+            abort(401, description=g.session_error or "Authentication required")
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+def roles_required(*roles, message: str = "Forbidden"):
+    """Abort 401 without a session and 403 unless the role is in `roles`."""
+
+    def decorator(view):
+        @wraps(view)
+        @login_required
+        def wrapper(*args, **kwargs):
+            if not g.principal.has_role(*roles):
+                abort(403, description=message)
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def owner_required(
+    param: str, attr: str = "accountId", message: str = "Forbidden", allow=()
+):
+    """
+    Abort 403 unless the view argument `param` equals the principal's
+    `attr` (accountId, userId or companyId). Roles in `allow` may act on
+    anyone's behalf.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        @login_required
+        def wrapper(*args, **kwargs):
+            principal = g.principal
+            owner = getattr(principal, attr)
+            if (owner is None or kwargs.get(param) != owner) and not (
+                allow and principal.has_role(*allow)
+            ):
+                abort(403, description=message)
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+from typing import Callable, Optional
+
+import redis
+
+from Security.Limiter import get_redis
+
+# jti binding per account, shared by every gunicorn worker through Redis.
+# Writers overwrite the binding after commit, so this TTL only bounds how
+# long a binding survives a failed Redis write.
+SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", 60))
+# generation counters outlive the bindings they guard
+_GENERATION_TTL = 86400
+
+
+def _key(account_id: int) -> str:
+    return f"session:{account_id}"
+
+
+def _generation_key(account_id: int) -> str:
+    return f"session:gen:{account_id}"
+
+
+def _fill(account_id: int, state: dict, generation: Optional[bytes]) -> None:
+    """
+    Cache a binding read from the database, unless a writer published a
+    newer one since `generation` was read. Never overwrites a key.
+    """
+    genKey = _generation_key(account_id)
+    with get_redis().pipeline() as pipe:
+        try:
+            pipe.watch(genKey)
+            if pipe.get(genKey) != generation:
+                return
+            pipe.multi()
+            pipe.set(_key(account_id), json.dumps(state), ex=SESSION_CACHE_TTL, nx=True)
+            pipe.execute()
+        except redis.WatchError:
+            pass  # a writer got in first; its binding is the current one
+
+
+def get_session_state(
+    account_id: int, loader: Callable[[int], Optional[dict]]
+) -> Optional[dict]:
+    """
+    Return the cached session binding for an account, calling `loader`
+    on a miss and caching its result.
+    Falls through to `loader` if Redis is unavailable.
+    """
+    try:
+        cached, generation = get_redis().mget(
+            _key(account_id), _generation_key(account_id)
+        )
+    except redis.RedisError:
+        return loader(account_id)
+
+    if cached is not None:
+        return json.loads(cached)
+
+    state = loader(account_id)
+    if state is not None:
+        try:
+            _fill(account_id, state, generation)
+        except redis.RedisError as e:
+            logging.warning(f"Failed to cache session for {account_id}: {e}")
+    return state
+
+
+def publish_session(account_id: int, state: dict) -> None:
+    """
+    Replace the cached binding with `state` after the write that changed
+    it has committed. Bumping the generation stops readers that loaded
+    the old row from writing it back.
+    """
+    try:
+        pipe = get_redis().pipeline()
+        pipe.incr(_generation_key(account_id))
+        pipe.expire(_generation_key(account_id), _GENERATION_TTL)
+        pipe.set(_key(account_id), json.dumps(state), ex=SESSION_CACHE_TTL)
+        pipe.execute()
+    except redis.RedisError as e:
+        logging.error(f"Failed to publish session for {account_id}: {e}")
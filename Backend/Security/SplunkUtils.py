@@ -2,11 +2,255 @@ import os
 import requests
 import json
 import socket
+import atexit
+import queue
+import threading
+import time
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+class HECShipper:
+    """
+    Background shipper for the Splunk HTTP Event Collector.
+
+    Events are put on a bounded in-memory queue and a daemon thread sends them
+    as multi-event HEC payloads over one pooled, keep-alive session. A batch is
+    flushed once it reaches ``batch_size`` events or ``flush_interval`` seconds
+    after its first event, whichever comes first. When the queue is full the
+    event is either dropped or appended to ``spill_path`` (JSON lines),
+    depending on ``overflow``.
+    """
+
+    def __init__(
+        self,
+        hec_url: str,
+        token: str,
+        queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 2.0,
+        timeout: float = 5.0,
+        overflow: str = "drop",
+        spill_path: str | None = None,
+        pool_size: int = 2,
+        verify: bool = False,
+    ):
+        if overflow not in ("drop", "spill"):
+            raise ValueError("overflow must be 'drop' or 'spill'")
+        if overflow == "spill" and not spill_path:
+            raise ValueError("spill_path is required when overflow is 'spill'")
+
+        self.hec_url = hec_url
+        self.token = token
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.overflow = overflow
+        self.spill_path = spill_path
+        self.pool_size = pool_size
+        self.verify = verify
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._stopped = False
+        self._counters = {
+            "queued": 0,
+            "sent": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "Authorization": f"Splunk {self.token}",
+                "Content-Type": "application/json",
+            }
+        )
+        return session
+
+    # ─────────── Public API ───────────
+    def enqueue(self, payload: dict) -> bool:
+        """
+        Queue one HEC event without blocking.
+        Returns False when the event had to be dropped or spilled.
+        """
+        if self._stopped:
+            self._overflow([payload])
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self._overflow([payload])
+            return False
+        self._incr("queued")
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Send everything queued so far.
+        Returns True if the worker drained the queue within `timeout` seconds.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the worker thread."""
+        self.flush(timeout)
+        self._stopped = True
+        if self._thread is not None and self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self._thread.join(timeout)
+        self.session.close()
+
+    def stats(self) -> dict:
+        """
+        Counters since the shipper was created. Events: `queued`, `sent`,
+        and `dropped` or `spilled` when they couldn't be queued or
+        delivered. Requests: `batches` posted successfully and `failed`
+        posts, whose events are also counted as dropped or spilled.
+        `pending` is the current queue depth.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        counters["pending"] = self._queue.qsize()
+        return counters
+
+    # ─────────── Worker ───────────
+    def _ensure_started(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            running = self._thread is not None and self._thread.is_alive()
+            if self._pid == pid and running:
+                return
+            if self._pid is not None and self._pid != pid:
+                # Forked (e.g. gunicorn --preload): the parent's thread, queue
+                # and sockets are not ours, start again from a clean slate.
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self.session = self._create_session()
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="splunk-hec-shipper", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        batch: list[dict] = []
+        deadline = None
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = False  # flush interval elapsed
+
+            if item is None:  # stop sentinel
+                self._send(batch)
+                return
+
+            if isinstance(item, threading.Event):
+                self._send(batch)
+                batch, deadline = [], None
+                item.set()
+                continue
+
+            if item is not False:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or item is False
+                or time.monotonic() >= deadline
+            ):
+                self._send(batch)
+                batch, deadline = [], None
+
+    def _send(self, batch: list[dict]) -> None:
+        if not batch:
+            return
+        body = "".join(json.dumps(event, default=str) for event in batch)
+        try:
+            response = self.session.post(
+                self.hec_url, data=body, verify=self.verify, timeout=self.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            print(f"[SplunkLogger] Failed to send {len(batch)} log(s) to Splunk: {e}")
+            self._incr("failed")
+            self._overflow(batch)
+            return
+        self._incr("sent", len(batch))
+        self._incr("batches")
+
+    def _overflow(self, events: list[dict]) -> None:
+        if self.overflow == "spill":
+            try:
+                with self._spill_lock, open(self.spill_path, "a") as fh:
+                    for event in events:
+                        fh.write(json.dumps(event, default=str) + "\n")
+                self._incr("spilled", len(events))
+                return
+            except OSError as e:
+                print(f"[SplunkLogger] Failed to spill logs to disk: {e}")
+        self._incr("dropped", len(events))
+
+    def _incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+
+_shipper: HECShipper | None = None
+_shipper_lock = threading.Lock()
+
+
+def get_shipper() -> HECShipper:
+    """Process-wide shipper shared by every SplunkLogger instance."""
+    global _shipper
+    if _shipper is None:
+        with _shipper_lock:
+            if _shipper is None:
+                _shipper = HECShipper(
+                    hec_url=os.getenv("SPLUNK_HEC_URL"),
+                    token=os.getenv("SPLUNK_HEC_TOKEN"),
+                    queue_size=int(os.getenv("SPLUNK_QUEUE_SIZE", 10000)),
+                    batch_size=int(os.getenv("SPLUNK_BATCH_SIZE", 100)),
+                    flush_interval=float(os.getenv("SPLUNK_FLUSH_INTERVAL", 2.0)),
+                    timeout=float(os.getenv("SPLUNK_TIMEOUT", 5.0)),
+                    overflow=os.getenv("SPLUNK_OVERFLOW", "drop").lower(),
+                    spill_path=os.getenv("SPLUNK_SPILL_PATH"),
+                )
+                atexit.register(_shipper.close)
+    return _shipper
+
+
 class SplunkLogger:
     def __init__(self):
         self.hec_url = os.getenv("SPLUNK_HEC_URL")
@@ -23,30 +267,32 @@ class SplunkLogger:
         return request.remote_addr
 
     def send_log(self, event_data):
-        headers = {
-            "Authorization": f"Splunk {self.token}",
-            "Content-Type": "application/json",
-        }
+        """
+        Queue an event for the background shipper; never blocks the request.
+        """
+        if not self.hec_url:
+            if self.debug:
+                print(f"[SplunkLogger] SPLUNK_HEC_URL not set, dropping: {event_data}")
+            return
 
         payload = {
             "event": event_data,
+            "time": time.time(),
             "source": self.source,
             "sourcetype": self.sourcetype,
             "host": self.hostname,
         }
 
-        try:
-            response = requests.post(
-                self.hec_url,
-                data=json.dumps(payload),
-                headers=headers,
-                verify=False,
-                timeout=60,
-            )
+        queued = get_shipper().enqueue(payload)
 
-            if self.debug:
-                print(f"[SplunkLogger] Log sent to Splunk: {payload}")
-                print(f"[SplunkLogger] Response status code: {response.status_code}")
+        if self.debug:
+            print(f"[SplunkLogger] Log queued for Splunk: {payload}")
+            if not queued:
+                print("[SplunkLogger] Queue full, log dropped or spilled")
 
-        except Exception as e:
-            print(f"[SplunkLogger] Failed to send log to Splunk: {e}")
+    @staticmethod
+    def stats() -> dict:
+        """Counters for queued, sent, dropped and spilled events."""
+        if _shipper is None:
+            return {}
+        return _shipper.stats()
@@ -4,9 +4,15 @@ import io
 import base64
 import re
 from cryptography.fernet import Fernet
+from functools import lru_cache
 import os
 
-fernet = Fernet(os.getenv("FERNET_KEY").encode())
+
+@lru_cache(maxsize=1)
+def get_fernet() -> Fernet:
+    """Fernet for 2FA secrets, built on first use so FERNET_KEY is only
+    required once 2FA is actually used."""
+    return Fernet(os.getenv("FERNET_KEY").encode())
 
 
 def create_qrcode(email: str):
@@ -23,7 +29,7 @@ def create_qrcode(email: str):
     img.save(buf)
     img_b64 = base64.b64encode(buf.getvalue()).decode("utf-8")
 
-    encrypted_secret = fernet.encrypt(secret.encode()).decode()
+    encrypted_secret = get_fernet().encrypt(secret.encode()).decode()
 
     return {"qr_code": img_b64, "secret": encrypted_secret}
 
@@ -35,7 +41,7 @@ def validate2FA(code: str, encrypted_secret: str):
     if not re.fullmatch(r"\d{6}", code):
         return {"verified": False, "error": "Invalid code format"}, 400
 
-    secret = fernet.decrypt(encrypted_secret.encode()).decode()
+    secret = get_fernet().decrypt(encrypted_secret.encode()).decode()
     totp = pyotp.TOTP(secret)
 
     if totp.verify(code):
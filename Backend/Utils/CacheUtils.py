@@ -0,0 +1,144 @@
+import json
+import os
+import secrets
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+import redis
+
+from Security.Limiter import get_redis
+from SQLModels.base import db_context
+
+# Read-through JSON cache in Redis with versioned invalidation.
+# Writers bump a namespace version instead of deleting keys; readers build
+# keys from the current version, so stale entries are never read again and
+# simply expire.
+CACHE_TTL = int(os.getenv("CACHE_TTL", 60))
+# how long a loader may hold the rebuild lock before another worker retries
+CACHE_LOCK_TTL = int(os.getenv("CACHE_LOCK_TTL", 5))
+# how long a worker waits for someone else's rebuild before loading itself
+# (uncached); kept short since a sync worker blocks for all of it
+CACHE_LOCK_WAIT = float(os.getenv("CACHE_LOCK_WAIT", 0.3))
+
+# delete the rebuild lock only if it still holds our token; once it has
+# expired another worker may own it
+_RELEASE_LOCK = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+@lru_cache(maxsize=1)
+def _release_lock_script() -> "redis.commands.core.Script":
+    """The release script, registered once; pass the client when calling."""
+    return get_redis().register_script(_RELEASE_LOCK)
+
+
+def _version_key(namespace: str) -> str:
+    return f"cache:ver:{namespace}"
+
+
+def get_version(namespace: str) -> int:
+    """Current version of a namespace (0 if never bumped)."""
+    return int(get_redis().get(_version_key(namespace)) or 0)
+
+
+def versioned_key(namespace: str, *parts: Any) -> str:
+    """
+    Build a cache key under the namespace's current version.
+    Raises redis.RedisError if Redis is unavailable.
+    """
+    suffix = ":".join(str(p) for p in parts)
+    return f"cache:{namespace}:v{get_version(namespace)}:{suffix}"
+
+
+def bump_version(*namespaces: str) -> None:
+    """
+    Invalidate everything cached under the given namespaces.
+    Call after the write has committed.
+    """
+    try:
+        pipe = get_redis().pipeline()
+        for namespace in namespaces:
+            pipe.incr(_version_key(namespace))
+        pipe.execute()
+    except redis.RedisError as e:
+        print(f"Failed to bump cache version for {namespaces}: {e}")
+
+
+def get_many(keys: List[str]) -> Dict[str, Any]:
+    """
+    Decoded values for the keys present in the cache (one MGET).
+    Raises redis.RedisError if Redis is unavailable.
+    """
+    if not keys:
+        return {}
+    values = get_redis().mget(keys)
+    return {k: json.loads(v) for k, v in zip(keys, values) if v is not None}
+
+
+def set_many(values: Dict[str, Any], ttl: int = CACHE_TTL) -> None:
+    """Cache several JSON values in one round trip; errors are ignored."""
+    if not values:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for k, v in values.items():
+            pipe.set(k, json.dumps(v), ex=ttl)
+        pipe.execute()
+    except redis.RedisError as e:
+        print(f"Failed to cache {len(values)} value(s): {e}")
+
+
+def cached(
+    key: Callable[[], str],
+    loader: Callable[[], Any],
+    ttl: int = CACHE_TTL,
+) -> Any:
+    """
+    Return the JSON value cached under `key()`, calling `loader` on a miss.
+    Only one worker rebuilds a missing key at a time (SET NX lock); the
+    others wait briefly for its result instead of all hitting the database.
+    None results are not cached. Falls through to `loader` if Redis is
+    unavailable.
+    Loads that will be cached read from the primary database: a replica
+    that hasn't caught up with the write behind the version bump would
+    otherwise be served to everyone until the entry expires.
+    """
+    r = get_redis()
+    try:
+        cache_key = key()
+        hit = r.get(cache_key)
+        if hit is not None:
+            return json.loads(hit)
+
+        lock_key = f"{cache_key}:lock"
+        token = secrets.token_hex(16)
+        if not r.set(lock_key, token, nx=True, ex=CACHE_LOCK_TTL):
+            deadline = time.monotonic() + CACHE_LOCK_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                hit = r.get(cache_key)
+                if hit is not None:
+                    return json.loads(hit)
+            return loader()
+    except redis.RedisError:
+        return loader()
+
+    try:
+        with db_context.primary_reads():
+            value = loader()
+        if value is not None:
+            try:
+                r.set(cache_key, json.dumps(value), ex=ttl)
+            except redis.RedisError:
+                pass
+        return value
+    finally:
+        try:
+            _release_lock_script()(keys=[lock_key], args=[token], client=r)
+        except redis.RedisError:
+            pass  # the lock expires on its own
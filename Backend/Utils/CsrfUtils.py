@@ -1,10 +1,107 @@
+import base64
 import hmac
 import hashlib
 import secrets
+import struct
+import threading
 import time
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional
 
+# Token format v1: "v1." + urlsafe base64 (no padding) of
+#   version(1) | issued-at(4, big endian) | nonce(16) | session digest(16)
+#   | HMAC-SHA256 of everything before it(32)
+# The session digest is the first 16 bytes of SHA-256(session_id), or
+# zeros for tokens not bound to a session. Tokens without the "v1."
+# prefix are the older base64 "timestamp|session|random|hexsig" format,
+# still accepted until they expire.
+TOKEN_PREFIX = "v1."
+TOKEN_VERSION = 1
+_HEADER = struct.Struct(">BI")
+_NONCE_BYTES = 16
+_DIGEST_BYTES = 16
+_MAC_BYTES = 32
+_BODY_BYTES = _HEADER.size + _NONCE_BYTES + _DIGEST_BYTES
+_UNBOUND = bytes(_DIGEST_BYTES)
+
+# verified (secure, public, session) triples kept per process
+CSRF_VERIFIED_CACHE_SIZE = int(os.getenv("CSRF_VERIFIED_CACHE_SIZE", 2048))
+
+
+@lru_cache(maxsize=1)
+def _keyed_hmac() -> "hmac.HMAC":
+    """HMAC-SHA256 keyed with the CSRF secret; copy() it per message."""
+    return hmac.new(CsrfUtils.get_csrf_secret().encode(), digestmod=hashlib.sha256)
+
+
+def _mac(message: bytes) -> bytes:
+    mac = _keyed_hmac().copy()
+    mac.update(message)
+    return mac.digest()
+
+
+def _session_digest(session_id: Optional[str]) -> bytes:
+    if not session_id:
+        return _UNBOUND
+    return hashlib.sha256(session_id.encode()).digest()[:_DIGEST_BYTES]
+
+
+class _VerifiedTokens:
+    """Bounded LRU of token pairs that already passed validation."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "validations": 0,
+            "cacheHits": 0,
+            "legacy": 0,
+            "failures": 0,
+        }
+
+    def get(self, key: bytes) -> bool:
+        with self._lock:
+            self._counters["validations"] += 1
+            expiresAt = self._entries.get(key)
+            if expiresAt is None:
+                return False
+            if time.time() >= expiresAt:
+                del self._entries[key]
+                return False
+            self._entries.move_to_end(key)
+            self._counters["cacheHits"] += 1
+            return True
+
+    def put(self, key: bytes, expiresAt: float) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = expiresAt
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+            counters["size"] = len(self._entries)
+        counters["maxSize"] = self.maxsize
+        return counters
+
+
+_verified = _VerifiedTokens(CSRF_VERIFIED_CACHE_SIZE)
+
 
 class CsrfUtils:
     @staticmethod
@@ -15,42 +112,83 @@ class CsrfUtils:
             raise ValueError("CSRF_SECRET_KEY environment variable is required")
         return secret
 
+    @staticmethod
+    def reset_secret() -> None:
+        """Re-read CSRF_SECRET_KEY and forget every verified token."""
+        _keyed_hmac.cache_clear()
+        _verified.clear()
+
+    @staticmethod
+    def clear_verified_cache() -> None:
+        """Forget verified token pairs; each is fully checked again."""
+        _verified.clear()
+
     @staticmethod
     def generate_csrf_token(session_id: Optional[str] = None) -> str:
         """
-        Generate a CSRF token using HMAC
+        Generate a v1 CSRF token
 
         Args:
             session_id: Optional session identifier to bind token to session
 
         Returns:
-            Base64 encoded CSRF token
+            "v1." followed by the urlsafe base64 encoded token
         """
-        # Generate random data
-        random_data = secrets.token_bytes(32)
-        timestamp = str(int(time.time()))
-
-        # Create payload: timestamp + session_id (if provided) + random_data
-        payload_parts = [timestamp]
-        if session_id:
-            payload_parts.append(session_id)
-        payload_parts.append(random_data.hex())
-
-        payload = "|".join(payload_parts)
+        body = (
+            _HEADER.pack(TOKEN_VERSION, int(time.time()))
+            + secrets.token_bytes(_NONCE_BYTES)
+            + _session_digest(session_id)
+        )
+        raw = body + _mac(body)
+        return TOKEN_PREFIX + base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
 
-        # Create HMAC signature
-        secret = CsrfUtils.get_csrf_secret()
-        signature = hmac.new(
-            secret.encode(), payload.encode(), hashlib.sha256
-        ).hexdigest()
-
-        # Combine payload and signature
-        token = f"{payload}|{signature}"
-
-        # Base64 encode for safe transport
-        import base64
+    @staticmethod
+    def _token_issued_at(
+        token: str, session_id: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Issue time of a correctly signed v1 token whose session digest
+        matches `session_id` (when given), else None.
+        """
+        encoded = token[len(TOKEN_PREFIX):]
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        if len(raw) != _BODY_BYTES + _MAC_BYTES:
+            return None
+        body, signature = raw[:_BODY_BYTES], raw[_BODY_BYTES:]
+        if not hmac.compare_digest(signature, _mac(body)):
+            return None
+        version, issuedAt = _HEADER.unpack_from(body)
+        if version != TOKEN_VERSION:
+            return None
+        if session_id is not None:
+            tokenDigest = body[_BODY_BYTES - _DIGEST_BYTES:]
+            if not hmac.compare_digest(tokenDigest, _session_digest(session_id)):
+                return None
+        return issuedAt
 
-        return base64.b64encode(token.encode()).decode()
+    @staticmethod
+    def _legacy_issued_at(
+        token: str, session_id: Optional[str] = None
+    ) -> Optional[int]:
+        """Same check for tokens issued before the v1 format."""
+        decoded_token = base64.b64decode(token.encode()).decode()
+
+        # timestamp, [session_id,] random_data, signature
+        parts = decoded_token.split("|")
+        if len(parts) < 3:
+            return None
+        signature = parts[-1]
+        payload_parts = parts[:-1]
+        expected_signature = _mac("|".join(payload_parts).encode()).hex()
+        if not hmac.compare_digest(signature, expected_signature):
+            return None
+
+        if session_id is not None:
+            if len(payload_parts) < 3:
+                return None
+            if not hmac.compare_digest(payload_parts[1], session_id):
+                return None
+        return int(payload_parts[0])
 
     @staticmethod
     def validate_csrf_token(
@@ -60,58 +198,35 @@ class CsrfUtils:
         Validate a CSRF token
 
         Args:
-            token: Base64 encoded CSRF token
+            token: v1 or legacy CSRF token
             session_id: Optional session identifier to validate against
             max_age: Maximum age of token in seconds (default 1 hour)
 
         Returns:
             True if token is valid, False otherwise
         """
-        try:
-            # Decode base64
-            import base64
-
-            decoded_token = base64.b64decode(token.encode()).decode()
-
-            # Split token into parts
-            parts = decoded_token.split("|")
-            if len(parts) < 3:  # timestamp, random_data, signature (minimum)
-                return False
-
-            signature = parts[-1]
-            payload_parts = parts[:-1]
-
-            # Reconstruct payload
-            payload = "|".join(payload_parts)
-
-            # Verify signature
-            secret = CsrfUtils.get_csrf_secret()
-            expected_signature = hmac.new(
-                secret.encode(), payload.encode(), hashlib.sha256
-            ).hexdigest()
-
-            if not hmac.compare_digest(signature, expected_signature):
-                return False
-
-            # Check timestamp
-            timestamp = int(payload_parts[0])
-            current_time = int(time.time())
-
-            if current_time - timestamp > max_age:
-                return False
-
-            # If session_id provided, validate it matches
-            if session_id is not None:
-                if len(payload_parts) < 3:  # timestamp, session_id, random_data
-                    return False
-                token_session_id = payload_parts[1]
-                if not hmac.compare_digest(token_session_id, session_id):
-                    return False
-
-            return True
+        return CsrfUtils._check(token, session_id, max_age) is not None
 
+    @staticmethod
+    def _check(
+        token: str, session_id: Optional[str], max_age: int
+    ) -> Optional[int]:
+        """Expiry time of a valid token, else None."""
+        try:
+            if token.startswith(TOKEN_PREFIX):
+                issuedAt = CsrfUtils._token_issued_at(token, session_id)
+            else:
+                issuedAt = CsrfUtils._legacy_issued_at(token, session_id)
+                _verified.incr("legacy")
         except Exception:
-            return False
+            return None
+        if issuedAt is None or int(time.time()) - issuedAt > max_age:
+            return None
+        return issuedAt + max_age
+
+    @staticmethod
+    def _public_token(secure_token: str) -> str:
+        return _mac(secure_token.encode()).hex()
 
     @staticmethod
     def generate_csrf_token_pair(session_id: Optional[str] = None) -> tuple[str, str]:
@@ -119,29 +234,39 @@ class CsrfUtils:
         secure_token = CsrfUtils.generate_csrf_token(session_id)
 
         # Generate a public token that's HMAC of the secure token
-        secret = CsrfUtils.get_csrf_secret()
-        public_token = hmac.new(
-            secret.encode(), secure_token.encode(), hashlib.sha256
-        ).hexdigest()
-
-        return secure_token, public_token
+        return secure_token, CsrfUtils._public_token(secure_token)
 
     @staticmethod
     def validate_csrf_token_pair(
         secure_token: str, public_token: str, session_id: Optional[str] = None
     ) -> bool:
+        """
+        Check the cookie/header pair. A pair that validated before for the
+        same session is answered from the per-process LRU until it expires.
+        """
         try:
-            # First validate the secure token structure and expiry
-            if not CsrfUtils.validate_csrf_token(secure_token, session_id):
-                return False
+            key = hashlib.sha256(
+                "\0".join((secure_token, public_token, session_id or "")).encode()
+            ).digest()
+            if _verified.get(key):
+                return True
 
+            expiresAt = CsrfUtils._check(secure_token, session_id, 3600)
             # Then validate that public token matches secure token
-            secret = CsrfUtils.get_csrf_secret()
-            expected_public = hmac.new(
-                secret.encode(), secure_token.encode(), hashlib.sha256
-            ).hexdigest()
+            if expiresAt is None or not hmac.compare_digest(
+                public_token, CsrfUtils._public_token(secure_token)
+            ):
+                _verified.incr("failures")
+                return False
 
-            return hmac.compare_digest(public_token, expected_public)
+            _verified.put(key, expiresAt)
+            return True
 
         except Exception:
+            _verified.incr("failures")
             return False
+
+    @staticmethod
+    def stats() -> dict:
+        """Validation, cache hit, legacy token and failure counters."""
+        return _verified.stats()
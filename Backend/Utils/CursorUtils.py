@@ -0,0 +1,52 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the keyset position of the last row of a page into an opaque,
+    URL-safe token. Datetimes are tagged so they round-trip exactly.
+    """
+
+    def _encode(value):
+        if isinstance(value, datetime):
+            return {"$dt": value.isoformat()}
+        return value
+
+    raw = json.dumps([_encode(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Optional[Sequence[type]] = None) -> List[Any]:
+    """
+    Inverse of encode_cursor. With `types`, the token must hold exactly
+    one value of each type in order (bools don't pass for ints), so a
+    crafted cursor is rejected here rather than failing in SQL.
+    Raises ValueError if the token is malformed.
+    """
+
+    def _decode(value):
+        if isinstance(value, dict) and "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        return value
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    try:
+        values = [_decode(v) for v in values]
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if types is not None:
+        if len(values) != len(types) or not all(
+            isinstance(v, t) and (t is bool or not isinstance(v, bool))
+            for v, t in zip(values, types)
+        ):
+            raise ValueError("Invalid cursor")
+    return values
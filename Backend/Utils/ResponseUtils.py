@@ -0,0 +1,27 @@
+from flask import jsonify, request
+
+# reference data (labels, violations, fields of work) changes rarely
+REFERENCE_MAX_AGE = 300
+
+
+def conditional_json(payload, max_age: int = 0, public: bool = True):
+    """
+    jsonify `payload` with a strong ETag (hash of the body) and a
+    Cache-Control header, answering a matching If-None-Match with
+    304 Not Modified and no body.
+    max_age=0 sends `no-cache`: clients may store the body but must
+    revalidate before reusing it.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+
+    if public:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+
+    return response.make_conditional(request)
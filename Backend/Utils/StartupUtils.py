@@ -0,0 +1,27 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+# Wall-clock cost of initializing each component in this process, in ms.
+# Components initialize on first use, so a worker's report fills in as it
+# serves its first requests.
+_timings: Dict[str, float] = {}
+
+
+@contextmanager
+def timed(component: str):
+    """Record how long the block took to initialize `component`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        _timings[component] = round(elapsed, 3)
+        logging.info(f"→ {component} initialized in {elapsed:.1f} ms")
+
+
+def startup_report() -> Dict[str, object]:
+    """Per-component initialization times for this process."""
+    return {"pid": os.getpid(), "components": dict(_timings)}
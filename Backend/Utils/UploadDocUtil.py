@@ -1,5 +1,5 @@
 from werkzeug.utils import secure_filename
-from firebaseStorage import bucket, BUCKET_NAME
+from firebaseStorage import get_bucket, BUCKET_NAME
 
 ALLOWED_ROOTS = {"companyDocument", "portfolio", "profilePic", "resume"}
 
@@ -21,7 +21,7 @@ def upload_to_path(file_obj, target_path, public=True):
     parts[-1] = secure_filename(parts[-1])
     blob_path = "/".join(parts)
 
-    blob = bucket.blob(blob_path)
+    blob = get_bucket().blob(blob_path)
     file_obj.seek(0)
     blob.upload_from_file(file_obj, content_type=file_obj.content_type)
 
@@ -51,6 +51,7 @@ def rename_file(old_path: str, new_path: str, public=True) -> str:
     old_blob_path = "/".join(old_parts)
     new_blob_path = "/".join(new_parts)
 
+    bucket = get_bucket()
     old_blob = bucket.blob(old_blob_path)
     new_blob = bucket.copy_blob(old_blob, bucket, new_blob_path)
 
@@ -80,7 +81,7 @@ def download_by_uri(firebase_uri: str) -> bytes:
         raise PermissionError(f"Access to '{root}' is not allowed")
 
     # Download from Firebase
-    blob = bucket.blob(blob_path)
+    blob = get_bucket().blob(blob_path)
     if not blob.exists():
         raise FileNotFoundError(f"No such blob: {blob_path}")
 
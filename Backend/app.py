@@ -16,7 +16,6 @@ from flask import Flask, jsonify, request, abort, make_response
 from flask_cors import CORS
 from flask_limiter.errors import RateLimitExceeded
 import os
-import jwt
 
 from Routes.profile import profile_bp
 from Routes.auth import auth_bp
@@ -29,14 +28,19 @@ from Routes.captcha import captcha_bp
 from Routes.csrf import csrf_bp
 from Routes.multifactorAuth import multi_factor_auth_bp
 from Routes.jobApplication import job_application_bp
-from Security import Limiter, SplunkUtils
+from Routes.metrics import metrics_bp
+from Security import AuthUtils, Limiter, Principal, SplunkUtils
 from Security.JWTUtils import JWTUtils
 from Utils.CsrfUtils import CsrfUtils
+from Utils.StartupUtils import timed
 
 from Control.AccountControl import AccountControl
+from cli import register_commands
+from SQLModels.base import db_context
 
 
 import logging
+import time
 
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +51,19 @@ logging.basicConfig(
 # #splunk
 SplunkLogging = SplunkUtils.SplunkLogger()
 
+# after a write, this client's reads skip the replicas for this many seconds
+READ_YOUR_WRITES_WINDOW = int(os.getenv("READ_YOUR_WRITES_WINDOW", 5))
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+# Methods that must carry a valid CSRF pair when a session cookie is sent.
+# GET is checked by default; drop it (e.g. "POST,PUT,PATCH,DELETE") to let
+# safe reads through without the pair.
+CSRF_PROTECTED_METHODS = frozenset(
+    m.strip().upper()
+    for m in os.getenv("CSRF_PROTECTED_METHODS", "GET,POST,PUT,DELETE").split(",")
+    if m.strip()
+)
+
 
 # CORS(app)
 def create_app():
@@ -68,6 +85,35 @@ def create_app():
 
     # CSRFProtect(app)
 
+    # Both hooks below authenticate through Principal, which decodes the
+    # cookie and checks the session binding once per request and leaves
+    # the caller on g.principal for the route decorators.
+    Principal.init_app(app, AccountControl.getSessionState)
+
+    @app.before_request
+    def route_reads():
+        # reads go to the primary for a while after this client's last write
+        if db_context.has_replicas:
+            pinned_until = request.cookies.get(READ_PRIMARY_COOKIE, "")
+            db_context.begin_request(
+                pin_to_primary=pinned_until.isdigit()
+                and int(pinned_until) > time.time()
+            )
+
+    @app.after_request
+    def pin_reads_after_write(response):
+        if db_context.has_replicas and db_context.wrote_in_request():
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                str(int(time.time()) + READ_YOUR_WRITES_WINDOW),
+                max_age=READ_YOUR_WRITES_WINDOW,
+                path="/",
+                httponly=True,
+                secure=True,
+                samesite="Strict",
+            )
+        return response
+
     @app.before_request
     def enforce_single_session():
         # Skip token creation & public routes
@@ -102,23 +148,14 @@ def create_app():
             )
             return resp
 
-        # Decode and validate token
-        try:
-            payload = JWTUtils.decode_jwt_token(token)
-        except jwt.PyJWTError:
-            return _invalid_session("Invalid or expired token")
+        error = Principal.authenticate_request()
+        if error:
+            return _invalid_session(error)
 
-        account_id = payload.get("sub")
-        jti = payload.get("jti")
-
-        account = AccountControl.getAccountById(account_id)
-        if jti != account.sessionId:
-            return _invalid_session("Session invalidated; please log in again")
-
-    # Validate CSRF on all modifying requests (POST, "GET" ,PUT, DELETE)
+    # Validate CSRF on the methods in CSRF_PROTECTED_METHODS
     @app.before_request
     def verify_csrf_token():
-        if request.method in ("GET", "POST", "PUT", "DELETE"):
+        if request.method in CSRF_PROTECTED_METHODS:
             # Skip CSRF for authentication routes and CSRF token endpoint
             if request.endpoint in (
                 "csrf.get_csrf_token",
@@ -142,18 +179,9 @@ def create_app():
                 resp.set_cookie("csrf_token", "", expires=0, path="/")
                 return resp
 
-            # Decode and validate token
-            try:
-                payload = JWTUtils.decode_jwt_token(token)
-            except jwt.PyJWTError:
-                return _invalid_session("Invalid or expired token")
-
-            account_id = payload.get("sub")
-            jti = payload.get("jti")
-
-            account = AccountControl.getAccountById(account_id)
-            if jti != account.sessionId:
-                return _invalid_session("Session invalidated; please log in again")
+            error = Principal.authenticate_request()
+            if error:
+                return _invalid_session(error)
 
             # Only check CSRF if user has a session token (is authenticated)
             session_token = request.cookies.get("session_token")
@@ -196,6 +224,9 @@ def create_app():
     app.register_blueprint(captcha_bp)
     app.register_blueprint(multi_factor_auth_bp)
     app.register_blueprint(csrf_bp)
+    app.register_blueprint(metrics_bp)
+
+    register_commands(app)
 
     @app.errorhandler(RateLimitExceeded)
     def handle_rate_limit_exceeded(e):
@@ -239,10 +270,35 @@ def create_app():
             429,
         )
 
+    @app.errorhandler(AuthUtils.HasherBusy)
+    def handle_hasher_busy(e):
+        SplunkLogging.send_log(
+            {
+                "event": "Password Hashing Busy",
+                "reason": str(e),
+                "ip": SplunkLogging.get_real_ip(request),
+                "user_agent": str(request.user_agent),
+                "method": request.method,
+                "path": request.path,
+            }
+        )
+        response = jsonify(
+            {
+                "error": "Service busy",
+                "message": "Please try again shortly",
+                "status": 503,
+            }
+        )
+        response.headers["Retry-After"] = "1"
+        return response, 503
+
     return app
 
 
-app = create_app()
+# Nothing here touches MySQL, Redis or Firebase; each connects on first
+# use (or in gunicorn.conf.py's hooks), which keeps --preload imports cheap.
+with timed("app"):
+    app = create_app()
 
 
 @app.route("/")
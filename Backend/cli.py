@@ -0,0 +1,276 @@
+import base64
+import time
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import func, inspect, or_, select, text, update
+
+from Boundary.Mapper.PostMapper import PostMapper
+from Security import AuthUtils
+from firebaseStorage import list_documents
+from Boundary.TableDataGateway.FieldOfWorkTDG import FieldOfWorkTDG
+from Boundary.TableDataGateway.LabelGateway import LabelGateway
+from Boundary.TableDataGateway.ViolationGateway import ViolationGateway
+import SQLModels  # noqa: F401  registers every table on Base.metadata
+from SQLModels.base import Base, db_context
+from SQLModels.CommentModel import CommentModel
+from SQLModels.PostLikesModel import PostLikesModel
+from SQLModels.PostModel import PostModel
+from Utils.CsrfUtils import CsrfUtils
+from Utils.StartupUtils import timed
+
+db_cli = AppGroup("db", help="Schema maintenance commands.")
+posts_cli = AppGroup("posts", help="Post maintenance commands.")
+reference_cli = AppGroup("reference", help="Reference data cache commands.")
+storage_cli = AppGroup("storage", help="Firebase Storage commands.")
+auth_cli = AppGroup("auth", help="Password hashing commands.")
+csrf_cli = AppGroup("csrf", help="CSRF token commands.")
+
+REFERENCE_GATEWAYS = (LabelGateway, ViolationGateway, FieldOfWorkTDG)
+
+
+def warm_reference_cache() -> None:
+    """
+    Load every reference table into Redis. Failures are logged, not
+    raised: the cache fills on first use anyway.
+    """
+    with timed("referenceCache"):
+        for gateway in REFERENCE_GATEWAYS:
+            try:
+                gateway.warm()
+            except Exception as e:
+                print(f"Failed to warm {gateway.namespace} cache: {e}")
+
+
+def _create_missing_indexes(engine, table) -> int:
+    """Create the indexes declared on `table` that the database lacks."""
+    existing = {i["name"] for i in inspect(engine).get_indexes(table.name)}
+    created = 0
+    for index in table.indexes:
+        if index.name not in existing:
+            click.echo(f"→ Creating index {index.name}")
+            index.create(bind=engine)
+            created += 1
+    return created
+
+
+@db_cli.command("ensure-indexes")
+def ensure_indexes():
+    """
+    Create model-declared indexes missing from existing tables.
+    create_all skips tables that already exist, so new indexes need this.
+    """
+    engine = db_context.get_engine()
+    tables = set(inspect(engine).get_table_names())
+    created = sum(
+        _create_missing_indexes(engine, table)
+        for table in Base.metadata.sorted_tables
+        if table.name in tables
+    )
+    click.echo(f"✓ Created {created} index(es)")
+
+
+def _ensure_post_counter_schema(engine) -> None:
+    """
+    Add the Post counter columns and feed indexes if the table predates
+    them. create_all only creates missing tables, not missing columns.
+    """
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns(PostModel.__tablename__)}
+    with engine.begin() as conn:
+        for name in ("likeCount", "commentCount"):
+            if name not in columns:
+                click.echo(f"→ Adding column Post.{name}")
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {PostModel.__tablename__} "
+                        f"ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0"
+                    )
+                )
+
+    _create_missing_indexes(engine, PostModel.__table__)
+
+
+@posts_cli.command("reconcile-counters")
+@click.option(
+    "--skip-schema",
+    is_flag=True,
+    help="Don't add missing counter columns/indexes first.",
+)
+def reconcile_counters(skip_schema):
+    """
+    Recompute Post.likeCount / Post.commentCount from the PostLikes and
+    Comment tables. Safe to re-run; only rows that drifted are written.
+    """
+    engine = db_context.get_engine()
+    if not skip_schema:
+        _ensure_post_counter_schema(engine)
+
+    likes = (
+        select(func.count())
+        .where(PostLikesModel.postId == PostModel.postId)
+        .scalar_subquery()
+    )
+    comments = (
+        select(func.count())
+        .where(CommentModel.postId == PostModel.postId, CommentModel.isDeleted == 0)
+        .scalar_subquery()
+    )
+    drifted = or_(PostModel.likeCount != likes, PostModel.commentCount != comments)
+    with db_context.session_scope() as session:
+        result = session.execute(
+            update(PostModel)
+            .where(drifted)
+            .values(likeCount=likes, commentCount=comments)
+            .execution_options(synchronize_session=False)
+        )
+        changed = result.rowcount
+    if changed:
+        PostMapper.invalidateCache()
+    click.echo(f"✓ Reconciled counters on {changed} post(s)")
+
+
+@posts_cli.command("dedupe-likes")
+def dedupe_likes():
+    """
+    Remove duplicate PostLikes rows (keeping the earliest) and add the
+    unique (postId, accountId) index the like toggle relies on.
+    Run reconcile-counters afterwards.
+    """
+    engine = db_context.get_engine()
+    table = PostLikesModel.__tablename__
+    with engine.begin() as conn:
+        # the extra derived table lets MySQL read the table it deletes from
+        removed = conn.execute(
+            text(
+                f"DELETE FROM {table} WHERE postLikesId NOT IN ("
+                f"SELECT keepId FROM (SELECT MIN(postLikesId) AS keepId "
+                f"FROM {table} GROUP BY postId, accountId) AS keep)"
+            )
+        ).rowcount
+    click.echo(f"✓ Removed {removed} duplicate like(s)")
+
+    inspector = inspect(engine)
+    existing = {i["name"] for i in inspector.get_indexes(table)}
+    existing |= {c["name"] for c in inspector.get_unique_constraints(table)}
+    if "_post_account_uc" not in existing:
+        click.echo("→ Creating unique index _post_account_uc")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    f"CREATE UNIQUE INDEX _post_account_uc "
+                    f"ON {table} (postId, accountId)"
+                )
+            )
+
+
+@reference_cli.command("invalidate")
+def invalidate_reference():
+    """
+    Drop cached labels, violations and fields of work.
+    Run after editing those tables directly.
+    """
+    for gateway in REFERENCE_GATEWAYS:
+        gateway.invalidate()
+    click.echo("✓ Reference cache invalidated")
+
+
+@reference_cli.command("warm")
+def warm_reference():
+    """Load the reference tables into the cache."""
+    for gateway in REFERENCE_GATEWAYS:
+        click.echo(f"✓ {gateway.namespace}: {gateway.warm()} row(s)")
+
+
+@storage_cli.command("list-documents")
+@click.option("--prefix", default="companyDocument/", show_default=True)
+@click.option("--page-size", default=100, show_default=True, type=int)
+@click.option("--page-token", default=None, help="Token printed by the last page.")
+def list_storage_documents(prefix, page_size, page_token):
+    """List stored objects under a prefix, one page at a time."""
+    names, next_token = list_documents(prefix, page_size, page_token)
+    for name in names:
+        click.echo(f" • {name}")
+    click.echo(f"Found {len(names)} object(s)")
+    if next_token:
+        click.echo(f"Next page: --page-token {next_token}")
+
+
+@auth_cli.command("bcrypt-benchmark")
+@click.option("--min-rounds", default=10, show_default=True, type=int)
+@click.option("--max-rounds", default=15, show_default=True, type=int)
+@click.option("--samples", default=3, show_default=True, type=int)
+@click.option(
+    "--target-ms",
+    default=250.0,
+    show_default=True,
+    type=float,
+    help="Verify latency budget per login.",
+)
+def bcrypt_benchmark(min_rounds, max_rounds, samples, target_ms):
+    """
+    Time one bcrypt verify per cost factor on this host and suggest the
+    BCRYPT_ROUNDS that fits the latency target.
+    """
+    if not 4 <= min_rounds <= max_rounds <= 31:
+        raise click.BadParameter("rounds must satisfy 4 <= min <= max <= 31")
+    timings = AuthUtils.benchmark(range(min_rounds, max_rounds + 1), samples)
+    for cost, ms in timings.items():
+        marker = "*" if cost == AuthUtils.BCRYPT_ROUNDS else " "
+        click.echo(f"{marker} cost {cost:>2}: {ms:>9.1f} ms")
+    suggested = AuthUtils.calibrate_rounds(timings, target_ms)
+    click.echo(f"Current BCRYPT_ROUNDS={AuthUtils.BCRYPT_ROUNDS}")
+    click.echo(f"Suggested BCRYPT_ROUNDS={suggested} for {target_ms:g} ms")
+    click.echo("Existing hashes are upgraded on each account's next login.")
+
+
+def _legacy_csrf_pair(session_id: str) -> tuple[str, str]:
+    """A token pair in the pre-v1 format, signed with the current secret."""
+    payload = f"{int(time.time())}|{session_id}|{'ab' * 32}"
+    signature = CsrfUtils._public_token(payload)
+    secure = base64.b64encode(f"{payload}|{signature}".encode()).decode()
+    return secure, CsrfUtils._public_token(secure)
+
+
+@csrf_cli.command("benchmark")
+@click.option("--iterations", default=10000, show_default=True, type=int)
+def csrf_benchmark(iterations):
+    """Per-request cost of generating and validating CSRF token pairs."""
+    session_id = "x" * 400  # about the size of a session JWT
+    pairs = [CsrfUtils.generate_csrf_token_pair(session_id) for _ in range(100)]
+
+    def run(label, fn):
+        start = time.perf_counter()
+        for i in range(iterations):
+            fn(i)
+        perCall = (time.perf_counter() - start) * 1e6 / iterations
+        click.echo(f"{label:<28} {perCall:>8.2f} µs")
+
+    def uncached(i):
+        CsrfUtils.clear_verified_cache()
+        CsrfUtils.validate_csrf_token_pair(*pairs[i % 100], session_id)
+
+    legacy = _legacy_csrf_pair(session_id)
+
+    def legacy_uncached(i):
+        CsrfUtils.clear_verified_cache()
+        CsrfUtils.validate_csrf_token_pair(*legacy, session_id)
+
+    run("generate pair", lambda i: CsrfUtils.generate_csrf_token_pair(session_id))
+    run("validate v1 (cold)", uncached)
+    run("validate legacy (cold)", legacy_uncached)
+    run(
+        "validate (cached)",
+        lambda i: CsrfUtils.validate_csrf_token_pair(*pairs[i % 100], session_id),
+    )
+    CsrfUtils.clear_verified_cache()
+
+
+def register_commands(app):
+    """Attach the maintenance command groups to the Flask CLI."""
+    app.cli.add_command(db_cli)
+    app.cli.add_command(posts_cli)
+    app.cli.add_command(reference_cli)
+    app.cli.add_command(storage_cli)
+    app.cli.add_command(auth_cli)
+    app.cli.add_command(csrf_cli)
@@ -1,36 +1,65 @@
 # firebase_storage.py  (put this beside app.py or in a utils/ folder)
 import os
+import threading
+
 import firebase_admin
 from firebase_admin import credentials, storage
+from requests.adapters import HTTPAdapter
+
+from Utils.StartupUtils import timed
 
 BUCKET_NAME = "connectit-63f60.firebasestorage.app"
 SERVICE_KEY = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "firebase_key.json")
+# concurrent HTTPS connections kept open to Cloud Storage per worker
+HTTP_POOL_SIZE = int(os.getenv("FIREBASE_HTTP_POOL_SIZE", 10))
+
+_bucket = None
+_bucket_pid = None
+_lock = threading.Lock()
+
 
-if not firebase_admin._apps:  # initialise once
-    cred = credentials.Certificate(SERVICE_KEY)
-    firebase_admin.initialize_app(cred, {"storageBucket": BUCKET_NAME})
+def _create_bucket():
+    if not firebase_admin._apps:  # initialise once
+        cred = credentials.Certificate(SERVICE_KEY)
+        firebase_admin.initialize_app(cred, {"storageBucket": BUCKET_NAME})
 
-bucket = storage.bucket()  # ready to use
+    bucket = storage.bucket()
+    # the storage client's authorized session defaults to a small pool;
+    # size it for the worker's threads so uploads don't reconnect
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    bucket.client._http.mount("https://", adapter)
+    return bucket
+
+
+def get_bucket():
+    """
+    Shared bucket handle for this process, created on first use.
+    Nothing connects at import time; after a fork (gunicorn --preload)
+    the child builds its own handle instead of reusing the parent's
+    HTTP connections.
+    """
+    global _bucket, _bucket_pid
+    pid = os.getpid()
+    if _bucket is None or _bucket_pid != pid:
+        with _lock:
+            if _bucket is None or _bucket_pid != pid:
+                with timed("firebase"):
+                    _bucket = _create_bucket()
+                _bucket_pid = pid
+    return _bucket
 
 
-# ##TODO: REMOVE THIS FOR PROD, ONLY FOR TESTING PURPOSES
-# ----------------------------------------------------------------------
-def list_company_documents() -> list[str]:
+def list_documents(
+    prefix: str = "companyDocument/", page_size: int = 100, page_token: str = None
+) -> tuple[list[str], str]:
     """
-    Returns a list of object names (paths) under companyDocument/
+    One page of object names under `prefix`, skipping the folder
+    placeholder itself. Returns (names, next_page_token); the token is
+    None on the last page.
     """
-    blobs = bucket.list_blobs(prefix="companyDocument/")
-    # Exclude the folder placeholder itself (empty path)
-    return [blob.name for blob in blobs if blob.name != "companyDocument/"]
-
-
-files = list_company_documents()
-print("Found:", len(files), "files")
-for f in files:
-    print(" •", f)
-# #######Should see output like this:
-# ----------------------------------------------------------------------
-# Found: 1 files
-#   • companyDocument/2412.17481v2.pdf
-# ----------------------------------------------------------------------
-####################################
+    blobs = get_bucket().list_blobs(
+        prefix=prefix, max_results=page_size, page_token=page_token
+    )
+    page = next(blobs.pages, None)
+    names = [blob.name for blob in page or [] if blob.name != prefix]
+    return names, blobs.next_page_token
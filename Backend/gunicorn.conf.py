@@ -0,0 +1,39 @@
+# Backend/gunicorn.conf.py
+# gunicorn -c gunicorn.conf.py app:app
+import os
+import threading
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_CONCURRENCY", 4))
+# import the app once in the master and fork it into the workers; the app
+# opens no connections at import, so nothing shared leaks across the fork
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+
+def post_fork(server, worker):
+    """Runs in each worker right after the fork."""
+    from SQLModels.base import db_context
+
+    # anything pooled before the fork belongs to the master; forget it
+    # without closing the sockets out from under the parent
+    db_context.release_connections(close=False)
+
+
+def post_worker_init(worker):
+    """Runs in each worker once the app is loaded."""
+    from cli import warm_reference_cache
+
+    # warm from a worker, off the boot path, so the master never opens the
+    # SSH tunnel or a database connection; the cache's rebuild lock lets
+    # one worker load each table while the others read its result
+    threading.Thread(
+        target=warm_reference_cache, name="reference-warm", daemon=True
+    ).start()
+
+
+def worker_exit(server, worker):
+    """Runs in a worker as it shuts down."""
+    from Security import AuthUtils
+
+    # don't leave bcrypt child processes behind the worker
+    AuthUtils.hasher.shutdown()
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, insert, select
+
+import SQLModels  # noqa: F401  (registers every model on Base.metadata)
+from Security import JWTUtils as jwt_module
+from Security import Limiter
+from SQLModels.base import Base, DatabaseContext, db_context
+
+metadata = MetaData()
+items = Table("items", metadata, Column("source", String(16)))
+
+
+@pytest.fixture
+def jwt_secret(monkeypatch):
+    """A fixed JWT signing key and an empty claims cache for one test."""
+    monkeypatch.setattr(jwt_module.JWTUtils, "SECRET_KEY", "test-secret-" + "x" * 52)
+    monkeypatch.setattr(jwt_module, "_claims_cache", jwt_module.ClaimsCache(8))
+
+
+@pytest.fixture
+def replicated_ctx(tmp_path, monkeypatch):
+    """A DatabaseContext over two local SQLite files: primary and replica."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setenv(
+        "DATABASE_REPLICA_URLS", f"sqlite:///{tmp_path / 'replica.db'}"
+    )
+    context = DatabaseContext()
+    yield context
+    context.dispose()
+
+
+@pytest.fixture
+def seeded_ctx(replicated_ctx):
+    """Connected context whose databases each hold one row naming them."""
+    replicated_ctx.get_engine()
+    for engine, source in [(replicated_ctx.engine, "primary")] + [
+        (e, "replica") for e in replicated_ctx.replica_engines
+    ]:
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(items).values(source=source))
+    return replicated_ctx
+
+
+@pytest.fixture
+def items_table():
+    return items
+
+
+@pytest.fixture
+def read_source():
+    """Which database a session_scope(**kwargs) read was served by."""
+
+    def read(context, **kwargs):
+        with context.session_scope(**kwargs) as session:
+            return session.execute(select(items.c.source)).scalars().first()
+
+    return read
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """In-memory Redis behind Limiter.get_redis() for one test."""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(Limiter, "_redis", client)
+    return client
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch):
+    """The app's global db_context over an empty SQLite file with every table."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.delenv("DATABASE_REPLICA_URLS", raising=False)
+    db_context.dispose()
+    Base.metadata.create_all(db_context.get_engine())
+    yield db_context
+    db_context.dispose()
@@ -0,0 +1,48 @@
+import pytest
+
+from Boundary.Mapper.AccountMapper import AccountMapper
+from SQLModels.AccountModel import AccountModel, Role
+
+
+@pytest.fixture
+def accounts(app_db):
+    with app_db.session_scope() as session:
+        session.add_all(
+            [
+                AccountModel(
+                    accountId=1,
+                    name="ann",
+                    email="ann@example.com",
+                    passwordHash="x",
+                    role=Role.User,
+                    sessionId="jti-1",
+                ),
+                AccountModel(
+                    accountId=2,
+                    name="bob",
+                    email="bob@example.com",
+                    passwordHash="x",
+                    role=Role.Admin,
+                    isDisabled=True,
+                ),
+            ]
+        )
+
+
+def test_session_state_projection(accounts):
+    assert AccountMapper.getSessionState(1) == {
+        "accountId": 1,
+        "sessionId": "jti-1",
+        "isDisabled": False,
+    }
+    assert AccountMapper.getSessionState(99) is None
+
+
+def test_batch_session_states_skip_unknown_ids(accounts):
+    states = AccountMapper.getSessionStates([2, 1, 99, 1])
+
+    assert states == {
+        1: {"accountId": 1, "sessionId": "jti-1", "isDisabled": False},
+        2: {"accountId": 2, "sessionId": None, "isDisabled": True},
+    }
+    assert AccountMapper.getSessionStates([]) == {}
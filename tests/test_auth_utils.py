@@ -1,5 +1,16 @@
+import threading
+import time
+
+import bcrypt
+import pytest
+
 from Backend.Security.AuthUtils import (
+    HasherBusy,
+    PasswordHasher,
+    calibrate_rounds,
+    hash_cost,
     hash_password,
+    needs_rehash,
     verify_hash_password
 )
 
@@ -25,3 +36,123 @@ def test_verify_hash_password_failure():
     hashed = hash_password(password)
 
     assert verify_hash_password(wrong_password, hashed) is False
+
+
+def test_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, maxPending=1, timeout=5, rounds=4)
+    hasher._pending = 1  # one call already queued
+
+    with pytest.raises(HasherBusy):
+        hasher.verify("password", "$2b$04$" + "a" * 53)
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_hasher_pool_round_trip_and_stats():
+    hasher = PasswordHasher(workers=1, maxPending=2, timeout=30, rounds=4)
+    try:
+        hashed = hasher.hash("MySecurePassword123")
+
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("MySecurePassword123", hashed) is True
+        stats = hasher.stats()
+        assert stats["hashes"] == 1
+        assert stats["verifies"] == 1
+        assert stats["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes():
+    hasher = PasswordHasher(workers=1, maxPending=1, timeout=30, rounds=4)
+    try:
+        hasher.hash("warm-up")  # start the worker process
+        hasher.timeout = 0.05
+
+        with pytest.raises(HasherBusy):
+            hasher.hash("pw", rounds=14)
+        # the abandoned hash is still running, so the pool is still full
+        with pytest.raises(HasherBusy, match="capacity"):
+            hasher.hash("pw")
+
+        deadline = time.monotonic() + 30
+        while hasher.stats()["pending"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        stats = hasher.stats()
+        assert stats["pending"] == 0
+        assert stats["timeouts"] == 1
+        assert stats["rejected"] == 1
+    finally:
+        hasher.shutdown()
+
+
+def test_hasher_inline_mode():
+    hasher = PasswordHasher(workers=0, maxPending=1, timeout=5, rounds=4)
+    hashed = hasher.hash("pw")
+
+    assert hasher.verify("pw", hashed) is True
+    assert hasher._executor is None
+
+
+def test_needs_rehash_compares_scheme_and_cost():
+    hashed = bcrypt.hashpw(b"pw", bcrypt.gensalt(4)).decode()
+
+    assert hash_cost(hashed) == 4
+    assert needs_rehash(hashed, rounds=4) is False
+    assert needs_rehash(hashed, rounds=5) is True
+    assert needs_rehash(hashed.replace("$2b$", "$2a$", 1), rounds=4) is True
+    assert needs_rehash("not-a-hash", rounds=4) is True
+
+
+def test_rehash_in_background_saves_new_hash():
+    hasher = PasswordHasher(workers=0, maxPending=1, timeout=5, rounds=5)
+    oldHash = bcrypt.hashpw(b"pw", bcrypt.gensalt(4)).decode()
+    saved = []
+    done = threading.Event()
+
+    def save(old, new):
+        saved.append((old, new))
+        done.set()
+        return True
+
+    assert hasher.rehash_in_background("pw", oldHash, save) is True
+    assert done.wait(10)
+    old, new = saved[0]
+    assert old == oldHash
+    assert hash_cost(new) == 5
+    assert bcrypt.checkpw(b"pw", new.encode())
+
+
+def test_rehash_skipped_when_pool_is_busy():
+    hasher = PasswordHasher(workers=1, maxPending=4, timeout=5, rounds=5)
+    hasher._pending = 2
+
+    assert hasher.rehash_in_background("pw", "old", lambda o, n: True) is False
+    assert hasher.stats()["rehashSkipped"] == 1
+
+
+def test_inline_rehashes_are_capped():
+    hasher = PasswordHasher(workers=0, maxPending=0, timeout=5, rounds=4)
+    release = threading.Event()
+
+    def save(old, new):
+        release.wait(10)
+        return True
+
+    assert hasher.rehash_in_background("pw", "old", save) is True
+    assert hasher.rehash_in_background("pw", "old", save) is False
+    assert hasher.stats()["rehashing"] == 1
+    assert hasher.stats()["rehashSkipped"] == 1
+
+    release.set()
+    deadline = time.monotonic() + 10
+    while hasher.stats()["rehashing"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert hasher.stats()["rehashes"] == 1
+    assert hasher.rehash_in_background("pw", "old", lambda o, n: True) is True
+
+
+def test_calibrate_rounds_picks_highest_cost_within_target():
+    timings = {10: 60.0, 11: 120.0, 12: 240.0, 13: 480.0}
+
+    assert calibrate_rounds(timings, 250) == 12
+    assert calibrate_rounds(timings, 10) == 10
@@ -0,0 +1,58 @@
+import pytest
+
+from Utils import CacheUtils
+
+
+@pytest.fixture
+def cache(app_db, fake_redis):
+    CacheUtils._release_lock_script.cache_clear()
+    return fake_redis
+
+
+def test_cached_loads_once_and_releases_lock(cache):
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return {"n": len(loads)}
+
+    assert CacheUtils.cached(lambda: "k", loader) == {"n": 1}
+    assert CacheUtils.cached(lambda: "k", loader) == {"n": 1}
+    assert loads == [1]
+    assert cache.get("k:lock") is None
+
+
+def test_release_leaves_a_lock_taken_over_by_another_worker(cache):
+    def loader():
+        # our lock expired and another worker took it mid-load
+        cache.set("k:lock", "someone-else")
+        return 1
+
+    CacheUtils.cached(lambda: "k", loader)
+
+    assert cache.get("k:lock") == "someone-else"
+
+
+def test_release_script_is_registered_once(cache, monkeypatch):
+    calls = []
+    register = type(cache).register_script
+
+    def counting(self, script):
+        calls.append(script)
+        return register(self, script)
+
+    monkeypatch.setattr(type(cache), "register_script", counting)
+
+    for key in ("a", "b", "c"):
+        CacheUtils.cached(lambda: key, lambda: 1)
+
+    assert len(calls) == 1
+    assert cache.keys("*:lock") == []
+
+
+def test_bump_version_invalidates_namespace(cache):
+    before = CacheUtils.versioned_key("ns", "x")
+    CacheUtils.bump_version("ns")
+
+    assert CacheUtils.versioned_key("ns", "x") != before
+    assert CacheUtils.get_version("ns") == 1
@@ -0,0 +1,75 @@
+import base64
+import time
+
+import pytest
+
+from Utils.CsrfUtils import CsrfUtils, TOKEN_PREFIX, _mac
+
+
+@pytest.fixture(autouse=True)
+def secret(monkeypatch):
+    monkeypatch.setenv("CSRF_SECRET_KEY", "csrf-test-secret")
+    CsrfUtils.reset_secret()
+    yield
+    CsrfUtils.reset_secret()
+
+
+def test_pair_round_trip_is_session_bound():
+    secure, public = CsrfUtils.generate_csrf_token_pair("session-a")
+
+    assert secure.startswith(TOKEN_PREFIX)
+    assert CsrfUtils.validate_csrf_token_pair(secure, public, "session-a")
+    assert not CsrfUtils.validate_csrf_token_pair(secure, public, "session-b")
+    wrong = "1" if public[-1] == "0" else "0"
+    assert not CsrfUtils.validate_csrf_token_pair(
+        secure, public[:-1] + wrong, "session-a"
+    )
+
+
+def test_tampered_token_is_rejected():
+    secure, _ = CsrfUtils.generate_csrf_token_pair("s")
+    raw = bytearray(base64.urlsafe_b64decode(secure[len(TOKEN_PREFIX):] + "=="))
+    raw[5] ^= 1
+    forged = TOKEN_PREFIX + base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode()
+
+    assert not CsrfUtils.validate_csrf_token(forged, "s")
+    assert not CsrfUtils.validate_csrf_token("v1.???", "s")
+
+
+def test_expired_token_is_rejected(monkeypatch):
+    secure, _ = CsrfUtils.generate_csrf_token_pair("s")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 3601)
+
+    assert not CsrfUtils.validate_csrf_token(secure, "s")
+
+
+def test_other_secret_is_rejected(monkeypatch):
+    secure, public = CsrfUtils.generate_csrf_token_pair("s")
+    monkeypatch.setenv("CSRF_SECRET_KEY", "rotated")
+    CsrfUtils.reset_secret()
+
+    assert not CsrfUtils.validate_csrf_token_pair(secure, public, "s")
+
+
+def test_legacy_token_still_accepted():
+    payload = f"{int(time.time())}|session-a|{'ab' * 32}"
+    legacy = base64.b64encode(f"{payload}|{_mac(payload.encode()).hex()}".encode())
+    secure = legacy.decode()
+    public = _mac(legacy).hex()
+    before = CsrfUtils.stats()["legacy"]
+
+    assert CsrfUtils.validate_csrf_token_pair(secure, public, "session-a")
+    assert not CsrfUtils.validate_csrf_token_pair(secure, public, "session-b")
+    assert CsrfUtils.stats()["legacy"] - before == 2
+
+
+def test_repeat_validation_hits_cache():
+    secure, public = CsrfUtils.generate_csrf_token_pair("s")
+    before = CsrfUtils.stats()["cacheHits"]
+
+    for _ in range(3):
+        assert CsrfUtils.validate_csrf_token_pair(secure, public, "s")
+    stats = CsrfUtils.stats()
+    assert stats["cacheHits"] - before == 2
+    assert stats["size"] == 1
@@ -0,0 +1,61 @@
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from Backend.Utils.CursorUtils import decode_cursor, encode_cursor
+from Boundary.Mapper.PostMapper import PostMapper
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [42],
+        [17, 42],
+        [datetime(2025, 7, 1, 12, 30, 5, 123456), 42],
+        ["Full Time", None, 3],
+    ],
+)
+def test_cursor_round_trip(values):
+    cursor = encode_cursor(values)
+    assert decode_cursor(cursor) == values
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor([datetime(2025, 1, 1), 10**12])
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor!", "e30", ""])
+def test_decode_rejects_garbage(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_decode_checks_types():
+    cursor = encode_cursor([datetime(2025, 1, 1), 42])
+
+    assert decode_cursor(cursor, (datetime, int)) == [datetime(2025, 1, 1), 42]
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, (int, int))
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, (datetime,))
+
+
+@pytest.mark.parametrize(
+    "values", [[[1], {}], [True, 1], [None, 1], ["5", 1], [{"$dt": 5}, 1]]
+)
+def test_decode_rejects_crafted_values(values):
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, (int, int))
+
+
+def test_feed_rejects_crafted_cursor_before_sql(app_db):
+    cursor = base64.urlsafe_b64encode(b"[[1],{}]").decode()
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        PostMapper.getPostsByCursor(cursor=cursor, sortBy="Most liked")
+    assert PostMapper.getPostsByCursor(sortBy="Most liked")["posts"] == []
@@ -0,0 +1,14 @@
+def test_connects_on_first_use(replicated_ctx):
+    assert replicated_ctx.engine is None
+    replicated_ctx.get_engine()
+    assert replicated_ctx.engine is not None
+    assert replicated_ctx.has_replicas
+
+
+def test_release_connections_keeps_context_usable(seeded_ctx, read_source):
+    seeded_ctx.release_connections()
+
+    assert read_source(seeded_ctx) == "primary"
+    stats = seeded_ctx.get_pool_stats()
+    assert stats["checkouts"] >= 1
+    assert len(stats["replicas"]) == 1
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from Boundary.Mapper.JobListingMapper import JobListingMapper
+from Entity.JobApplication import Status
+from SQLModels.AccountModel import AccountModel, Role
+from SQLModels.CompanyModel import CompanyModel
+from SQLModels.FieldOfWorkModel import FieldOfWorkModel
+from SQLModels.JobApplicationModel import JobApplicationModel
+from SQLModels.JobListingModel import JobListingModel
+from SQLModels.UserModel import UserModel
+
+BASE = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def job(app_db):
+    """Job 1 with five applicants, the newest from user 5."""
+    with app_db.session_scope() as session:
+        session.add(
+            AccountModel(
+                accountId=10,
+                name="acme",
+                email="acme@example.com",
+                passwordHash="x",
+                role=Role.Company,
+            )
+        )
+        for i in range(1, 6):
+            session.add(
+                AccountModel(
+                    accountId=i,
+                    name=f"user{i}",
+                    email=f"user{i}@example.com",
+                    passwordHash="x",
+                    role=Role.User,
+                )
+            )
+        session.flush()
+        session.add(CompanyModel(companyId=1, accountId=10, companyDocUrl="gs://d"))
+        session.add(FieldOfWorkModel(fieldOfWorkId=1, description="software"))
+        session.add_all([UserModel(userId=i, accountId=i) for i in range(1, 6)])
+        session.flush()
+        session.add(
+            JobListingModel(
+                jobId=1,
+                companyId=1,
+                fieldOfWorkId=1,
+                title="job",
+                description="d",
+                applicationDeadline=BASE + timedelta(days=30),
+                experiencePreferred=1,
+                minSalary=1000,
+                maxSalary=2000,
+                jobType="Full Time",
+                workArrangement="Remote",
+                createdAt=BASE,
+                isDeleted=False,
+            )
+        )
+        session.flush()
+        session.add_all(
+            [
+                JobApplicationModel(
+                    jobId=1,
+                    userId=i,
+                    status=Status.APPLIED,
+                    appliedAt=BASE + timedelta(hours=i),
+                    resumeURL="gs://r",
+                )
+                for i in range(1, 6)
+            ]
+        )
+    return 1
+
+
+def test_applicant_pages_follow_the_cursor(job):
+    seen, cursor = [], None
+    while True:
+        details = JobListingMapper.getJobDetails(
+            job, applicantCursor=cursor, applicantPageSize=2
+        )
+        assert details["numApplicants"] == 5
+        seen += [app["userId"] for app in details["jobApplication"]]
+        cursor = details["applicantsNextCursor"]
+        if cursor is None:
+            break
+
+    assert seen == [5, 4, 3, 2, 1]
+
+
+def test_missing_job_has_no_details(job):
+    assert JobListingMapper.getJobDetails(99) is None
@@ -0,0 +1,81 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from flask import Flask
+
+from Security.JWTUtils import ClaimsCache, JWTUtils
+
+pytestmark = pytest.mark.usefixtures("jwt_secret")
+
+
+def _token(**kwargs):
+    return JWTUtils.generate_jwt_token(
+        account_id=7, user_role="User", name="Ann", user_id=3, **kwargs
+    )
+
+
+def test_decode_is_cached_after_first_verify():
+    token = _token()
+
+    first = JWTUtils.decode_jwt_token(token)
+    second = JWTUtils.decode_jwt_token(token)
+
+    assert first == second
+    assert second["sub"] == 7 and second["userId"] == 3
+    stats = JWTUtils.cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_cached_claims_are_copies():
+    token = _token()
+    JWTUtils.decode_jwt_token(token)["role"] = "Admin"
+
+    assert JWTUtils.decode_jwt_token(token)["role"] == "User"
+
+
+def test_invalid_token_is_not_cached():
+    token = _token() + "x"
+
+    for _ in range(2):
+        with pytest.raises(jwt.PyJWTError):
+            JWTUtils.decode_jwt_token(token)
+    assert JWTUtils.cache_stats()["size"] == 0
+
+
+def test_entry_expires_with_token_lifetime():
+    orig = datetime.now(timezone.utc) - JWTUtils.EXPIRATION + timedelta(seconds=1)
+    token = _token(orig_iat=orig)
+    JWTUtils.decode_jwt_token(token)
+
+    time.sleep(1.1)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        JWTUtils.decode_jwt_token(token)
+    assert JWTUtils.cache_stats()["expired"] == 1
+
+
+def test_lru_evicts_oldest_entry():
+    cache = ClaimsCache(2)
+    far = time.time() + 60
+    for key in (b"a", b"b", b"c"):
+        cache.put(key, {"k": key}, far)
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"c") == {"k": b"c"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_request_claims_decoded_once_per_request():
+    app = Flask(__name__)
+    token = _token()
+
+    with app.test_request_context(headers={"Cookie": f"session_token={token}"}):
+        assert JWTUtils.get_request_claims()["sub"] == 7
+        assert JWTUtils.get_request_claims()["sub"] == 7
+    assert JWTUtils.cache_stats()["misses"] == 1
+    assert JWTUtils.cache_stats()["hits"] == 0
+
+    with Flask(__name__).test_request_context():
+        assert JWTUtils.get_request_claims() is None
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, func, select
+
+from Boundary.Mapper.PostMapper import FEED_CACHE, POST_CACHE, PostMapper
+from SQLModels.AccountModel import AccountModel, Role
+from SQLModels.PostLikesModel import PostLikesModel
+from SQLModels.PostModel import PostModel
+from Utils.CacheUtils import get_version
+
+
+@pytest.fixture
+def post(app_db, fake_redis):
+    """Post 1 by account 1; accounts 1 and 2 may like it."""
+    with app_db.session_scope() as session:
+        for accountId in (1, 2):
+            session.add(
+                AccountModel(
+                    accountId=accountId,
+                    name=f"user{accountId}",
+                    email=f"user{accountId}@example.com",
+                    passwordHash="x",
+                    role=Role.User,
+                )
+            )
+        session.flush()
+        session.add(
+            PostModel(
+                postId=1, title="t", content="c", date=datetime(2025, 1, 1), accountId=1
+            )
+        )
+    return 1
+
+
+def _likeRows(app_db, postId):
+    with app_db.session_scope(readonly=True) as session:
+        return session.execute(
+            select(func.count()).where(PostLikesModel.postId == postId)
+        ).scalar()
+
+
+def _statements(app_db):
+    seen = []
+
+    def record(conn, cursor, statement, *args):
+        seen.append(statement.split()[0])
+
+    event.listen(app_db.engine, "before_cursor_execute", record)
+    return seen
+
+
+def test_toggle_adds_then_removes_like(app_db, post):
+    first = PostMapper.createDeletePostLikes(post, 2)
+    second = PostMapper.createDeletePostLikes(post, 2)
+
+    assert (first["liked"], first["likeCount"]) == (True, 1)
+    assert (second["liked"], second["likeCount"]) == (False, 0)
+    assert _likeRows(app_db, post) == 0
+
+
+def test_toggle_takes_at_most_three_statements(app_db, post):
+    seen = _statements(app_db)
+
+    PostMapper.createDeletePostLikes(post, 2)
+    assert [s for s in seen if s in ("SELECT", "UPDATE", "INSERT", "DELETE")] == [
+        "UPDATE",
+        "DELETE",
+        "INSERT",
+    ]
+    seen.clear()
+    PostMapper.createDeletePostLikes(post, 2)
+    assert [s for s in seen if s in ("SELECT", "UPDATE", "INSERT", "DELETE")] == [
+        "UPDATE",
+        "DELETE",
+    ]
+
+
+def test_toggle_on_missing_post_writes_nothing(app_db, post):
+    assert PostMapper.createDeletePostLikes(99, 2) is None
+    assert _likeRows(app_db, 99) == 0
+
+
+def test_batch_sets_state_in_request_order(app_db, post):
+    results = PostMapper.applyPostLikes(
+        2,
+        [
+            {"postId": post, "liked": True},
+            {"postId": 99, "liked": True},
+            {"postId": post, "liked": True},
+        ],
+    )
+
+    assert results[0]["changed"] is True
+    assert results[0]["likeCount"] == 1
+    assert results[1]["error"] == "Post not found"
+    assert results[2]["changed"] is False
+    assert _likeRows(app_db, post) == 1
+
+
+def test_likes_invalidate_the_post_but_not_the_feed(app_db, post):
+    feed = get_version(FEED_CACHE)
+    view = get_version(f"{POST_CACHE}:{post}")
+
+    PostMapper.createDeletePostLikes(post, 2)
+    PostMapper.applyPostLikes(2, [{"postId": post, "liked": False}])
+
+    assert get_version(FEED_CACHE) == feed
+    assert get_version(f"{POST_CACHE}:{post}") == view + 2
@@ -0,0 +1,73 @@
+import pytest
+from flask import Flask, g
+
+from Security import Principal, SessionCache
+from Security.JWTUtils import JWTUtils
+from SQLModels.AccountModel import Role
+
+SESSIONS = {7: {"accountId": 7, "sessionId": "jti-7", "isDisabled": False}}
+
+
+@pytest.fixture
+def client(monkeypatch, jwt_secret):
+    monkeypatch.setattr(
+        SessionCache, "get_session_state", lambda accountId, loader: loader(accountId)
+    )
+    app = Flask(__name__)
+    Principal.init_app(app, SESSIONS.get)
+
+    @app.route("/me")
+    @Principal.login_required
+    def me():
+        return {"accountId": g.principal.accountId}
+
+    @app.route("/admin")
+    @Principal.roles_required(Role.Admin)
+    def admin():
+        return {}
+
+    @app.route("/accounts/<int:account_id>")
+    @Principal.owner_required("account_id", allow=(Role.Admin,))
+    def account(account_id):
+        return {}
+
+    return app.test_client()
+
+
+def _login(client, role="User", jti="jti-7"):
+    token = JWTUtils.generate_jwt_token(
+        account_id=7, user_role=role, name="Ann", jti=jti
+    )
+    client.set_cookie("session_token", token)
+
+
+def test_login_required(client):
+    assert client.get("/me").status_code == 401
+
+    _login(client)
+    response = client.get("/me")
+    assert response.status_code == 200
+    assert response.get_json() == {"accountId": 7}
+
+
+def test_revoked_session_is_rejected(client):
+    _login(client, jti="stale")
+
+    assert client.get("/me").status_code == 401
+
+
+def test_roles_required(client):
+    _login(client)
+    assert client.get("/admin").status_code == 403
+
+    _login(client, role="Admin")
+    assert client.get("/admin").status_code == 200
+
+
+def test_owner_required(client):
+    _login(client)
+    assert client.get("/accounts/7").status_code == 200
+    assert client.get("/accounts/8").status_code == 403
+
+    _login(client, role="Admin")
+    assert client.get("/accounts/8").status_code == 200
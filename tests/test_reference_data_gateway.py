@@ -0,0 +1,173 @@
+from datetime import datetime
+
+import pytest
+import redis
+
+from Boundary.TableDataGateway.LabelGateway import LABEL_USAGE_TTL, LabelGateway
+from Boundary.TableDataGateway.ReferenceDataGateway import (
+    REFERENCE_CACHE_TTL,
+    ReferenceDataGateway,
+)
+from Security import Limiter
+from SQLModels.AccountModel import AccountModel, Role
+from SQLModels.LabelModel import ColorEnum, LabelModel
+from SQLModels.PostLabelModel import PostLabelModel
+from SQLModels.PostModel import PostModel
+from Utils.CacheUtils import get_version, versioned_key
+
+
+def test_complete_gateway_is_accepted():
+    class Colours(ReferenceDataGateway):
+        namespace = "ref:colour"
+        idKey = "colourId"
+
+        @classmethod
+        def _loadRows(cls, session, ids=None):
+            return []
+
+    assert Colours.namespace == "ref:colour"
+
+
+def test_gateway_without_loader_fails_at_definition():
+    with pytest.raises(TypeError, match="_loadRows"):
+
+        class Colours(ReferenceDataGateway):
+            namespace = "ref:colour"
+            idKey = "colourId"
+
+
+def test_gateway_without_namespace_or_id_key_fails_at_definition():
+    with pytest.raises(TypeError, match="namespace, idKey"):
+
+        class Colours(ReferenceDataGateway):
+            @classmethod
+            def _loadRows(cls, session, ids=None):
+                return []
+
+
+class CountingLabels(ReferenceDataGateway):
+    """Labels under a test namespace, recording each database load."""
+
+    namespace = "test:label"
+    idKey = "labelId"
+    loads: list = []
+
+    @classmethod
+    def _loadRows(cls, session, ids=None):
+        cls.loads.append(None if ids is None else sorted(ids))
+        query = session.query(LabelModel).order_by(LabelModel.labelId)
+        if ids is not None:
+            query = query.filter(LabelModel.labelId.in_(ids))
+        return [
+            {"labelId": lm.labelId, "description": lm.description}
+            for lm in query.all()
+        ]
+
+
+@pytest.fixture
+def labels(app_db, fake_redis):
+    with app_db.session_scope() as session:
+        session.add_all(
+            [
+                LabelModel(labelId=i, description=f"label{i}", color=ColorEnum.RED)
+                for i in (1, 2, 3)
+            ]
+        )
+    CountingLabels.loads = []
+    return CountingLabels
+
+
+def test_all_rows_miss_then_hit(labels, fake_redis):
+    first = labels.allRows()
+    second = labels.allRows()
+
+    assert [row["labelId"] for row in first] == [1, 2, 3]
+    assert second == first
+    assert labels.loads == [None]
+    key = versioned_key(labels.namespace, "all")
+    assert 0 < fake_redis.ttl(key) <= REFERENCE_CACHE_TTL
+
+
+def test_row_by_id_miss_then_hit(labels):
+    assert labels.rowById(2) == {"labelId": 2, "description": "label2"}
+    assert labels.rowById(2) == {"labelId": 2, "description": "label2"}
+    assert labels.rowById(9) is None
+
+    assert labels.loads == [[2], [9]]
+
+
+def test_invalidate_bumps_version(labels, app_db):
+    labels.allRows()
+    labels.rowById(1)
+    with app_db.session_scope() as session:
+        session.get(LabelModel, 1).description = "renamed"
+
+    assert labels.rowById(1)["description"] == "label1"
+    labels.invalidate()
+
+    assert labels.rowById(1)["description"] == "renamed"
+    assert labels.allRows()[0]["description"] == "renamed"
+    assert labels.loads == [None, [1], [1], None]
+
+
+def test_label_usage_is_cached_apart_from_rows(labels, app_db, fake_redis):
+    with app_db.session_scope() as session:
+        session.add(
+            AccountModel(
+                accountId=1,
+                name="ann",
+                email="ann@example.com",
+                passwordHash="x",
+                role=Role.User,
+            )
+        )
+        session.flush()
+        session.add(
+            PostModel(
+                postId=1, title="t", content="c", date=datetime(2025, 1, 1), accountId=1
+            )
+        )
+        session.flush()
+        session.add(PostLabelModel(postId=1, labelId=2))
+    version = get_version(LabelGateway.namespace)
+
+    uses = {label.labelId: label.numberofUses for label in LabelGateway.getAllLabels()}
+
+    assert uses == {1: 0, 2: 1, 3: 0}
+    assert all("numberofUses" not in row for row in LabelGateway.allRows())
+    assert LabelGateway.getLabelbyId(2).numberofUses == 1
+    assert 0 < fake_redis.ttl("ref:label:usage") <= LABEL_USAGE_TTL
+    assert get_version(LabelGateway.namespace) == version
+
+
+def test_rows_by_ids_keeps_order_and_skips_unknown_and_duplicates(labels):
+    rows = labels.rowsByIds([3, "1", 9, 3, "x", 1])
+
+    assert [row["labelId"] for row in rows] == [3, 1]
+    assert labels.loads == [[1, 3, 9]]
+
+
+def test_rows_by_ids_loads_only_misses_in_one_query(labels, fake_redis):
+    labels.rowById(2)
+    labels.loads.clear()
+
+    rows = labels.rowsByIds([1, 2, 3])
+
+    assert [row["labelId"] for row in rows] == [1, 2, 3]
+    assert labels.loads == [[1, 3]]
+    # the misses were written back under rowById's keys
+    for labelId in (1, 3):
+        key = versioned_key(labels.namespace, "id", labelId)
+        assert 0 < fake_redis.ttl(key) <= REFERENCE_CACHE_TTL
+    labels.loads.clear()
+    assert labels.rowsByIds([3, 2, 1]) == rows[::-1]
+    assert labels.loads == []
+
+
+def test_rows_by_ids_without_redis_reads_the_database(labels, monkeypatch):
+    monkeypatch.setattr(
+        Limiter, "_redis", redis.Redis(port=1, socket_connect_timeout=0.1)
+    )
+
+    assert [row["labelId"] for row in labels.rowsByIds([2, 1])] == [2, 1]
+    assert labels.loads == [[1, 2]]
@@ -0,0 +1,49 @@
+from sqlalchemy import insert
+
+from SQLModels.base import DatabaseContext
+
+
+def test_readonly_sessions_use_replica(seeded_ctx, read_source):
+    seeded_ctx.begin_request()
+
+    assert read_source(seeded_ctx) == "primary"
+    assert read_source(seeded_ctx, readonly=True) == "replica"
+
+
+def test_write_pins_reads_to_primary(seeded_ctx, read_source, items_table):
+    seeded_ctx.begin_request()
+
+    with seeded_ctx.session_scope() as session:
+        session.execute(insert(items_table).values(source="write"))
+
+    assert seeded_ctx.wrote_in_request()
+    assert read_source(seeded_ctx, readonly=True) == "primary"
+
+    seeded_ctx.begin_request()
+    assert not seeded_ctx.wrote_in_request()
+    assert read_source(seeded_ctx, readonly=True) == "replica"
+
+
+def test_pinned_request_and_primary_reads(seeded_ctx, read_source):
+    seeded_ctx.begin_request(pin_to_primary=True)
+    assert read_source(seeded_ctx, readonly=True) == "primary"
+
+    seeded_ctx.begin_request()
+    with seeded_ctx.primary_reads():
+        assert read_source(seeded_ctx, readonly=True) == "primary"
+    assert read_source(seeded_ctx, readonly=True) == "replica"
+
+
+def test_no_replicas_reads_primary(tmp_path, monkeypatch, read_source, items_table):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'only.db'}")
+    monkeypatch.delenv("DATABASE_REPLICA_URLS", raising=False)
+    context = DatabaseContext()
+    try:
+        items_table.metadata.create_all(context.get_engine())
+        with context.engine.begin() as conn:
+            conn.execute(insert(items_table).values(source="primary"))
+
+        assert not context.has_replicas
+        assert read_source(context, readonly=True) == "primary"
+    finally:
+        context.dispose()
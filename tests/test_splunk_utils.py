@@ -0,0 +1,144 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from Backend.Security.SplunkUtils import HECShipper, SplunkLogger
+
+
+def parse_hec_body(body: str) -> list[dict]:
+    decoder = json.JSONDecoder()
+    events, idx = [], 0
+    while idx < len(body):
+        event, idx = decoder.raw_decode(body, idx)
+        events.append(event)
+    return events
+
+
+@pytest.fixture
+def hec_server():
+    """Local stub HEC endpoint that records every request body."""
+    received = []
+    gate = threading.Event()
+    gate.set()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            gate.wait(5)
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length).decode()
+            received.append(
+                {"auth": self.headers.get("Authorization"), "body": body}
+            )
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b'{"text":"Success","code":0}')
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/services/collector/event"
+    yield url, received, gate
+    gate.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_events_are_batched_into_one_request(hec_server):
+    url, received, _ = hec_server
+    shipper = HECShipper(url, "tok", batch_size=10, flush_interval=30)
+
+    for i in range(10):
+        assert shipper.enqueue({"event": {"n": i}})
+
+    assert shipper.flush(timeout=5)
+    assert len(received) == 1
+    assert received[0]["auth"] == "Splunk tok"
+    events = parse_hec_body(received[0]["body"])
+    assert [e["event"]["n"] for e in events] == list(range(10))
+
+    stats = shipper.stats()
+    assert stats["queued"] == 10
+    assert stats["sent"] == 10
+    assert stats["dropped"] == 0
+    shipper.close()
+
+
+def test_partial_batch_is_flushed_on_interval(hec_server):
+    url, received, _ = hec_server
+    shipper = HECShipper(url, "tok", batch_size=100, flush_interval=0.05)
+
+    shipper.enqueue({"event": "a"})
+    shipper.enqueue({"event": "b"})
+
+    for _ in range(100):
+        if shipper.stats()["sent"] == 2:
+            break
+        threading.Event().wait(0.02)
+
+    assert shipper.stats()["sent"] == 2
+    assert len(parse_hec_body(received[0]["body"])) == 2
+    shipper.close()
+
+
+def test_full_queue_drops_events(hec_server):
+    url, _, gate = hec_server
+    gate.clear()  # stall the stub so the worker blocks on its first POST
+    shipper = HECShipper(url, "tok", queue_size=2, batch_size=1, flush_interval=30)
+
+    results = [shipper.enqueue({"event": i}) for i in range(10)]
+
+    assert results.count(False) > 0
+    assert shipper.stats()["dropped"] == results.count(False)
+    gate.set()
+    shipper.close()
+
+
+def test_full_queue_spills_to_disk(hec_server, tmp_path):
+    url, _, gate = hec_server
+    gate.clear()
+    spill = tmp_path / "splunk_spill.jsonl"
+    shipper = HECShipper(
+        url,
+        "tok",
+        queue_size=2,
+        batch_size=1,
+        flush_interval=30,
+        overflow="spill",
+        spill_path=str(spill),
+    )
+
+    results = [shipper.enqueue({"event": i}) for i in range(10)]
+
+    spilled = results.count(False)
+    assert spilled > 0
+    assert shipper.stats()["spilled"] == spilled
+    assert len(spill.read_text().splitlines()) == spilled
+    gate.set()
+    shipper.close()
+
+
+def test_unreachable_endpoint_counts_failures():
+    shipper = HECShipper("http://127.0.0.1:9/", "tok", batch_size=2, timeout=0.5)
+
+    shipper.enqueue({"event": "lost"})
+    shipper.enqueue({"event": "also lost"})
+    shipper.flush(timeout=5)
+
+    stats = shipper.stats()
+    # one failed request; its two events are counted once, as dropped
+    assert stats["failed"] == 1
+    assert stats["dropped"] == 2
+    assert stats["sent"] == 0
+    shipper.close()
+
+
+def test_send_log_without_url_does_not_raise(monkeypatch):
+    monkeypatch.delenv("SPLUNK_HEC_URL", raising=False)
+    logger = SplunkLogger()
+    logger.send_log({"event": "ignored"})  # Should not raise
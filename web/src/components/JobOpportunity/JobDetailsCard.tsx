@@ -17,7 +17,10 @@ import {
 import ResumeUploadModal from "./ResumeUploadModal";
 import { useState } from "react";
 import ApplicantCard from "./ApplicantCard";
-import type { JobApplication } from "../../type/JobApplicationSchema";
+import {
+  JobApplicationSchema,
+  type JobApplication,
+} from "../../type/JobApplicationSchema";
 import { Role, useAuth } from "@/contexts/AuthContext";
 import { useDeleteJob } from "@/utility/handleDeleteJob";
 import DeleteJobModal from "./DeleteJobModal";
@@ -25,6 +28,8 @@ import { useApplicantActions } from "@/utility/handleApplication";
 import { handleBookmarkToggle } from "@/utility/handleBookmark";
 import { ViolationOption } from "@/utility/fetchViolationOptions";
 import { useApplyJob } from "@/utility/handleApplyJob";
+import axios from "@/utility/axiosConfig";
+import { z } from "zod";
 interface Props {
   job: FrontendJobListing;
   userType?: string; // Optional, if needed for user-specific logic
@@ -80,9 +85,31 @@ const JobDetailsCard: React.FC<Props> = ({
   const [localApplicants, setLocalApplicants] = useState<JobApplication[]>([]);
   const { acceptLoadingId, rejectLoadingId, handleAccept, handleReject } =
     useApplicantActions(setLocalApplicants);
+  // /jobDetails returns applicants a page at a time
+  const [applicantCursor, setApplicantCursor] = useState<string | null>(null);
+  const [moreApplicantsLoading, setMoreApplicantsLoading] = useState(false);
   useEffect(() => {
     setLocalApplicants(job.jobApplication ?? []);
-  }, [job.jobApplication]);
+    setApplicantCursor(job.applicantsNextCursor ?? null);
+  }, [job.jobApplication, job.applicantsNextCursor]);
+  const loadMoreApplicants = async () => {
+    if (!applicantCursor) return;
+    setMoreApplicantsLoading(true);
+    try {
+      const res = await axios.get(`/api/jobDetails/${job.jobId}`, {
+        params: { applicantCursor },
+      });
+      const page = z
+        .array(JobApplicationSchema)
+        .parse(res.data.jobApplication ?? []);
+      setLocalApplicants((prev) => [...prev, ...page]);
+      setApplicantCursor(res.data.applicantsNextCursor ?? null);
+    } catch (err) {
+      console.error("Failed to load more applicants", err);
+    } finally {
+      setMoreApplicantsLoading(false);
+    }
+  };
   const applicants = (localApplicants ?? []).map((app) => ({
     ...app,
     jobTitle: job.title,
@@ -326,6 +353,15 @@ const JobDetailsCard: React.FC<Props> = ({
                 />
               ))}
             </ul>
+            {applicantCursor && (
+              <button
+                onClick={loadMoreApplicants}
+                disabled={moreApplicantsLoading}
+                className="mt-4 w-full bg-zinc-800 border border-zinc-700 text-gray-100 rounded px-3 py-2 text-sm hover:bg-zinc-700 disabled:opacity-50"
+              >
+                {moreApplicantsLoading ? "Loading…" : "Load more applicants"}
+              </button>
+            )}
           </section>
         )}
       </div>
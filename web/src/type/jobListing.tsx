@@ -27,6 +27,8 @@ export const JobListingSchema = z.object({
   company: z.any().optional(), // You can replace this with a stricter schema if needed
   jobApplication: z.array(JobApplicationSchema).optional(),
   numApplicants: z.number().optional(), // Number of applicants for the job
+  // cursor for the next page of jobApplication (null on the last page)
+  applicantsNextCursor: z.string().nullable().optional(),
 });
 export const FrontendJobListingSchema = JobListingSchema.extend({
   isBookmarked: z.boolean().default(false),